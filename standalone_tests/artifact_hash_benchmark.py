@@ -0,0 +1,113 @@
+"""artifact directory hashing benchmark.
+
+Hashes directories of files with different size distributions, serially as
+add_dir used to, with FileHasher on threads only, with its process pool, and
+again from the digest cache. Reports the time and the throughput of each.
+
+Usage:
+    python artifact_hash_benchmark.py --files 20000 --processes 8
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+
+from wandb import wandb_sdk
+
+artifacts = wandb_sdk.interface.artifacts
+
+# name: (fraction of files, min size, max size)
+DISTRIBUTIONS = {
+    "tiny": [(1.0, 100, 4000)],
+    "small": [(1.0, 10000, 200000)],
+    "mixed": [(0.9, 1000, 100000), (0.1, 1000000, 8000000)],
+    "large": [(1.0, 16000000, 64000000)],
+}
+
+
+def make_files(dirname, distribution, count, max_bytes):
+    rand = random.Random(0)
+    paths = []
+    total = 0
+    for fraction, min_size, max_size in distribution:
+        for i in range(int(count * fraction)):
+            size = rand.randint(min_size, max_size)
+            if total + size > max_bytes:
+                break
+            path = os.path.join(dirname, str(len(paths) % 100), "%d.bin" % len(paths))
+            if not os.path.isdir(os.path.dirname(path)):
+                os.makedirs(os.path.dirname(path))
+            with open(path, "wb") as f:
+                f.write(os.urandom(size))
+            paths.append(path)
+            total += size
+    # files written just now are not cached, as they could still change
+    mtime = time.time() - 60
+    for path in paths:
+        os.utime(path, (mtime, mtime))
+    return total
+
+
+def timed(fn):
+    start = time.time()
+    fn()
+    return time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="artifact hash benchmark")
+    parser.add_argument("--files", type=int, default=20000)
+    parser.add_argument("--max-gb", type=float, default=2)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--processes", type=int, default=os.cpu_count())
+    parser.add_argument(
+        "--distributions", nargs="+", default=sorted(DISTRIBUTIONS.keys())
+    )
+    args = parser.parse_args()
+
+    for name in args.distributions:
+        dirname = tempfile.mkdtemp()
+        try:
+            total = make_files(
+                os.path.join(dirname, "data"),
+                DISTRIBUTIONS[name],
+                args.files,
+                args.max_gb * 1e9,
+            )
+            paths = list(artifacts.walk_files(os.path.join(dirname, "data")))
+            cache = artifacts.ArtifactsCache(os.path.join(dirname, "cache"))
+            threads = artifacts.FileHasher(threads=args.threads, processes=0)
+            processes = artifacts.FileHasher(
+                cache, threads=args.threads, processes=args.processes
+            )
+            runs = [
+                ("serial", lambda: [artifacts.md5_file_b64(p) for p in paths]),
+                ("threads", lambda: threads.md5_files_b64(paths)),
+                ("processes", lambda: processes.md5_files_b64(paths)),
+                ("cached", lambda: processes.md5_files_b64(paths)),
+            ]
+            for engine, fn in runs:
+                seconds = timed(fn)
+                print(
+                    json.dumps(
+                        dict(
+                            distribution=name,
+                            engine=engine,
+                            files=len(paths),
+                            mb=round(total / 1e6),
+                            seconds=round(seconds, 2),
+                            files_per_sec=round(len(paths) / seconds),
+                            mb_per_sec=round(total / 1e6 / seconds),
+                        )
+                    )
+                )
+        finally:
+            shutil.rmtree(dirname)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""artifact manifest loading benchmark.
+
+Writes a manifest with the given numbers of entries, then loads it in a fresh
+process each, with json.load and an ArtifactManifestEntry per entry as
+_load_manifest used to, and streamed into the columnar manifest entries.
+Reports the load time, the time to look up and iterate over the entries, and
+the peak memory of each.
+
+Usage:
+    python artifact_manifest_benchmark.py --entries 1000000 10000000
+"""
+
+import argparse
+import base64
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+ENGINES = ("dict", "stream")
+
+
+def write_manifest(path, count):
+    rand = random.Random(0)
+    with open(path, "w") as f:
+        f.write(
+            '{"version": 1, "storagePolicy": "wandb-storage-policy-v1", '
+            '"storagePolicyConfig": {"storageLayout": "V2"}, "contents": {'
+        )
+        for i in range(count):
+            entry = {
+                "digest": base64.b64encode(
+                    rand.getrandbits(128).to_bytes(16, "big")
+                ).decode("ascii"),
+                "birthArtifactID": "QXJ0aWZhY3Q6MTIzNDU2Nzg=",
+                "size": rand.randint(1000, 100000000),
+            }
+            f.write(
+                '%s"images/%05d/%08d.png": %s'
+                % ("," if i else "", i // 1000, i, json.dumps(entry))
+            )
+        f.write("}}")
+
+
+def load(engine, path):
+    from wandb import wandb_sdk
+
+    artifacts = wandb_sdk.interface.artifacts
+    wandb_artifacts = wandb_sdk.wandb_artifacts
+
+    if engine == "dict":
+        with open(path) as f:
+            manifest_json = json.load(f)
+        entries = {
+            name: wandb_artifacts.ArtifactManifestEntry(
+                path=name,
+                digest=val["digest"],
+                birth_artifact_id=val.get("birthArtifactID"),
+                ref=val.get("ref"),
+                size=val.get("size"),
+                extra=val.get("extra"),
+                local_path=val.get("local_path"),
+            )
+            for name, val in manifest_json["contents"].items()
+        }
+        del manifest_json
+        return entries
+
+    def chunks():
+        with open(path, "rb") as f:
+            while True:
+                chunk = f.read(1024 * 1024)
+                if not chunk:
+                    return
+                yield chunk
+
+    return artifacts.ArtifactManifest.from_manifest_stream(None, chunks()).entries
+
+
+def run_engine(engine, path, count):
+    start = time.time()
+    entries = load(engine, path)
+    load_seconds = time.time() - start
+
+    rand = random.Random(1)
+    start = time.time()
+    for _ in range(100000):
+        i = rand.randrange(count)
+        entries["images/%05d/%08d.png" % (i // 1000, i)].digest
+    lookup_seconds = time.time() - start
+
+    start = time.time()
+    size = sum(entry.size for entry in entries.values())
+    iterate_seconds = time.time() - start
+    assert size > 0
+
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(
+        json.dumps(
+            dict(
+                engine=engine,
+                entries=count,
+                load_seconds=round(load_seconds, 2),
+                lookup_100k_seconds=round(lookup_seconds, 2),
+                iterate_seconds=round(iterate_seconds, 2),
+                peak_mb=round(peak_kb / 1024),
+                bytes_per_entry=round(peak_kb * 1024 / count),
+            )
+        )
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="artifact manifest benchmark")
+    parser.add_argument("--entries", type=int, nargs="+", default=[1000000])
+    parser.add_argument("--engines", nargs="+", default=list(ENGINES))
+    parser.add_argument("--manifest", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.manifest:
+        run_engine(args.engines[0], args.manifest, args.entries[0])
+        return
+
+    for count in args.entries:
+        fd, path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        try:
+            write_manifest(path, count)
+            for engine in args.engines:
+                subprocess.check_call(
+                    [
+                        sys.executable,
+                        __file__,
+                        "--manifest",
+                        path,
+                        "--entries",
+                        str(count),
+                        "--engines",
+                        engine,
+                    ]
+                )
+        finally:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
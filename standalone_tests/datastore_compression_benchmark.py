@@ -0,0 +1,104 @@
+"""transaction log compression benchmark.
+
+Writes a transaction log of history and console output records with each
+record compression (none, zlib and zstd when zstandard is installed) and
+reports the log size, the write rate and the rate of scanning it back with
+DataScanner the way `wandb sync` does.
+
+Usage:
+    python datastore_compression_benchmark.py --records 50000 --keys 10 100
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+
+import wandb
+from wandb.proto import wandb_internal_pb2 as pb
+from wandb.sdk.internal import datastore
+
+
+def make_records(num_records, num_keys):
+    rand = random.Random(0)
+    records = []
+    for i in range(num_records):
+        record = pb.Record()
+        record.num = i + 1
+        if i % 4:
+            row = {"metric_%d" % k: rand.random() for k in range(num_keys)}
+            row["_step"] = i
+            record.history.row_json = json.dumps(row)
+        else:
+            record.output.line = "epoch %d step %d loss %f accuracy %f" % (
+                i // 1000,
+                i,
+                rand.random(),
+                rand.random(),
+            )
+        records.append(record)
+    return records
+
+
+def run(fname, compression, records):
+    ds = datastore.DataStore(durability="none", compression=compression)
+    ds.open_for_write(fname)
+    start = time.time()
+    for record in records:
+        ds.write(record)
+    ds.close()
+    write_elapsed = time.time() - start
+
+    start = time.time()
+    scanner = datastore.DataScanner(fname)
+    count = 0
+    for data in scanner:
+        record = pb.Record()
+        record.ParseFromString(data)
+        count += 1
+    scanner.close()
+    scan_elapsed = time.time() - start
+    assert count == len(records)
+
+    size_mb = os.stat(fname).st_size / 1e6
+    os.unlink(fname)
+    return dict(
+        size_mb=round(size_mb, 2),
+        write_records_per_sec=round(len(records) / write_elapsed),
+        scan_records_per_sec=round(len(records) / scan_elapsed),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="datastore compression benchmark")
+    parser.add_argument("--records", type=int, default=50000)
+    parser.add_argument("--keys", type=int, nargs="+", default=[10, 100])
+    args = parser.parse_args()
+
+    compressions = ["none", "zlib"]
+    if datastore.zstandard is not None:
+        compressions.append("zstd")
+
+    wandb._set_internal_process()
+    dirname = tempfile.mkdtemp()
+    try:
+        for num_keys in args.keys:
+            records = make_records(args.records, num_keys)
+            base_size = None
+            for compression in compressions:
+                fname = os.path.join(dirname, "bench-%s.wandb" % compression)
+                result = run(fname, compression, records)
+                base_size = base_size or result["size_mb"]
+                result["ratio"] = round(base_size / result["size_mb"], 2)
+                print(
+                    json.dumps(dict(keys=num_keys, compression=compression, **result))
+                )
+    finally:
+        shutil.rmtree(dirname)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""transaction log durability benchmark.
+
+Writes history records to a transaction log (DataStore) with each durability
+policy and reports records/sec and the number of fsyncs:
+- none: only synced when the log is closed
+- interval: records written within --seconds are committed together
+- bytes: records are committed together every --bytes written
+- record: every record is committed on its own
+
+Point --dir at a network filesystem to see the cost of each fsync there.
+
+Usage:
+    python datastore_durability_benchmark.py --records 2000 --sizes 100 100000
+"""
+
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import wandb
+from wandb.proto import wandb_internal_pb2 as pb
+from wandb.sdk.internal import datastore
+
+
+POLICIES = ("none", "interval", "bytes", "record")
+
+
+def run(dirname, durability, num_records, size, seconds, nbytes):
+    fname = os.path.join(dirname, "bench-%s-%d.wandb" % (durability, size))
+    record = pb.Record()
+    record.history.row_json = json.dumps({"data": "x" * size})
+
+    fsync = os.fsync
+    syncs = [0]
+
+    def counting_fsync(fd):
+        syncs[0] += 1
+        fsync(fd)
+
+    os.fsync = counting_fsync
+    try:
+        ds = datastore.DataStore(
+            durability=durability, durability_seconds=seconds, durability_bytes=nbytes
+        )
+        ds.open_for_write(fname)
+        start = time.time()
+        for _ in range(num_records):
+            ds.write(record)
+        ds.close()
+        elapsed = time.time() - start
+    finally:
+        os.fsync = fsync
+    os.unlink(fname)
+    return dict(records_per_sec=round(num_records / elapsed), fsyncs=syncs[0])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="datastore durability benchmark")
+    parser.add_argument("--records", type=int, default=2000)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 100000])
+    parser.add_argument("--seconds", type=float, default=datastore.DURABILITY_SECONDS)
+    parser.add_argument("--bytes", type=int, default=datastore.DURABILITY_BYTES_DEFAULT)
+    parser.add_argument("--dir", default=None)
+    args = parser.parse_args()
+
+    wandb._set_internal_process()
+    dirname = tempfile.mkdtemp(dir=args.dir)
+    try:
+        for size in args.sizes:
+            for durability in POLICIES:
+                result = run(
+                    dirname, durability, args.records, size, args.seconds, args.bytes
+                )
+                print(json.dumps(dict(size=size, durability=durability, **result)))
+    finally:
+        shutil.rmtree(dirname)
+
+
+if __name__ == "__main__":
+    main()
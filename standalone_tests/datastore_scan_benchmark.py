@@ -0,0 +1,109 @@
+"""transaction log scan benchmark.
+
+Writes a transaction log of history and output records, then times reading it
+back and parsing the records the way `wandb sync` does (--no-parse times
+only reading the record data):
+- datastore: DataStore.open_for_scan and scan_data (file reads and copies)
+- scanner: DataScanner (memory map views)
+- scanner_history: DataScanner returning only history records
+- scanner_noverify: DataScanner without crc checks
+
+Usage:
+    python datastore_scan_benchmark.py --records 100000 --keys 10 100 --no-parse
+"""
+
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import wandb
+from wandb.proto import wandb_internal_pb2 as pb
+from wandb.sdk.internal import datastore
+
+
+def write_log(fname, num_records, num_keys):
+    ds = datastore.DataStore(durability="none")
+    ds.open_for_write(fname)
+    for i in range(num_records):
+        record = pb.Record()
+        record.num = i + 1
+        if i % 4:
+            row = {"metric_%d" % k: i * 0.1 + k for k in range(num_keys)}
+            record.history.row_json = json.dumps(row)
+        else:
+            record.output.line = "output line %d" % i
+        ds.write(record)
+    ds.close()
+
+
+def scan_datastore(fname):
+    ds = datastore.DataStore()
+    ds.open_for_scan(fname)
+    while True:
+        data = ds.scan_data()
+        if data is None:
+            break
+        yield data
+    ds.close()
+
+
+def scan_scanner(fname, **kwargs):
+    scanner = datastore.DataScanner(fname, **kwargs)
+    for data in scanner:
+        yield data
+    scanner.close()
+
+
+def run(scan, parse):
+    start = time.time()
+    count = 0
+    for data in scan():
+        if parse:
+            record = pb.Record()
+            record.ParseFromString(data)
+        count += 1
+    return count, time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="datastore scan benchmark")
+    parser.add_argument("--records", type=int, default=100000)
+    parser.add_argument("--keys", type=int, nargs="+", default=[10, 100])
+    parser.add_argument("--no-parse", action="store_true")
+    args = parser.parse_args()
+
+    wandb._set_internal_process()
+    dirname = tempfile.mkdtemp()
+    try:
+        for num_keys in args.keys:
+            fname = os.path.join(dirname, "bench-%d.wandb" % num_keys)
+            write_log(fname, args.records, num_keys)
+            size_mb = os.stat(fname).st_size / 1e6
+            scans = (
+                ("datastore", lambda: scan_datastore(fname)),
+                ("scanner", lambda: scan_scanner(fname)),
+                (
+                    "scanner_history",
+                    lambda: scan_scanner(fname, record_types=["history"]),
+                ),
+                ("scanner_noverify", lambda: scan_scanner(fname, verify=False)),
+            )
+            for name, scan in scans:
+                count, elapsed = run(scan, not args.no_parse)
+                result = dict(
+                    keys=num_keys,
+                    reader=name,
+                    records=count,
+                    mb_per_sec=round(size_mb / elapsed, 1),
+                )
+                print(json.dumps(result))
+            os.unlink(fname)
+    finally:
+        shutil.rmtree(dirname)
+
+
+if __name__ == "__main__":
+    main()
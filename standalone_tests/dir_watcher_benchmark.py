@@ -0,0 +1,95 @@
+"""run files directory watcher benchmark.
+
+Creates a tree of files like the media and checkpoints of a long run, then for
+each DirWatcher observer (inotify and polling) reports:
+- cpu_percent: cpu used by the watcher while the tree is idle for --seconds
+- latency_ms: median time from writing a file saved with the "now" policy
+  until it is handed to the file pusher
+
+Usage:
+    python dir_watcher_benchmark.py --files 1000 10000 --dirs 100
+"""
+
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from wandb.filesync import dir_watcher
+from wandb.sdk.internal.settings_static import SettingsStatic
+
+
+class Pusher(object):
+    def __init__(self):
+        self.changed = threading.Event()
+
+    def file_changed(self, save_name, path, copy=True):
+        if save_name.startswith("latency"):
+            self.changed.set()
+
+
+def make_tree(dirname, num_files, num_dirs):
+    for d in range(num_dirs):
+        os.makedirs(os.path.join(dirname, "media", "dir_%d" % d))
+    for i in range(num_files):
+        path = os.path.join(dirname, "media", "dir_%d" % (i % num_dirs), "%d.png" % i)
+        with open(path, "wb") as f:
+            f.write(b"\x00" * 100)
+
+
+def run(dirname, file_watcher, seconds, samples):
+    pusher = Pusher()
+    settings = SettingsStatic(
+        dict(files_dir=dirname, ignore_globs=(), _file_watcher=file_watcher)
+    )
+    watcher = dir_watcher.DirWatcher(settings, None, pusher)
+    name = type(watcher._file_observer).__name__
+    # let the polling observer take its first snapshot of the tree
+    time.sleep(2)
+
+    start_cpu, start = time.process_time(), time.time()
+    time.sleep(seconds)
+    cpu_percent = (time.process_time() - start_cpu) / (time.time() - start) * 100
+
+    watcher.update_policy("latency_*", "now")
+    latencies = []
+    for i in range(samples):
+        pusher.changed.clear()
+        start = time.time()
+        with open(os.path.join(dirname, "latency_%d" % i), "w") as f:
+            f.write("data")
+        if pusher.changed.wait(30):
+            latencies.append(time.time() - start)
+    watcher.finish()
+    latencies.sort()
+    return dict(
+        observer=name,
+        cpu_percent=round(cpu_percent, 1),
+        latency_ms=round(latencies[len(latencies) // 2] * 1000) if latencies else None,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="dir watcher benchmark")
+    parser.add_argument("--files", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--dirs", type=int, default=100)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--samples", type=int, default=5)
+    args = parser.parse_args()
+
+    for num_files in args.files:
+        for file_watcher in ("inotify", "polling"):
+            dirname = tempfile.mkdtemp()
+            try:
+                make_tree(dirname, num_files, args.dirs)
+                result = run(dirname, file_watcher, args.seconds, args.samples)
+                print(json.dumps(dict(files=num_files, **result)))
+            finally:
+                shutil.rmtree(dirname)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""history row encoding benchmark.
+
+Measures the time to encode one history row into a HistoryRecord in the user
+process (BackendSender._make_history) for rows of scalar keys:
+- generic: data_types.history_dict_to_json + util.json_dumps_safer_history
+- fast: the scalar row fast path used by publish_history
+
+Rows hold python floats, or a mix of python and numpy scalars (--numpy).
+
+Usage:
+    python history_encoding_benchmark.py --keys 10 100 1000 --numpy
+"""
+
+import argparse
+import json
+import timeit
+
+import numpy as np
+from wandb import data_types
+from wandb.proto import wandb_internal_pb2 as pb
+from wandb.sdk.interface import interface
+from wandb.util import json_dumps_safer_history
+
+
+def _make_row(num_keys, use_numpy):
+    scalar_types = [float, np.float32, np.int64, int] if use_numpy else [float]
+    row = {
+        "metric_%d" % k: scalar_types[k % len(scalar_types)](k * 0.5)
+        for k in range(num_keys)
+    }
+    row["_step"] = 1
+    return row
+
+
+def _generic(row):
+    history = pb.HistoryRecord()
+    data = data_types.history_dict_to_json(None, dict(row), step=1)
+    data.pop("_step", None)
+    history.row_json = json_dumps_safer_history(data)
+    return history
+
+
+def _fast(backend_sender, row):
+    history = pb.HistoryRecord()
+    backend_sender._make_history(history, dict(row), 1, None, True)
+    return history
+
+
+def main():
+    parser = argparse.ArgumentParser(description="history encoding benchmark")
+    parser.add_argument("--keys", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--numpy", action="store_true")
+    parser.add_argument("--number", type=int, default=0)
+    args = parser.parse_args()
+
+    backend_sender = interface.BackendSender()
+    for num_keys in args.keys:
+        row = _make_row(num_keys, args.numpy)
+        assert json.loads(_generic(row).row_json) == json.loads(
+            _fast(backend_sender, row).row_json
+        )
+        number = args.number or max(10, 100000 // num_keys)
+        result = dict(keys=num_keys, numpy=args.numpy)
+        for name, fn in (
+            ("generic", lambda: _generic(row)),
+            ("fast", lambda: _fast(backend_sender, row)),
+        ):
+            best = min(timeit.repeat(fn, number=number, repeat=5))
+            result[name + "_us_per_row"] = round(best / number * 1e6, 1)
+        result["speedup"] = round(
+            result["generic_us_per_row"] / result["fast_us_per_row"], 1
+        )
+        print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""history pipeline benchmark.
+
+Measures the per-row CPU time spent in each thread of the history pipeline:
+- user: encoding the row into a HistoryRecord (BackendSender.publish_history)
+- handler: HandleManager.handle_history (step, summary, sampled history)
+- sender: SendManager.send_history (producing the wandb-history.jsonl line)
+
+Rows are either encoded once as a single json line (row_json, the default) or
+per item as older clients did (--legacy), to compare both pipelines.
+
+Usage:
+    python history_pipeline_benchmark.py --rows 2000 --keys 10 100 1000
+"""
+
+import argparse
+import json
+import time
+
+from six.moves import queue
+from wandb.proto import wandb_internal_pb2 as pb
+from wandb.sdk.interface import interface
+from wandb.sdk.internal import handler, sender, settings_static
+from wandb.util import json_dumps_safer_history
+
+
+class _FakeFileStream(object):
+    def __init__(self):
+        self.lines = 0
+
+    def push(self, filename, data):
+        self.lines += 1
+
+
+def _legacy_publish_history(backend_sender, data, step):
+    history = pb.HistoryRecord()
+    history.step.num = step
+    for k, v in data.items():
+        item = history.item.add()
+        item.key = k
+        item.value_json = json_dumps_safer_history(v)
+    backend_sender._publish_history(history)
+
+
+def run(num_rows, num_keys, legacy):
+    record_q = queue.Queue()
+    sender_q = queue.Queue()
+    backend_sender = interface.BackendSender(record_q=record_q)
+    settings = settings_static.SettingsStatic(dict(_offline=False))
+    hm = handler.HandleManager(
+        settings=settings,
+        record_q=record_q,
+        result_q=queue.Queue(),
+        stopped=None,
+        sender_q=sender_q,
+        writer_q=None,
+        interface=backend_sender,
+    )
+    sm = sender.SendManager.setup("/tmp")
+    sm._fs = _FakeFileStream()
+
+    times = dict(user=0.0, handler=0.0, sender=0.0)
+    for step in range(num_rows):
+        row = {"metric_%d" % k: step * 0.1 + k for k in range(num_keys)}
+
+        start = time.thread_time()
+        if legacy:
+            _legacy_publish_history(backend_sender, row, step)
+        else:
+            backend_sender.publish_history(row, step)
+        times["user"] += time.thread_time() - start
+
+        start = time.thread_time()
+        while not record_q.empty():
+            hm.handle(record_q.get())
+        times["handler"] += time.thread_time() - start
+
+        start = time.thread_time()
+        while not sender_q.empty():
+            record = sender_q.get()
+            # summary debouncing is measured separately
+            if record.WhichOneof("record_type") == "history":
+                sm.send(record)
+        times["sender"] += time.thread_time() - start
+
+    assert sm._fs.lines == num_rows
+    return {k: v / num_rows * 1e6 for k, v in times.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="history pipeline benchmark")
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--keys", type=int, nargs="+", default=[10, 100, 1000])
+    args = parser.parse_args()
+
+    for num_keys in args.keys:
+        for legacy in (True, False):
+            per_row = run(args.rows, num_keys, legacy)
+            print(
+                json.dumps(
+                    dict(
+                        keys=num_keys,
+                        mode="items" if legacy else "row_json",
+                        **{k + "_us_per_row": round(v, 1) for k, v in per_row.items()}
+                    )
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""run file upload scheduling benchmark.
+
+Uploads a mix of many small files and some large ones through StepUpload
+against a fake api whose uploads take a fixed latency plus the file size over
+a per connection bandwidth. Reports the total time, the throughput and the
+time small files waited to be uploaded, in the order they were queued (fifo)
+and with large files on their dedicated workers (sized).
+
+Usage:
+    python step_upload_benchmark.py --small 2000 --large 32 --jobs 16 64
+"""
+
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from six.moves import queue
+from wandb.filesync import stats
+from wandb.filesync import step_upload
+
+
+class FakeApi(object):
+    def __init__(self, latency, bandwidth):
+        self.latency = latency
+        self.bandwidth = bandwidth
+
+    def get_project(self):
+        return "project"
+
+    def upload_urls(self, project, files):
+        result = {name: {"name": name, "url": "https://url/" + name} for name in files}
+        return "bucket", [], result
+
+    def upload_file_retry(self, url, f, callback, extra_headers=None):
+        size = os.fstat(f.fileno()).st_size
+        time.sleep(self.latency + size / self.bandwidth)
+        callback(size, size)
+
+
+class FileStream(object):
+    def __init__(self):
+        self.done = {}
+
+    def push_success(self, artifact_id, save_name):
+        self.done[save_name] = time.time()
+
+
+def make_files(dirname, prefix, count, size):
+    paths = []
+    for i in range(count):
+        path = os.path.join(dirname, "%s%d" % (prefix, i))
+        # sparse files, the fake api only looks at their size
+        with open(path, "wb") as f:
+            f.truncate(size)
+        paths.append(path)
+    return paths
+
+
+def run(api, paths, max_jobs, sized):
+    file_stats = stats.Stats()
+    file_stream = FileStream()
+    event_queue = queue.Queue()
+    step = step_upload.StepUpload(
+        api,
+        file_stats,
+        event_queue,
+        max_jobs,
+        file_stream,
+        silent=True,
+        max_large_jobs=None if sized else max_jobs,
+    )
+    if not sized:
+        step.LARGE_FILE_BYTES = float("inf")
+    finished = threading.Event()
+    queued = {}
+    start = time.time()
+    step.start()
+    for path in paths:
+        save_name = os.path.basename(path)
+        file_stats.init_file(save_name, os.path.getsize(path))
+        queued[save_name] = time.time()
+        event_queue.put(
+            step_upload.RequestUpload(path, save_name, None, None, False, None, None)
+        )
+    event_queue.put(step_upload.RequestFinish(finished.set))
+    finished.wait()
+    elapsed = time.time() - start
+
+    waits = sorted(
+        file_stream.done[name] - queued[name] for name in queued if "small" in name
+    )
+    summary = file_stats.summary()
+    return dict(
+        seconds=round(elapsed, 2),
+        mb_per_sec=round(summary["uploaded_bytes"] / 1e6 / elapsed, 1),
+        files_per_sec=round(len(paths) / elapsed),
+        small_p50_ms=round(waits[len(waits) // 2] * 1000),
+        small_p95_ms=round(waits[int(len(waits) * 0.95)] * 1000),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="step upload benchmark")
+    parser.add_argument("--small", type=int, default=2000)
+    parser.add_argument("--small-kb", type=int, default=20)
+    parser.add_argument("--large", type=int, default=32)
+    parser.add_argument("--large-mb", type=int, default=64)
+    parser.add_argument("--jobs", type=int, nargs="+", default=[16, 64])
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--bandwidth-mb", type=float, default=50)
+    args = parser.parse_args()
+
+    api = FakeApi(args.latency, args.bandwidth_mb * 1e6)
+    dirname = tempfile.mkdtemp()
+    try:
+        large = make_files(dirname, "large", args.large, args.large_mb * 1000000)
+        small = make_files(dirname, "small", args.small, args.small_kb * 1000)
+        # large files are queued in between the small ones, like the
+        # checkpoints a run saves along with its media
+        every = max(1, len(small) // max(1, len(large)))
+        paths = []
+        for i, path in enumerate(small):
+            if i % every == 0 and large:
+                paths.append(large.pop())
+            paths.append(path)
+        paths += large
+        for max_jobs in args.jobs:
+            for sized in (False, True):
+                result = run(api, paths, max_jobs, sized)
+                print(
+                    json.dumps(
+                        dict(
+                            jobs=max_jobs,
+                            schedule="sized" if sized else "fifo",
+                            **result
+                        )
+                    )
+                )
+    finally:
+        shutil.rmtree(dirname)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""record transport benchmark.
+
+Sends history records from the user process to a consumer process, the way the
+record queue feeds the internal process, and compares transports:
+- queue: multiprocessing.Queue (records pickled and written by a feeder thread)
+- shm: shared memory ring buffer (wandb.sdk.backend.ring_queue.RingQueue)
+
+Reported per transport:
+- records_per_sec: end to end throughput until the consumer drained the queue
+- producer_us_per_record: wall time the logging loop spent in put()
+- process_cpu_us_per_record: user process cpu time, including helper threads
+
+Usage:
+    python transport_benchmark.py --records 20000 --keys 10 100
+"""
+
+import argparse
+import json
+import multiprocessing
+import time
+
+from wandb.proto import wandb_internal_pb2 as pb
+from wandb.sdk.backend import ring_queue
+from wandb.util import json_dumps_safer_history
+
+
+def _consume(q, num_records, done):
+    for _ in range(num_records):
+        q.get()
+    done.set()
+
+
+def _history_record(step, num_keys):
+    record = pb.Record()
+    row = {"metric_%d" % k: step * 0.1 + k for k in range(num_keys)}
+    record.history.row_json = json_dumps_safer_history(row)
+    record.history.step.num = step
+    return record
+
+
+def run(ctx, transport, num_records, num_keys):
+    if transport == "shm":
+        q = ring_queue.RingQueue(ctx, pb.Record)
+    else:
+        q = ctx.Queue()
+    done = ctx.Event()
+    consumer = ctx.Process(target=_consume, args=(q, num_records, done))
+    consumer.start()
+    records = [_history_record(step, num_keys) for step in range(num_records)]
+
+    cpu_start = time.process_time()
+    start = time.time()
+    for record in records:
+        q.put(record)
+    put_time = time.time() - start
+    done.wait()
+    elapsed = time.time() - start
+    cpu_time = time.process_time() - cpu_start
+
+    consumer.join()
+    q.close()
+    return dict(
+        records_per_sec=round(num_records / elapsed),
+        producer_us_per_record=round(put_time / num_records * 1e6, 1),
+        process_cpu_us_per_record=round(cpu_time / num_records * 1e6, 1),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="record transport benchmark")
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--keys", type=int, nargs="+", default=[10, 100])
+    parser.add_argument("--start-method", default="spawn")
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context(args.start_method)
+    transports = ["queue"]
+    if ring_queue.is_available():
+        transports.append("shm")
+    for num_keys in args.keys:
+        for transport in transports:
+            result = run(ctx, transport, args.records, num_keys)
+            print(json.dumps(dict(keys=num_keys, transport=transport, **result)))
+
+
+if __name__ == "__main__":
+    main()
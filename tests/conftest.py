@@ -842,3 +842,36 @@ def inject_requests(mock_server):
 
     # TODO(jhr): make this compatible with live_mock_server
     return utils.InjectRequests(ctx=mock_server.ctx)
+
+
+@pytest.fixture
+def start_filesync_step():
+    """Start filesync steps, which are finished and checked after the test.
+
+    Finishing a step has to stop its thread and every one of its workers.
+    """
+    steps = []
+
+    def start(step):
+        step.start()
+        steps.append(step)
+        return step
+
+    yield start
+    for step in steps:
+        step.finish()
+        step._thread.join(10)
+        assert not step.is_alive()
+        assert not any(worker.is_alive() for worker in step._workers)
+
+
+@pytest.fixture
+def save_file(tmpdir):
+    """Write the file of a run file save name, returning its path."""
+
+    def write(save_name, contents="x"):
+        path = tmpdir.join(save_name.replace("/", "_"))
+        path.write(contents)
+        return str(path)
+
+    return write
@@ -74,3 +74,12 @@ def test_split_files():
         for i in range(len(offset_size_pairs) - 1):
             assert offset_size_pairs[i + 1][0] == sum(offset_size_pairs[i])
         assert sum(offset_size_pairs[-1]) == len(files[fname]["content"])
+
+
+def test_split_files_compression_ratio():
+    files = {"file.txt": {"content": ["x" * 1023 + "\n"] * 100, "offset": 0}}
+    # 100KB of lines split at 10KB, or at 40KB when expecting 4x compression
+    chunks = list(split_files(files, max_mb=10.0 / 1024))
+    assert [len(c["file.txt"]["content"]) for c in chunks] == [10] * 10
+    chunks = list(split_files(files, max_mb=10.0 / 1024, compression_ratio=4))
+    assert [len(c["file.txt"]["content"]) for c in chunks] == [40, 40, 20]
@@ -11,6 +11,9 @@ import netrc
 import subprocess
 import sys
 import os
+import glob
+import json
+import shutil
 from tests import utils
 
 DUMMY_API_KEY = "1824812581259009ca9981580f8f8a9012409eee"
@@ -950,6 +953,65 @@ def test_sync_wandb_run(runner, live_mock_server):
         assert "wandb: ERROR Nothing to sync." in result.output
 
 
+def test_sync_wandb_run_jobs(runner, live_mock_server):
+    with runner.isolated_filesystem():
+        utils.fixture_copy("wandb")
+        run_dir = os.path.join("wandb", "offline-run-20210216_154407-g9dvvkua")
+        shutil.copytree(
+            run_dir, os.path.join("wandb", "offline-run-20210216_154408-g9dvvkua")
+        )
+        # a run which fails to sync does not stop the others
+        broken_dir = os.path.join("wandb", "offline-run-20210216_154409-broken")
+        shutil.copytree(run_dir, broken_dir)
+        with open(os.path.join(broken_dir, "run-g9dvvkua.wandb"), "wb") as f:
+            f.write(b"\x00" * 100)
+
+        result = runner.invoke(cli.sync, ["--sync-all", "--jobs", "2"])
+        print(result.output)
+        assert result.exit_code == 1
+        assert (
+            result.output.count("mock_server_entity/test/runs/g9dvvkua ...done.") == 2
+        )
+        assert "Failed to sync" in result.output
+        assert "Synced 2 runs, 1 failed." in result.output
+
+        synced = sorted(glob.glob(os.path.join("wandb", "*", "*.wandb.synced")))
+        assert [os.path.basename(os.path.dirname(f)) for f in synced] == [
+            "offline-run-20210216_154407-g9dvvkua",
+            "offline-run-20210216_154408-g9dvvkua",
+        ]
+
+
+def test_sync_wandb_run_checkpoint(runner, live_mock_server):
+    def streamed_lines(ctx):
+        return sum(
+            len(data["content"])
+            for request in ctx["file_stream"]
+            for name, data in (request.get("files") or {}).items()
+            if name != "wandb-summary.json"
+        )
+
+    with runner.isolated_filesystem():
+        utils.fixture_copy("wandb")
+        run_dir = os.path.join("wandb", "offline-run-20210216_154407-g9dvvkua")
+        run_file = os.path.join(run_dir, "run-g9dvvkua.wandb")
+
+        result = runner.invoke(cli.sync, [run_dir])
+        assert result.exit_code == 0
+        with open(run_file + ".checkpoint") as f:
+            checkpoint = json.load(f)
+        assert checkpoint["offset"] == os.path.getsize(run_file)
+        assert checkpoint["state"]["events"] == 1
+        lines = streamed_lines(live_mock_server.get_ctx())
+        assert lines > 0
+
+        # syncing again only sends the records after the checkpoint
+        result = runner.invoke(cli.sync, [run_dir])
+        assert result.exit_code == 0
+        assert "mock_server_entity/test/runs/g9dvvkua ...done." in result.output
+        assert streamed_lines(live_mock_server.get_ctx()) == lines
+
+
 @pytest.mark.skipif(
     sys.version_info >= (3, 9), reason="Tensorboard not currently built for 3.9"
 )
@@ -143,3 +143,286 @@ def test_data_write_fill(with_datastore):
         expected_records=records,
         expected_record_sizes=lengths,
     )
+
+
+def scan_all(fname):
+    ds = datastore.DataStore()
+    ds.open_for_scan(fname)
+    records = []
+    while True:
+        data = ds.scan_data()
+        if data is None:
+            break
+        records.append(data)
+    ds.close()
+    return records
+
+
+# record sizes covering every block boundary case: block padding, an empty
+# FIRST record, a record ending exactly on a block boundary and records
+# split into FIRST, MIDDLE and LAST fragments
+APPEND_SIZES = (
+    32768 - 7 - 7 - 6,  # 6 bytes left, padded by the next write
+    100,
+    32768 - 107 - 7 - 7,  # 7 bytes left, next record starts with empty FIRST
+    10,
+    32768 - 7 - 10 - 7,  # ends exactly on the block boundary
+    2 * 32768,  # FIRST, MIDDLE, LAST
+    1,
+)
+
+
+def append_cuts(ends):
+    """File sizes around every record and block boundary."""
+    cuts = set()
+    for end in ends:
+        cuts.update(range(end - 8, end + 9))
+    for block in range(1, ends[-1] // 32768 + 1):
+        cuts.update(range(block * 32768 - 8, block * 32768 + 9))
+    return sorted(c for c in cuts if 0 <= c <= ends[-1])
+
+
+def test_data_append_torn(with_datastore):
+    """Append after the log was torn at every boundary."""
+    ds = with_datastore
+    records = []
+    ends = []
+    for i, size in enumerate(APPEND_SIZES):
+        data = bytes(bytearray([i + 1])) * size
+        file_offset, length, _, _ = ds._write_data(data)
+        records.append(data)
+        ends.append(file_offset + length)
+    ds.close()
+    with open(FNAME, "rb") as f:
+        log = f.read()
+    assert len(log) == ends[-1]
+
+    for cut in append_cuts(ends):
+        with open(FNAME, "wb") as f:
+            f.write(log[:cut])
+        expected = [r for r, end in zip(records, ends) if end <= cut]
+        valid_end = max([7] + [end for end in ends if end <= cut])
+
+        ds = datastore.DataStore()
+        ds.open_for_append(FNAME)
+        assert ds._index == valid_end, cut
+        assert os.stat(FNAME).st_size == valid_end, cut
+        ds._write_data(b"\xff" * 20)
+        ds.close()
+        assert scan_all(FNAME) == expected + [b"\xff" * 20], cut
+
+
+def test_data_append_corrupt(with_datastore):
+    """Only a torn last block is truncated, earlier corruption is an error."""
+    ds = with_datastore
+    for i, size in enumerate(APPEND_SIZES):
+        ds._write_data(bytes(bytearray([i + 1])) * size)
+    ds.close()
+    with open(FNAME, "rb") as f:
+        log = f.read()
+
+    # a byte of the first record flipped
+    corrupt = bytearray(log)
+    corrupt[100] ^= 0xFF
+    with open(FNAME, "wb") as f:
+        f.write(corrupt)
+    ds = datastore.DataStore()
+    with pytest.raises(Exception, match="corrupt"):
+        ds.open_for_append(FNAME)
+    ds.close()
+    assert os.stat(FNAME).st_size == len(log)
+
+    # a byte of the last record flipped
+    corrupt = bytearray(log)
+    corrupt[-1] ^= 0xFF
+    with open(FNAME, "wb") as f:
+        f.write(corrupt)
+    ds = datastore.DataStore()
+    ds.open_for_append(FNAME)
+    ds.close()
+    assert scan_all(FNAME) == [
+        bytes(bytearray([i + 1])) * size for i, size in enumerate(APPEND_SIZES[:-1])
+    ]
+
+
+def test_data_append_empty(with_datastore):
+    """Append to logs which only hold a header or a torn header."""
+    ds = with_datastore
+    ds.close()
+    for size in (7, 3, 0):
+        with open(FNAME, "r+b") as f:
+            f.truncate(size)
+        ds = datastore.DataStore()
+        ds.open_for_append(FNAME)
+        ds._write_data(b"\x01" * 10)
+        ds.close()
+        assert scan_all(FNAME) == [b"\x01" * 10]
+
+
+def test_data_append_invalid_header(with_datastore):
+    ds = with_datastore
+    ds.close()
+    with open(FNAME, "wb") as f:
+        f.write(b"\x00" * 100)
+    ds = datastore.DataStore()
+    with pytest.raises(Exception, match="Invalid header"):
+        ds.open_for_append(FNAME)
+    ds.close()
+
+
+@pytest.mark.parametrize(
+    "durability,syncs", [("none", 0), ("record", 4), ("bytes", 2), ("interval", 1)],
+)
+def test_data_durability(mocker, durability, syncs):
+    """Records are fsynced according to the durability policy."""
+    fsync = mocker.patch("os.fsync")
+    wandb._set_internal_process()
+    ds = datastore.DataStore(durability=durability, durability_bytes=40000)
+    ds.open_for_write(FNAME)
+    # the second record spans a block boundary
+    for size in (100, 40000, 100, 100):
+        rec = wandb_internal_pb2.Record()
+        rec.history.row_json = "x" * size
+        ds.write(rec)
+    # records written since the last sync are committed on close
+    ds.close()
+    os.unlink(FNAME)
+    assert fsync.call_count == syncs
+
+
+def test_data_durability_interval(mocker):
+    """Idle records are fsynced once the interval passed."""
+    fsync = mocker.patch("os.fsync")
+    wandb._set_internal_process()
+    ds = datastore.DataStore(durability="interval", durability_seconds=60)
+    ds.open_for_write(FNAME)
+    ds._write_data(b"\x01" * 100)
+    ds.debounce()
+    assert fsync.call_count == 0
+    mocker.patch("time.time", return_value=ds._sync_time + 61)
+    ds.debounce()
+    assert fsync.call_count == 1
+    ds.debounce()
+    assert fsync.call_count == 1
+    ds.close()
+    os.unlink(FNAME)
+
+
+def write_records(ds, num=20):
+    """Write output records and history records of growing size."""
+    records = []
+    for i in range(num):
+        rec = wandb_internal_pb2.Record()
+        rec.num = i + 1
+        if i % 2:
+            rec.history.row_json = json.dumps({"data": "x" * i * 4000})
+        else:
+            rec.output.line = "line %d" % i
+        ds.write(rec)
+        records.append(rec)
+    ds.close()
+    return records
+
+
+def test_data_scanner(with_datastore):
+    records = write_records(with_datastore)
+    serialized = [r.SerializeToString() for r in records]
+    assert scan_all(FNAME) == serialized
+
+    scanner = datastore.DataScanner(FNAME)
+    assert [bytes(data) for data in scanner] == serialized
+    scanner.close()
+
+    scanner = datastore.DataScanner(FNAME, record_types=["history"])
+    history = []
+    for data in scanner:
+        rec = wandb_internal_pb2.Record()
+        rec.ParseFromString(data)
+        history.append(rec)
+    scanner.close()
+    assert history == [r for r in records if r.HasField("history")]
+
+
+def test_data_scanner_torn(with_datastore):
+    records = write_records(with_datastore)
+    size = os.stat(FNAME).st_size
+    with open(FNAME, "r+b") as f:
+        f.truncate(size - 10)
+    scanner = datastore.DataScanner(FNAME)
+    for _ in range(len(records) - 1):
+        assert scanner.scan_data() is not None
+    with pytest.raises(AssertionError, match="truncated"):
+        scanner.scan_data()
+    assert scanner.in_last_block()
+    scanner.close()
+
+
+def test_data_scanner_checksum(with_datastore):
+    write_records(with_datastore)
+    with open(FNAME, "r+b") as f:
+        f.seek(7 + 7 + 2)
+        f.write(b"\xff")
+    scanner = datastore.DataScanner(FNAME)
+    with pytest.raises(AssertionError, match="checksum"):
+        scanner.scan_data()
+    scanner.close()
+
+    # corruption is not noticed without verification
+    scanner = datastore.DataScanner(FNAME, verify=False)
+    assert len(list(scanner)) == 20
+    scanner.close()
+
+
+@pytest.mark.parametrize("compression", ["zlib", "zstd"])
+def test_data_compressed(compression):
+    """Compressed logs are smaller and scan back to the same records."""
+    wandb._set_internal_process()
+    sizes = {}
+    for name in ("none", compression):
+        ds = datastore.DataStore(compression=name)
+        ds.open_for_write(FNAME)
+        records = write_records(ds)
+        sizes[name] = os.stat(FNAME).st_size
+        serialized = [r.SerializeToString() for r in records]
+        assert scan_all(FNAME) == serialized
+        scanner = datastore.DataScanner(FNAME)
+        assert [bytes(data) for data in scanner] == serialized
+        scanner.close()
+        scanner = datastore.DataScanner(FNAME, record_types=["output"])
+        assert [scanner.record_type(data) for data in scanner] == ["output"] * 10
+        scanner.close()
+        os.unlink(FNAME)
+    assert sizes[compression] < sizes["none"] / 10
+
+
+def test_data_compressed_append():
+    """Appending keeps the format the log was created with."""
+    wandb._set_internal_process()
+    for created, appended in (("zlib", None), (None, "zlib")):
+        ds = datastore.DataStore(compression=created)
+        ds.open_for_write(FNAME)
+        records = write_records(ds, num=4)
+        ds = datastore.DataStore(compression=appended)
+        ds.open_for_append(FNAME)
+        records += write_records(ds, num=4)
+        with open(FNAME, "rb") as f:
+            version = f.read(7)[6:]
+        expected = 1 if created else 0
+        assert version == bytes(bytearray([expected]))
+        assert scan_all(FNAME) == [r.SerializeToString() for r in records]
+        os.unlink(FNAME)
+
+
+def test_data_compressed_invalid_codec():
+    wandb._set_internal_process()
+    ds = datastore.DataStore(compression="zlib")
+    ds.open_for_write(FNAME)
+    ds._write_data(b"\x09" + b"\x01" * 10)
+    ds.close()
+    with pytest.raises(AssertionError, match="codec"):
+        scan_all(FNAME)
+    scanner = datastore.DataScanner(FNAME)
+    with pytest.raises(AssertionError, match="codec"):
+        scanner.scan_data()
+    scanner.close()
+    os.unlink(FNAME)
@@ -0,0 +1,95 @@
+"""dir_watcher tests."""
+
+import os
+import sys
+import time
+
+import pytest
+from wandb.filesync import dir_watcher
+from wandb.sdk.internal.settings_static import SettingsStatic
+
+
+def make_settings(files_dir, file_watcher=None):
+    return SettingsStatic(
+        dict(files_dir=files_dir, ignore_globs=(), _file_watcher=file_watcher)
+    )
+
+
+def wait_for(condition, timeout=5):
+    start = time.time()
+    while not condition() and time.time() - start < timeout:
+        time.sleep(0.05)
+    return condition()
+
+
+@pytest.mark.parametrize("file_watcher", ["auto", "polling"])
+def test_dir_watcher_now(tmpdir, mocker, file_watcher):
+    pusher = mocker.MagicMock()
+    watcher = dir_watcher.DirWatcher(
+        make_settings(str(tmpdir), file_watcher), None, pusher
+    )
+    watcher.update_policy("sub/*.txt", "now")
+    # files in directories created after the watcher started are seen
+    path = os.path.join(str(tmpdir.mkdir("sub")), "a.txt")
+    with open(path, "w") as f:
+        f.write("data")
+    assert wait_for(lambda: pusher.file_changed.called)
+    pusher.file_changed.assert_called_with(os.path.join("sub", "a.txt"), path)
+    watcher.finish()
+    assert not watcher._file_observer.is_alive()
+
+
+@pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="inotify is only on linux"
+)
+def test_dir_watcher_inotify(tmpdir, mocker):
+    watcher = dir_watcher.DirWatcher(make_settings(str(tmpdir)), None, mocker.Mock())
+    assert not watcher._polling
+    watcher.finish()
+
+    watcher = dir_watcher.DirWatcher(
+        make_settings(str(tmpdir), "polling"), None, mocker.Mock()
+    )
+    assert watcher._polling
+    watcher.finish()
+
+
+def test_dir_watcher_inotify_fallback(tmpdir, mocker):
+    """Polling is used when inotify watches can't be added."""
+    if dir_watcher.wd_inotify is not None:
+        mocker.patch.object(
+            dir_watcher.wd_inotify.InotifyObserver,
+            "start",
+            side_effect=OSError(28, "inotify watch limit reached"),
+        )
+    pusher = mocker.MagicMock()
+    watcher = dir_watcher.DirWatcher(make_settings(str(tmpdir)), None, pusher)
+    assert watcher._polling
+    with open(os.path.join(str(tmpdir), "a.txt"), "w") as f:
+        f.write("data")
+    watcher.finish()
+    pusher.file_changed.assert_called_once_with(
+        "a.txt", os.path.join(str(tmpdir), "a.txt"), copy=False
+    )
+
+
+@pytest.mark.parametrize("file_watcher", ["auto", "polling"])
+def test_dir_watcher_symlink(tmpdir, mocker, file_watcher):
+    """Changes of files symlinked into the directory, like by wandb.save, are seen."""
+    mocker.patch.object(dir_watcher.PolicyLive, "RATE_LIMIT_SECONDS", 0)
+    mocker.patch.object(
+        dir_watcher.PolicyLive, "min_wait_for_size", lambda self, size: 0
+    )
+    files_dir = str(tmpdir.mkdir("files"))
+    target = tmpdir.join("target.txt")
+    target.write("a" * 10)
+    pusher = mocker.MagicMock()
+    watcher = dir_watcher.DirWatcher(
+        make_settings(files_dir, file_watcher), None, pusher
+    )
+    watcher.update_policy("link.txt", "live")
+    os.symlink(str(target), os.path.join(files_dir, "link.txt"))
+    assert wait_for(lambda: pusher.file_changed.call_count == 1)
+    target.write("a" * 100)
+    assert wait_for(lambda: pusher.file_changed.call_count == 2)
+    watcher.finish()
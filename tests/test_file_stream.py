@@ -5,8 +5,16 @@ file_stream tests.
 from __future__ import print_function
 
 import json
+import sys
+import time
+
 import pytest
 
+if sys.version_info >= (3, 6):
+    from wandb.sdk.internal import file_stream
+else:
+    from wandb.sdk_py27.internal import file_stream
+
 
 def generate_history():
     history = []
@@ -108,3 +116,115 @@ def test_fstream_requests_error(publish_util, mock_server, inject_requests, mock
     inject_requests.add(match=match, requests_error=True)
     with pytest.raises(Exception, match=r"The wandb backend process has shutdown"):
         assert_history(publish_util)
+
+
+def test_fstream_gzip(publish_util, mock_server, test_settings):
+    test_settings._file_stream_gzip = True
+    assert_history(publish_util)
+    assert mock_server.ctx["file_stream_gzip"] > 0
+
+
+class FakeApi(object):
+    api_key = "key"
+    user_agent = "agent"
+    retry_callback = None
+
+    def __init__(self):
+        self.dynamic_settings = {"heartbeat_seconds": 30}
+
+    def settings(self):
+        return dict(base_url="http://localhost", entity="e", project="p")
+
+
+def test_fstream_pipelined_order(mocker):
+    posts = []
+
+    def post(url, data=None, **kwargs):
+        files = json.loads(data)["files"] if data else {}
+        for name, f in files.items():
+            posts.append((name, f["offset"], len(f["content"])))
+        if "slow.jsonl" in files:
+            time.sleep(0.2)
+        return mocker.Mock()
+
+    fs = file_stream.FileStreamApi(FakeApi(), "run", time.time(), max_inflight=2)
+    mocker.patch.object(fs._client, "post", post)
+    mocker.patch.object(fs, "rate_limit_seconds", lambda: 0.01)
+    for name in ("slow.jsonl", "fast.jsonl"):
+        fs.set_file_policy(name, file_stream.JsonlFilePolicy())
+    fs.start()
+    for i in range(50):
+        fs.push("slow.jsonl", json.dumps({"i": i}))
+        fs.push("fast.jsonl", json.dumps({"i": i}))
+        time.sleep(0.005)
+    fs.finish(0)
+
+    for name in ("slow.jsonl", "fast.jsonl"):
+        offset = 0
+        for _, chunk_offset, num_lines in [p for p in posts if p[0] == name]:
+            assert chunk_offset == offset
+            offset += num_lines
+        assert offset == 50
+    # fast.jsonl kept posting while slow.jsonl requests were in flight
+    assert len([p for p in posts if p[0] == "fast.jsonl"]) > len(
+        [p for p in posts if p[0] == "slow.jsonl"]
+    )
+    stats = fs.stats()
+    assert stats["max_inflight"] == 2
+    assert stats["inflight"] == 0
+
+
+def test_fstream_one_request_by_default(mocker):
+    posted = []
+
+    def post(url, data=None, **kwargs):
+        posted.append(sorted(json.loads(data)["files"]) if data else [])
+        time.sleep(0.01)
+        return mocker.Mock()
+
+    fs = file_stream.FileStreamApi(FakeApi(), "run", time.time())
+    mocker.patch.object(fs._client, "post", post)
+    mocker.patch.object(fs, "rate_limit_seconds", lambda: 0.01)
+    for name in ("a.jsonl", "b.jsonl"):
+        fs.set_file_policy(name, file_stream.JsonlFilePolicy())
+    fs.start()
+    for i in range(20):
+        fs.push("a.jsonl", json.dumps({"i": i}))
+        fs.push("b.jsonl", json.dumps({"i": i}))
+        time.sleep(0.002)
+    fs.finish(0)
+
+    # files that are ready together are posted in the same request
+    assert ["a.jsonl", "b.jsonl"] in posted
+    assert fs.stats()["max_inflight"] == 1
+
+
+def test_fstream_adaptive_rate_limit():
+    fs = file_stream.FileStreamApi(FakeApi(), "run", time.time())
+    idle_seconds = fs.rate_limit_seconds()
+    assert fs.max_items_per_push() == fs.MAX_ITEMS_PER_PUSH
+
+    for i in range(3 * fs.MAX_ITEMS_PER_PUSH):
+        fs.push("history.jsonl", str(i))
+    assert fs.backlog() == 3 * fs.MAX_ITEMS_PER_PUSH
+    assert fs.rate_limit_seconds() == pytest.approx(idle_seconds / 4)
+    assert fs.max_items_per_push() == 4 * fs.MAX_ITEMS_PER_PUSH
+
+    # 429s back off, successful posts recover
+    fs._retry_callback(429, "rate limited")
+    fs._retry_callback(429, "rate limited")
+    assert fs.rate_limit_seconds() == pytest.approx(idle_seconds)
+    assert fs.stats()["rate_limited"] == 2
+    fs._decrease_backoff()
+    fs._decrease_backoff()
+    fs._decrease_backoff()
+    assert fs.stats()["backoff"] == 1.0
+
+
+def test_fstream_limits_backoff(mocker):
+    fs = file_stream.FileStreamApi(FakeApi(), "run", time.time())
+    response = mocker.Mock()
+    response.json.return_value = {"limits": {"heartbeat_seconds": 60}}
+    fs._handle_response(response)
+    assert fs.heartbeat_seconds == 60
+    assert fs.stats()["backoff"] == 2.0
@@ -158,6 +158,7 @@ SYMBOLS_RUN = {
     "config",
     "config_static",
     "log",
+    "log_many",
     "log_artifact",
     "upsert_artifact",
     "finish_artifact",
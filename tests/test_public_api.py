@@ -9,6 +9,7 @@ import os
 import json
 import pytest
 import platform
+import stat
 import sys
 
 import wandb
@@ -368,6 +369,62 @@ def test_artifact_download(runner, mock_server, api):
         assert os.listdir(path) == ["digits.h5"]
 
 
+def test_artifact_download_hardlink(runner, mock_server, api, monkeypatch):
+    monkeypatch.setenv("WANDB_ARTIFACT_MATERIALIZE", "hardlink")
+    with runner.isolated_filesystem():
+        art = api.artifact("entity/project/mnist:v0", type="dataset")
+        path = art.get_path("digits.h5").download(os.getcwd())
+        mode = os.stat(path).st_mode
+        assert os.stat(path).st_nlink >= 2
+        assert not mode & stat.S_IWUSR
+        assert art.get_path("digits.h5").download(os.getcwd()) == path
+
+        # copies of linked cache files are writable
+        monkeypatch.setenv("WANDB_ARTIFACT_MATERIALIZE", "copy")
+        path = art.get_path("digits.h5").download(os.getcwd())
+        assert os.stat(path).st_nlink == 1
+        assert os.stat(path).st_mode & stat.S_IWUSR
+
+
+def test_artifact_download_symlink(runner, mock_server, api, monkeypatch):
+    monkeypatch.setenv("WANDB_ARTIFACT_MATERIALIZE", "symlink")
+    with runner.isolated_filesystem():
+        art = api.artifact("entity/project/mnist:v0", type="dataset")
+        path = art.download()
+        assert os.listdir(path) == ["digits.h5"]
+        if platform.system() != "Windows":
+            assert os.path.islink(os.path.join(path, "digits.h5"))
+
+
+def test_artifact_download_symlink_max_size(runner, mock_server, api, monkeypatch):
+    from wandb.sdk.interface import artifacts
+
+    monkeypatch.setenv("WANDB_ARTIFACT_MATERIALIZE", "symlink")
+    with runner.isolated_filesystem():
+        cache = artifacts.ArtifactsCache(
+            os.path.join(os.getcwd(), "cache"), max_size=1024 * 1024
+        )
+        monkeypatch.setattr(artifacts, "_artifacts_cache", cache)
+        art = api.artifact("entity/project/mnist:v0", type="dataset")
+        path = art.get_path("digits.h5").download(os.getcwd())
+        assert not os.path.islink(path)
+        with open(path, "rb") as f:
+            contents = f.read()
+
+        # evicting the cache keeps the downloaded file
+        assert cache.cleanup(0) > 0
+        with open(path, "rb") as f:
+            assert f.read() == contents
+
+
+def test_artifact_download_bad_materialize(runner, mock_server, api, monkeypatch):
+    monkeypatch.setenv("WANDB_ARTIFACT_MATERIALIZE", "teleport")
+    with runner.isolated_filesystem():
+        art = api.artifact("entity/project/mnist:v0", type="dataset")
+        with pytest.raises(ValueError):
+            art.get_path("digits.h5").download(os.getcwd())
+
+
 def test_artifact_checkout(runner, mock_server, api):
     with runner.isolated_filesystem():
         # Create a file that should be removed as part of checkout
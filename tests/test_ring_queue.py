@@ -0,0 +1,98 @@
+"""
+shared memory ring queue tests.
+"""
+
+import multiprocessing
+import sys
+
+import pytest
+from six.moves import queue
+from wandb.proto import wandb_internal_pb2 as pb
+
+if sys.version_info >= (3, 8):
+    from wandb.sdk.backend import ring_queue
+else:
+    pytestmark = pytest.mark.skip(reason="shared memory requires py38+")
+
+
+def _record(num, size=0):
+    record = pb.Record(num=num)
+    if size:
+        record.output.line = "x" * size
+    return record
+
+
+def _producer(q, first, count):
+    for num in range(first, first + count):
+        # every 50th message is too large for the ring
+        q.put(_record(num, size=100 if num % 50 == 0 else num % 7))
+
+
+@pytest.fixture
+def ring():
+    ctx = multiprocessing.get_context("spawn")
+    q = ring_queue.RingQueue(ctx, pb.Record, size=256)
+    yield q
+    q.close()
+
+
+def test_put_get(ring):
+    assert ring.empty()
+    ring.put(_record(1))
+    ring.put(_record(2, size=10))
+    assert ring.qsize() == 2
+    assert ring.get() == _record(1)
+    assert ring.get() == _record(2, size=10)
+    assert ring.empty()
+
+
+def test_get_empty(ring):
+    with pytest.raises(queue.Empty):
+        ring.get(timeout=0.01)
+    with pytest.raises(queue.Empty):
+        ring.get_nowait()
+
+
+def test_wrap_around(ring):
+    # frames straddle the end of the ring many times over
+    for num in range(200):
+        ring.put(_record(num, size=num % 40))
+        assert ring.get(timeout=1) == _record(num, size=num % 40)
+
+
+def test_full(ring):
+    # messages that don't fit in the full ring go through the overflow queue
+    for num in range(100):
+        ring.put_nowait(_record(num, size=40))
+    ring.put(_record(100), timeout=0.01)
+    ring.put(_record(101))
+    assert ring.qsize() == 102
+    assert [ring.get(timeout=1).num for _ in range(102)] == list(range(102))
+    assert ring.empty()
+
+
+def test_overflow_keeps_order(ring):
+    ring.put(_record(1))
+    ring.put(_record(2, size=1000))
+    ring.put(_record(3))
+    assert [ring.get(timeout=1) for _ in range(3)] == [
+        _record(1),
+        _record(2, size=1000),
+        _record(3),
+    ]
+
+
+def test_cross_process(ring):
+    ctx = multiprocessing.get_context("spawn")
+    procs = [
+        ctx.Process(target=_producer, args=(ring, i * 1000, 500)) for i in range(2)
+    ]
+    for p in procs:
+        p.start()
+    nums = [ring.get(timeout=30).num for _ in range(1000)]
+    for p in procs:
+        p.join()
+    assert sorted(nums) == list(range(500)) + list(range(1000, 1500))
+    # the messages of each producer arrive in the order they were put
+    assert [num for num in nums if num < 1000] == list(range(500))
+    assert ring.empty()
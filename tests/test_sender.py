@@ -1,5 +1,6 @@
 from __future__ import print_function
 
+import json
 import os
 import pytest
 import six
@@ -17,10 +18,12 @@ from wandb.util import mkdir_exists_ok
 PY3 = sys.version_info.major == 3 and sys.version_info.minor >= 6
 if PY3:
     from wandb.sdk.internal.handler import HandleManager
+    from wandb.sdk.internal import sender
     from wandb.sdk.internal.sender import SendManager
     from wandb.sdk.interface.interface import BackendSender
 else:
     from wandb.sdk_py27.internal.handler import HandleManager
+    from wandb.sdk_py27.internal import sender
     from wandb.sdk_py27.internal.sender import SendManager
     from wandb.sdk_py27.interface.interface import BackendSender
 
@@ -403,6 +406,13 @@ def test_sync_spell_run(
         del os.environ["SPELL_RUN_URL"]
 
 
+def test_send_manager_setup_settings(tmp_path):
+    # wandb sync sends runs with the settings of SendManager.setup
+    sm = SendManager.setup(str(tmp_path))
+    assert sm._settings._file_stream_gzip is None
+    assert sm._settings._file_stream_max_inflight is None
+
+
 def test_upgrade_upgraded(
     mocked_run,
     mock_server,
@@ -493,3 +503,111 @@ def test_upgrade_removed(
 
 
 # TODO: test other sender methods
+
+
+def test_summary_delta_update(internal_hm, internal_sender_q):
+    for i in range(3):
+        record = pb.Record()
+        item = record.history.item.add()
+        item.key = "loss"
+        item.value_json = str(i)
+        internal_hm.handle_history(record)
+
+    record = pb.Record()
+    item = record.history.item.add()
+    item.key = "acc"
+    item.value_json = "0.5"
+    internal_hm.handle_history(record)
+
+    summaries = []
+    while not internal_sender_q.empty():
+        record = internal_sender_q.get()
+        if record.WhichOneof("record_type") == "summary":
+            summaries.append(record.summary)
+    assert len(summaries) == 4
+    assert {item.key for item in summaries[-1].update} == {"acc", "_step"}
+
+
+def test_summary_delta_consolidated(internal_sm, monkeypatch):
+    monkeypatch.setattr(sender, "SUMMARY_DEBOUNCE_SECONDS", 1000)
+    mkdir_exists_ok(internal_sm._settings.files_dir)
+    summary = pb.SummaryRecord()
+    for k, v in (("loss", "1"), ("acc", "0.5"), ("extra", "2")):
+        item = summary.update.add()
+        item.key = k
+        item.value_json = v
+    internal_sm.send_summary(pb.Record(summary=summary))
+
+    summary = pb.SummaryRecord()
+    item = summary.update.add()
+    item.key = "loss"
+    item.value_json = "0.25"
+    item = summary.remove.add()
+    item.key = "extra"
+    internal_sm.send_summary(pb.Record(summary=summary))
+
+    summary_path = os.path.join(internal_sm._settings.files_dir, "wandb-summary.json")
+    assert not os.path.exists(summary_path)
+    internal_sm.debounce()
+    with open(summary_path) as f:
+        assert json.load(f) == {"loss": 0.25, "acc": 0.5}
+
+
+def test_summary_debounce_count(internal_sm, monkeypatch):
+    monkeypatch.setattr(sender, "SUMMARY_DEBOUNCE_SECONDS", 1000)
+    monkeypatch.setattr(sender, "SUMMARY_DEBOUNCE_COUNT", 10)
+    mkdir_exists_ok(internal_sm._settings.files_dir)
+    for i in range(25):
+        summary = pb.SummaryRecord()
+        item = summary.update.add()
+        item.key = "step"
+        item.value_json = str(i)
+        internal_sm.send_summary(pb.Record(summary=summary))
+    assert internal_sm._summary_stats == dict(updates=25, writes=2)
+
+    internal_sm.finish()
+    assert internal_sm._summary_stats == dict(updates=25, writes=3)
+    summary_path = os.path.join(internal_sm._settings.files_dir, "wandb-summary.json")
+    with open(summary_path) as f:
+        assert json.load(f) == {"step": 24}
+    assert not os.path.exists(summary_path + ".tmp")
+
+
+def test_history_row_json_passthrough(internal_hm, internal_sender_q):
+    record = pb.Record()
+    record.history.row_json = json.dumps({"loss": 0.5, "nested": {"acc": 1}})
+    internal_hm.handle_history(record)
+
+    record = internal_sender_q.get()
+    assert record.WhichOneof("record_type") == "history"
+    assert len(record.history.item) == 0
+    assert json.loads(record.history.row_json) == {
+        "loss": 0.5,
+        "nested": {"acc": 1},
+        "_step": 0,
+    }
+    summary = internal_sender_q.get().summary
+    assert {item.key for item in summary.update} == {"loss", "nested", "_step"}
+
+
+def test_history_batch(internal_hm, internal_sender_q):
+    record = pb.Record()
+    for step, loss in ((3, 0.5), (7, 0.25)):
+        history = record.history_batch.history.add()
+        history.row_json = json.dumps({"loss": loss})
+        history.step.num = step
+    internal_hm.handle_history_batch(record)
+
+    rows = [internal_sender_q.get() for _ in range(2)]
+    assert [r.WhichOneof("record_type") for r in rows] == ["history", "history"]
+    assert [json.loads(r.history.row_json) for r in rows] == [
+        {"loss": 0.5, "_step": 3},
+        {"loss": 0.25, "_step": 7},
+    ]
+    # one summary update for the whole batch
+    summary = internal_sender_q.get().summary
+    assert {item.key: json.loads(item.value_json) for item in summary.update} == {
+        "loss": 0.25,
+        "_step": 7,
+    }
+    assert internal_sender_q.empty()
@@ -70,3 +70,8 @@ def test_thread(run_full):
     cu = run_full(settings=wandb.Settings(start_method="thread"))
     telemetry = cu.telemetry
     assert telemetry and 8 in telemetry.get("8", [])
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason="py38+ has shared memory")
+def test_shm_transport(run_full):
+    run_full(settings=wandb.Settings(_transport="shm"))
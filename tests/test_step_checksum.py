@@ -0,0 +1,120 @@
+"""step_checksum tests."""
+
+import threading
+
+import pytest
+from six.moves import queue
+from wandb.compat import tempfile
+from wandb.filesync import stats
+from wandb.filesync import step_checksum
+from wandb.filesync import step_upload
+
+try:
+    from unittest import mock
+except ImportError:  # TODO: this is only for python2
+    import mock
+
+
+@pytest.fixture
+def make_step(start_filesync_step):
+    def make(max_jobs):
+        step = step_checksum.StepChecksum(
+            mock.Mock(),
+            tempfile.TemporaryDirectory("wandb"),
+            queue.Queue(),
+            queue.Queue(),
+            stats.Stats(),
+            max_jobs=max_jobs,
+        )
+        return start_filesync_step(step)
+
+    return make
+
+
+@pytest.fixture
+def request_upload(save_file):
+    def request(save_name, artifact_id=None, copy=True, contents="x"):
+        return step_checksum.RequestUpload(
+            save_file(save_name, contents),
+            save_name,
+            artifact_id,
+            copy,
+            True,
+            None,
+            None,
+        )
+
+    return request
+
+
+def outputs(step, count):
+    return [step._output_queue.get(timeout=10) for _ in range(count)]
+
+
+def test_checksum_and_copy(make_step, request_upload):
+    step = make_step(2)
+    step._request_queue.put(request_upload("media/a.png", contents="abc"))
+    (event,) = outputs(step, 1)
+    assert event.save_name == "media/a.png"
+    assert event.path.startswith(step._tempdir.name)
+    assert event.md5 == "kAFQmDzST7DWlj99KOF/cg=="
+    assert step._stats.summary()["total_bytes"] == 3
+
+
+def test_slow_file_does_not_block_others(make_step, request_upload):
+    step = make_step(2)
+    copied = threading.Event()
+    copy2 = step_checksum.shutil.copy2
+
+    def slow_copy2(src, dst):
+        if "model" in src:
+            assert copied.wait(10)
+        return copy2(src, dst)
+
+    with mock.patch.object(step_checksum.shutil, "copy2", slow_copy2):
+        step._request_queue.put(request_upload("model.h5"))
+        step._request_queue.put(request_upload("small.txt"))
+        assert outputs(step, 1)[0].save_name == "small.txt"
+        copied.set()
+        assert outputs(step, 1)[0].save_name == "model.h5"
+
+
+def test_same_file_in_order(make_step, save_file):
+    step = make_step(4)
+    paths = [
+        save_file("output%d.log" % i, contents)
+        for i, contents in enumerate(["1", "22", "333"])
+    ]
+    for path in paths:
+        step._request_queue.put(
+            step_checksum.RequestUpload(
+                path, "output.log", None, False, False, None, None
+            )
+        )
+    events = outputs(step, 3)
+    assert [e.path for e in events] == paths
+    assert step.pending_count() == 0
+
+
+def test_commit_after_artifact_files(make_step, request_upload):
+    step = make_step(4)
+    for i in range(8):
+        step._request_queue.put(
+            request_upload("file%d.txt" % i, artifact_id="art", copy=False)
+        )
+    step._request_queue.put(
+        step_checksum.RequestCommitArtifact("art", True, None, None)
+    )
+    events = outputs(step, 9)
+    assert all(isinstance(e, step_upload.RequestUpload) for e in events[:8])
+    assert isinstance(events[8], step_upload.RequestCommitArtifact)
+
+
+def test_finish_after_checksums(make_step, request_upload):
+    step = make_step(2)
+    for i in range(8):
+        step._request_queue.put(request_upload("file%d.txt" % i))
+    step._request_queue.put(step_checksum.RequestFinish("callback"))
+    events = outputs(step, 9)
+    assert events[8] == step_upload.RequestFinish("callback")
+    assert len(step._workers) == 2
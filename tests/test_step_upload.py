@@ -0,0 +1,185 @@
+"""step_upload scheduling tests."""
+
+import threading
+
+import pytest
+from six.moves import queue
+from wandb.filesync import stats
+from wandb.filesync import step_upload
+
+try:
+    from unittest import mock
+except ImportError:  # TODO: this is only for python2
+    import mock
+
+
+class Uploads(object):
+    """save_fn's that record when they start and wait to be released."""
+
+    def __init__(self):
+        self.started = queue.Queue()
+        self.release = {}
+
+    def save_fn(self, save_name):
+        self.release[save_name] = threading.Event()
+
+        def save(progress):
+            self.started.put(save_name)
+            assert self.release[save_name].wait(10)
+            return False
+
+        return save
+
+    def wait_started(self, count):
+        return [self.started.get(timeout=10) for _ in range(count)]
+
+
+@pytest.fixture
+def uploads():
+    return Uploads()
+
+
+@pytest.fixture
+def make_step(start_filesync_step):
+    def make(max_jobs, max_large_jobs=None):
+        step = step_upload.StepUpload(
+            mock.Mock(),
+            stats.Stats(),
+            queue.Queue(),
+            max_jobs,
+            file_stream=mock.Mock(),
+            max_large_jobs=max_large_jobs,
+        )
+        step.LARGE_FILE_BYTES = 100
+        return start_filesync_step(step)
+
+    return make
+
+
+@pytest.fixture
+def request_upload(uploads, save_file):
+    def request(save_name, size=10):
+        return step_upload.RequestUpload(
+            save_file(save_name, "x" * size),
+            save_name,
+            None,
+            None,
+            False,
+            uploads.save_fn(save_name),
+            None,
+        )
+
+    return request
+
+
+def test_metadata_and_small_files_first(uploads, make_step, request_upload):
+    step = make_step(1)
+    requests = [
+        request_upload("first.txt"),
+        request_upload("media/a.png"),
+        request_upload("model.h5", size=1000),
+        request_upload("wandb-summary.json"),
+        request_upload("media/b.png"),
+    ]
+    for r in requests:
+        step._event_queue.put(r)
+    assert uploads.wait_started(1) == ["first.txt"]
+    order = []
+    for save_name in ["first.txt", "wandb-summary.json", "model.h5", "media/a.png"]:
+        uploads.release[save_name].set()
+        order.extend(uploads.wait_started(1))
+    uploads.release["media/b.png"].set()
+    assert order == ["wandb-summary.json", "model.h5", "media/a.png", "media/b.png"]
+    assert len(step._workers) == 1
+
+
+def test_large_files_on_dedicated_slots(uploads, make_step, request_upload):
+    step = make_step(4, max_large_jobs=1)
+    for i in range(4):
+        step._event_queue.put(request_upload("small%d.txt" % i))
+    assert len(uploads.wait_started(4)) == 4
+    for i in range(3):
+        step._event_queue.put(request_upload("large%d.bin" % i, size=1000))
+    for i in range(4, 6):
+        step._event_queue.put(request_upload("small%d.txt" % i))
+
+    # one large file on its dedicated worker, the others once no small file
+    # is waiting
+    order = []
+    for i in range(4):
+        uploads.release["small%d.txt" % i].set()
+        order.extend(uploads.wait_started(1))
+    assert order == ["large0.bin", "small4.txt", "small5.txt", "large1.bin"]
+    assert step.pending_count() == 1
+    for event in uploads.release.values():
+        event.set()
+    assert uploads.wait_started(1) == ["large2.bin"]
+    assert len(step._workers) == 4
+
+
+def test_same_file_uploads_serialized(uploads, make_step, request_upload):
+    step = make_step(4)
+    first = request_upload("output.log")
+    step._event_queue.put(first)
+    assert uploads.wait_started(1) == ["output.log"]
+    release = uploads.release["output.log"]
+    second = request_upload("output.log")
+    step._event_queue.put(second)
+    step._event_queue.put(request_upload("other.txt"))
+    assert uploads.wait_started(1) == ["other.txt"]
+    assert step.pending_count() == 1
+    release.set()
+    assert uploads.wait_started(1) == ["output.log"]
+    for event in uploads.release.values():
+        event.set()
+
+
+def test_finish_after_uploads(uploads, make_step, request_upload):
+    step = make_step(2)
+    for i in range(8):
+        step._event_queue.put(request_upload("file%d.txt" % i))
+        uploads.release["file%d.txt" % i].set()
+    finished = threading.Event()
+    step._event_queue.put(step_upload.RequestFinish(finished.set))
+    assert finished.wait(10)
+    assert len(uploads.wait_started(8)) == 8
+    assert len(step._workers) == 2
+    assert not step._step_upload_urls.is_alive()
+
+
+def test_job_error_keeps_workers(uploads, make_step, request_upload, save_file):
+    step = make_step(1)
+    step._api.create_artifact_manifest.side_effect = Exception("boom")
+    for i in range(2):
+        save_name = "manifest%d.json" % i
+        step._event_queue.put(
+            step_upload.RequestUpload(
+                save_file(save_name, "{}"), save_name, None, "x", False, None, None
+            )
+        )
+    for i in range(3):
+        step._event_queue.put(request_upload("file%d.txt" % i))
+        uploads.release["file%d.txt" % i].set()
+    finished = threading.Event()
+    step._event_queue.put(step_upload.RequestFinish(finished.set))
+    assert finished.wait(10)
+    assert len(uploads.wait_started(3)) == 3
+    assert step._api.create_artifact_manifest.call_count == 2
+
+
+def test_completed_files(uploads, make_step, request_upload):
+    step = make_step(2)
+
+    def fail(progress):
+        raise Exception("upload failed")
+
+    for save_name in ["done.txt", "failed.txt", "skipped.txt"]:
+        step._stats.init_file(save_name, 10)
+    step._event_queue.put(request_upload("done.txt"))
+    uploads.release["done.txt"].set()
+    step._event_queue.put(request_upload("failed.txt")._replace(save_fn=fail))
+    finished = threading.Event()
+    step._event_queue.put(step_upload.RequestFinish(finished.set))
+    assert finished.wait(10)
+    # skipped.txt never reached the upload step, like a file whose copy failed
+    assert step._stats.completed_files() == {"done.txt"}
@@ -0,0 +1,85 @@
+"""step_upload_urls tests."""
+
+import os
+import threading
+
+import pytest
+import wandb
+from wandb.filesync import stats
+from wandb.filesync import step_upload_urls
+
+try:
+    from unittest import mock
+except ImportError:  # TODO: this is only for python2
+    import mock
+
+
+def upload_urls(project, files):
+    result = {name: {"name": name, "url": "https://url/" + name} for name in files}
+    return "bucket", ["X-Header: 1"], result
+
+
+@pytest.fixture
+def step():
+    api = mock.Mock()
+    api.get_project.return_value = "project"
+    api.upload_urls.side_effect = upload_urls
+    step = step_upload_urls.StepUploadUrls(api, stats.Stats(), 1, 0.5, 100)
+    step.start()
+    yield step
+    step.shutdown()
+
+
+def fetch_all(step, save_names):
+    responses = {}
+
+    def fetch(save_name):
+        try:
+            responses[save_name] = step.upload_url(save_name)
+        except Exception as e:
+            responses[save_name] = e
+
+    threads = [threading.Thread(target=fetch, args=(n,)) for n in save_names]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return responses
+
+
+def test_upload_urls_batched(step):
+    save_names = ["media/images/%d.png" % i for i in range(64)]
+    responses = fetch_all(step, save_names)
+    assert responses == {
+        name: ("https://url/" + name, ["X-Header: 1"]) for name in save_names
+    }
+    assert step._api.upload_urls.call_count == 1
+    summary = step._stats.summary()
+    assert summary["upload_url_batches"] == 1
+    assert summary["upload_url_files"] == 64
+    assert summary["upload_url_max_batch"] == 64
+
+
+def test_upload_urls_error(step):
+    step._api.upload_urls.side_effect = wandb.errors.CommError("no run")
+    responses = fetch_all(step, ["a.txt", "b.txt"])
+    assert all(isinstance(r, wandb.errors.CommError) for r in responses.values())
+
+    # urls missing from the response fail just their request
+    step._api.upload_urls.side_effect = lambda project, files: upload_urls(
+        project, ["a.txt"]
+    )
+    responses = fetch_all(step, ["a.txt", "b.txt"])
+    assert responses["a.txt"].upload_url == "https://url/a.txt"
+    assert isinstance(responses["b.txt"], KeyError)
+
+
+def test_upload_urls_run_files(live_mock_server, test_settings):
+    run = wandb.init(settings=test_settings)
+    for i in range(20):
+        with open(os.path.join(run.dir, "file_%d.txt" % i), "w") as f:
+            f.write("data")
+    run.finish()
+    batches = live_mock_server.get_ctx()["upload_urls_batches"]
+    assert sum(batches) >= 20
+    assert max(batches) > 1
@@ -2,6 +2,8 @@
 telemetry full tests.
 """
 
+import time
+
 import wandb
 
 try:
@@ -34,3 +36,24 @@ def test_telemetry_imports_hf(live_mock_server, parse_ctx):
     # hf in finish modules but not in init modules
     assert telemetry and 11 not in telemetry.get("1", [])
     assert telemetry and 11 in telemetry.get("2", [])
+
+
+def test_telemetry_file_stream(live_mock_server, parse_ctx):
+    run = wandb.init()
+    for i in range(10):
+        run.log(dict(i=i))
+    # let the file stream post the history before the run finishes
+    deadline = time.time() + 30
+    while not any(
+        "wandb-history.jsonl" in (request.get("files") or {})
+        for request in live_mock_server.get_ctx().get("file_stream", [])
+    ):
+        assert time.time() < deadline, "history was not posted"
+        time.sleep(0.1)
+    run.finish()
+
+    ctx_util = parse_ctx(live_mock_server.get_ctx())
+    telemetry = ctx_util.telemetry
+
+    # file stream requests in flight
+    assert telemetry and telemetry.get("10", {}).get("4", 0) >= 1
@@ -0,0 +1,255 @@
+"""chunked upload_file tests against a local storage stand-in."""
+
+import base64
+import hashlib
+import os
+import threading
+
+import pytest
+import requests
+from six.moves.BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+from six.moves.socketserver import ThreadingMixIn
+from six.moves.urllib.parse import parse_qs, urlparse
+from wandb.sdk.internal import internal_api
+from wandb.sdk.lib import retry
+
+CHUNK = 1000
+SIZE = 5500
+
+
+class Storage(object):
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.objects = {}
+        self.sessions = {}
+        self.blocks = {}
+        # request kinds to fail once with a 503, like "chunk:2000" or "block:3"
+        self.fail = set()
+        # request kinds to always fail with a 403
+        self.forbid = set()
+        self.requests = []
+        # blob properties set by block list commits, by path
+        self.properties = {}
+
+    def should_fail(self, kind):
+        with self.lock:
+            self.requests.append(kind)
+            if kind in self.fail:
+                self.fail.remove(kind)
+                return True
+        return False
+
+    def forbidden(self, kind):
+        return kind in self.forbid
+
+
+class Handler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def _respond(self, status, headers=None):
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _body(self):
+        return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+    def do_POST(self):
+        storage = self.server.storage
+        self._body()
+        if self.headers.get("x-goog-resumable") != "start":
+            return self._respond(403)
+        session = "/session/%d" % len(storage.sessions)
+        storage.sessions[session] = (urlparse(self.path).path, b"")
+        location = "http://%s:%d%s" % (
+            self.server.server_address[0],
+            self.server.server_address[1],
+            session,
+        )
+        self._respond(201, {"Location": location})
+
+    def do_PUT(self):
+        storage = self.server.storage
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        data = self._body()
+        if url.path in storage.sessions:
+            name, stored = storage.sessions[url.path]
+            first, total = self.headers["Content-Range"].split(" ")[1].split("/")
+            if first != "*":
+                start = int(first.split("-")[0])
+                if storage.should_fail("chunk:%d" % start):
+                    # only half of the chunk made it
+                    stored = stored[:start] + data[: len(data) // 2]
+                    storage.sessions[url.path] = (name, stored)
+                    return self._respond(503)
+                stored = stored[:start] + data
+                storage.sessions[url.path] = (name, stored)
+            if len(stored) == int(total):
+                storage.objects[name] = stored
+                return self._respond(200)
+            headers = {"Range": "bytes=0-%d" % (len(stored) - 1)} if stored else {}
+            return self._respond(308, headers)
+        # like azure, a Content-MD5 is checked against the request body
+        md5 = self.headers.get("Content-MD5")
+        if md5 and md5 != base64.b64encode(hashlib.md5(data).digest()).decode():
+            return self._respond(400)
+        if query.get("comp") == ["block"]:
+            block = int(base64.b64decode(query["blockid"][0]))
+            if storage.should_fail("block:%d" % block):
+                return self._respond(503)
+            if storage.forbidden("block:%d" % block):
+                return self._respond(403)
+            storage.blocks[(url.path, block)] = data
+            return self._respond(201)
+        if query.get("comp") == ["blocklist"]:
+            storage.should_fail("blocklist")
+            ids = [
+                int(base64.b64decode(block_id))
+                for block_id in data.decode().split("<Latest>")[1:]
+                for block_id in [block_id.split("</Latest>")[0]]
+            ]
+            storage.objects[url.path] = b"".join(
+                storage.blocks[(url.path, i)] for i in ids
+            )
+            storage.properties[url.path] = {
+                key.lower(): value
+                for key, value in self.headers.items()
+                if key.lower().startswith("x-ms-")
+            }
+            return self._respond(201)
+        storage.should_fail("put")
+        storage.objects[url.path] = data
+        self._respond(200)
+
+
+class Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+@pytest.fixture
+def storage():
+    server = Server(("127.0.0.1", 0), Handler)
+    server.storage = Storage()
+    server.url = "http://127.0.0.1:%d" % server.server_address[1]
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def api(mocker):
+    api = internal_api.Api(load_settings=False)
+    api.UPLOAD_CHUNK_BYTES = CHUNK
+    mocker.patch("wandb.util.sentry_reraise", side_effect=lambda e: _raise(e))
+    return api
+
+
+def _raise(e):
+    raise e
+
+
+@pytest.fixture
+def data_file(tmpdir):
+    data = os.urandom(SIZE)
+    path = str(tmpdir.join("data.bin"))
+    with open(path, "wb") as f:
+        f.write(data)
+    return path, data
+
+
+def upload(api, url, path, headers):
+    """Upload, calling upload_file again after each transient error."""
+    progress = []
+    for _ in range(10):
+        try:
+            with open(path, "rb") as f:
+                api.upload_file(
+                    url,
+                    f,
+                    lambda bites, total: progress.append(total),
+                    extra_headers=headers,
+                )
+            return progress
+        except retry.TransientException:
+            pass
+    raise AssertionError("upload did not finish")
+
+
+def test_upload_resumable(api, storage, data_file):
+    path, data = data_file
+    storage.storage.fail = {"chunk:2000", "chunk:4000"}
+    progress = upload(
+        api, storage.url + "/obj?sig=1", path, {"X-Goog-Resumable": "start"}
+    )
+    assert storage.storage.objects["/obj"] == data
+    assert progress[-1] == SIZE
+    # retries resumed the session after the bytes the storage kept
+    requests = storage.storage.requests
+    assert requests.count("chunk:0") == 1
+    assert "chunk:2500" in requests and "chunk:4500" in requests
+    assert api._upload_sessions == {}
+
+
+def test_upload_blocks(api, storage, data_file):
+    path, data = data_file
+    storage.storage.fail = {"block:1", "block:4"}
+    progress = upload(
+        api, storage.url + "/blob?sig=1", path, {"x-ms-blob-type": "BlockBlob"}
+    )
+    assert storage.storage.objects["/blob"] == data
+    assert progress[-1] == SIZE
+    # only the failed blocks were uploaded again
+    requests = storage.storage.requests
+    assert sorted(r for r in requests if r.startswith("block:")) == sorted(
+        ["block:%d" % i for i in range(6)] + ["block:1", "block:4"]
+    )
+    assert requests.count("blocklist") == 1
+    assert api._upload_sessions == {}
+
+
+def test_upload_blocks_blob_properties(api, storage, data_file):
+    path, data = data_file
+    md5 = base64.b64encode(hashlib.md5(data).digest()).decode()
+    upload(
+        api,
+        storage.url + "/blob?sig=1",
+        path,
+        {
+            "x-ms-blob-type": "BlockBlob",
+            "Content-MD5": md5,
+            "Content-Type": "application/octet-stream",
+            "x-ms-meta-name": "data.bin",
+        },
+    )
+    assert storage.storage.objects["/blob"] == data
+    # the whole file's md5 and type are set when the block list is committed
+    assert storage.storage.properties["/blob"] == {
+        "x-ms-blob-content-md5": md5,
+        "x-ms-blob-content-type": "application/octet-stream",
+        "x-ms-meta-name": "data.bin",
+    }
+
+
+def test_upload_blocks_permanent_failure(api, storage, data_file):
+    path, _ = data_file
+    storage.storage.forbid = {"block:2"}
+    with pytest.raises(requests.exceptions.HTTPError):
+        upload(api, storage.url + "/blob?sig=1", path, {"x-ms-blob-type": "BlockBlob"})
+    assert api._upload_sessions == {}
+
+
+def test_upload_single_put(api, storage, data_file):
+    """Urls not signed for chunked uploads, and small files, are put at once."""
+    path, data = data_file
+    upload(api, storage.url + "/plain", path, {})
+    api.UPLOAD_CHUNK_BYTES = SIZE
+    upload(api, storage.url + "/small", path, {"X-Goog-Resumable": "start"})
+    assert storage.storage.objects["/plain"] == data
+    assert storage.storage.requests == ["put", "put"]
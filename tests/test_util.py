@@ -290,3 +290,13 @@ def test_matplotlib_to_plotly():
     fig = utils.matplotlib_without_image()
     assert type(util.matplotlib_to_plotly(plt)) == plotly.graph_objs._figure.Figure
     plt.close()
+
+
+def test_json_friendly_scalars():
+    row = {"a": 1, "b": 0.5, "c": "x", "d": None, "e": True}
+    assert util.json_friendly_scalars(row) is row
+    assert util.json_friendly_scalars(
+        {"a": numpy.int32(1), "b": numpy.float32("nan"), "c": numpy.float64(0.5)}
+    ) == {"a": 1, "b": None, "c": 0.5}
+    assert util.json_friendly_scalars({"a": 1, "b": [1, 2]}) is None
+    assert util.json_friendly_scalars({"a": numpy.ones(3)}) is None
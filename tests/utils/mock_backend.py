@@ -82,13 +82,21 @@ class BackendMock(object):
             d[item.key] = json.loads(item.value_json)
         return d
 
+    def _history_to_dict(self, history):
+        if history.row_json:
+            hist = json.loads(history.row_json)
+        else:
+            hist = self._proto_to_dict(history.item)
+        # handle case where step is not passed in items
+        if history.HasField("step"):
+            hist["_step"] = history.step.num
+        return hist
+
     def _publish(self, rec):
-        if len(rec.history.item) > 0:
-            hist = self._proto_to_dict(rec.history.item)
-            # handle case where step is not passed in items
-            if rec.history.HasField("step"):
-                hist["_step"] = rec.history.step.num
-            self.history.append(hist)
+        if rec.history.row_json or len(rec.history.item) > 0:
+            self.history.append(self._history_to_dict(rec.history))
+        for history in rec.history_batch.history:
+            self.history.append(self._history_to_dict(history))
         if len(rec.summary.update) > 0:
             self.summary.update(self._proto_to_dict(rec.summary.update))
         if len(rec.files.files) > 0:
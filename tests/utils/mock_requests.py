@@ -1,5 +1,6 @@
 import json
 import threading
+import zlib
 import requests
 
 
@@ -131,9 +132,20 @@ class RequestsMock(object):
             if inject.requests_error:
                 raise requests.exceptions.RetryError()
 
+    def _request_body(self, kwargs):
+        body = kwargs.get("json")
+        data = kwargs.get("data")
+        headers = kwargs.get("headers") or {}
+        if body is None and isinstance(data, bytes):
+            if headers.get("Content-Encoding") == "gzip":
+                data = zlib.decompress(data, 16 + zlib.MAX_WBITS)
+            if headers.get("Content-Type") == "application/json":
+                body = json.loads(data.decode("utf-8"))
+        return body
+
     def post(self, url, **kwargs):
         self._inject("post", url, kwargs)
-        self._store_request(url, kwargs.get("json"))
+        self._store_request(url, self._request_body(kwargs))
         return ResponseMock(self.client.post(url, **self._clean_kwargs(kwargs)))
 
     def put(self, url, **kwargs):
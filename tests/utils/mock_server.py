@@ -5,6 +5,7 @@ import os
 import sys
 from datetime import datetime, timedelta
 import json
+import zlib
 import yaml
 import six
 
@@ -327,29 +328,30 @@ def create_app(user_ctx=None):
             ctx["upsert_bucket_count"] += 1
 
         if body["variables"].get("files"):
-            requested_file = body["variables"]["files"][0]
-            ctx["requested_file"] = requested_file
-            url = base_url + "/storage?file={}&run={}".format(
-                urllib.parse.quote(requested_file), ctx["current_run"]
-            )
+            requested_files = body["variables"]["files"]
+            ctx["requested_file"] = requested_files[0]
+            ctx.setdefault("upload_urls_batches", []).append(len(requested_files))
+            edges = []
+            for requested_file in requested_files:
+                url = base_url + "/storage?file={}&run={}".format(
+                    urllib.parse.quote(requested_file), ctx["current_run"]
+                )
+                edges.append(
+                    {
+                        "node": {
+                            "name": requested_file,
+                            "url": url,
+                            "directUrl": url + "&direct=true",
+                        }
+                    }
+                )
             return json.dumps(
                 {
                     "data": {
                         "model": {
                             "bucket": {
                                 "id": "storageid",
-                                "files": {
-                                    "uploadHeaders": [],
-                                    "edges": [
-                                        {
-                                            "node": {
-                                                "name": requested_file,
-                                                "url": url,
-                                                "directUrl": url + "&direct=true",
-                                            }
-                                        }
-                                    ],
-                                },
+                                "files": {"uploadHeaders": [], "edges": edges},
                             }
                         }
                     }
@@ -1090,7 +1092,12 @@ index 30d74d2..9a2c773 100644
     def file_stream(entity, project, run):
         ctx = get_ctx()
         ctx["file_stream"] = ctx.get("file_stream", [])
-        ctx["file_stream"].append(request.get_json())
+        if request.headers.get("Content-Encoding") == "gzip":
+            ctx["file_stream_gzip"] = ctx.get("file_stream_gzip", 0) + 1
+            body = json.loads(zlib.decompress(request.get_data(), 16 + zlib.MAX_WBITS))
+        else:
+            body = request.get_json()
+        ctx["file_stream"].append(body)
         response = json.dumps({"exitcode": None, "limits": {}})
 
         inject = InjectRequestsParse(ctx).find(request=request)
@@ -18,8 +18,13 @@ def fixture_path(path):
 
 def first_filestream(ctx):
     """In xdist tests sometimes rougue file_streams make it to the server,
-    we grab the first request with `files`"""
-    return next(m for m in ctx["file_stream"] if m.get("files"))
+    we grab the first request with `files`.  Files can be streamed in separate
+    requests, so each file is taken from the first request containing it."""
+    files = {}
+    for m in ctx["file_stream"]:
+        for name, data in six.iteritems(m.get("files") or {}):
+            files.setdefault(name, data)
+    return dict(files=files)
 
 
 def fixture_open(path, mode="r"):
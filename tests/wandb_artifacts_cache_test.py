@@ -2,6 +2,9 @@ import os
 import base64
 import time
 import random
+import shutil
+import sqlite3
+import sys
 from multiprocessing import Pool
 
 from wandb import wandb_sdk
@@ -110,6 +113,11 @@ def test_artifacts_cache_cleanup_tmp_files(runner):
         os.makedirs(path)
         with open(os.path.join(path, "tmp_abc"), "w") as f:
             f.truncate(1000)
+        stale = time.time() - 2 * 24 * 60 * 60
+        os.utime(os.path.join(path, "tmp_abc"), (stale, stale))
+        # may still be written to by another process
+        with open(os.path.join(path, "tmp_def"), "w") as f:
+            f.truncate(500)
 
         cache = wandb_sdk.wandb_artifacts.ArtifactsCache("cache")
 
@@ -118,3 +126,232 @@ def test_artifacts_cache_cleanup_tmp_files(runner):
         reclaimed_bytes = cache.cleanup(10000)
 
         assert reclaimed_bytes == 1000
+        assert os.listdir(path) == ["tmp_def"]
+        # the index is built once, stale tmp files are removed every time
+        os.utime(os.path.join(path, "tmp_def"), (stale, stale))
+        assert cache.cleanup(10000) == 500
+
+
+def _write_old(path, contents):
+    with open(path, "w") as f:
+        f.write(contents)
+    mtime = time.time() - 60
+    os.utime(path, (mtime, mtime))
+
+
+def test_md5_file_b64_cached(runner, mocker):
+    with runner.isolated_filesystem():
+        cache = wandb_sdk.wandb_artifacts.ArtifactsCache("cache")
+        _write_old("data.txt", "abc")
+        md5_file_b64 = mocker.spy(wandb_sdk.interface.artifacts, "md5_file_b64")
+
+        assert cache.md5_file_b64("data.txt") == "kAFQmDzST7DWlj99KOF/cg=="
+        assert cache.md5_file_b64("data.txt") == "kAFQmDzST7DWlj99KOF/cg=="
+        # a new cache in the same directory reads the digests on disk
+        cache = wandb_sdk.wandb_artifacts.ArtifactsCache("cache")
+        assert cache.md5_file_b64("data.txt") == "kAFQmDzST7DWlj99KOF/cg=="
+        assert md5_file_b64.call_count == 1
+
+        _write_old("data.txt", "abcd")
+        assert cache.md5_file_b64("data.txt") == "4vxxTEcn7pOV8yTNLn8zHw=="
+        assert md5_file_b64.call_count == 2
+
+
+def test_md5_file_b64_recent_and_strict(runner, mocker, monkeypatch):
+    with runner.isolated_filesystem():
+        cache = wandb_sdk.wandb_artifacts.ArtifactsCache("cache")
+        md5_file_b64 = mocker.spy(wandb_sdk.interface.artifacts, "md5_file_b64")
+
+        # files modified just now could change again with the same mtime
+        with open("recent.txt", "w") as f:
+            f.write("abc")
+        cache.md5_file_b64("recent.txt")
+        cache.md5_file_b64("recent.txt")
+        assert md5_file_b64.call_count == 2
+
+        _write_old("data.txt", "abc")
+        cache.md5_file_b64("data.txt")
+        monkeypatch.setenv("WANDB_ARTIFACT_STRICT_DIGESTS", "true")
+        cache.md5_file_b64("data.txt")
+        assert md5_file_b64.call_count == 4
+
+
+def test_file_hasher_cached_digests(runner, mocker, monkeypatch):
+    monkeypatch.setattr(
+        wandb_sdk.wandb_artifacts.ArtifactsCache, "_DIGEST_LOOKUP_BATCH", 2
+    )
+    with runner.isolated_filesystem():
+        cache = wandb_sdk.wandb_artifacts.ArtifactsCache("cache")
+        hasher = wandb_sdk.interface.artifacts.FileHasher(cache, processes=0)
+        paths = ["data%d.txt" % i for i in range(5)]
+        for i, path in enumerate(paths):
+            _write_old(path, "data %d" % i)
+        digests = hasher.md5_files_b64(paths)
+        md5_file_b64 = mocker.spy(wandb_sdk.interface.artifacts, "md5_file_b64")
+
+        assert hasher.md5_files_b64(paths) == digests
+        assert md5_file_b64.call_count == 0
+        _write_old(paths[3], "changed")
+        assert hasher.md5_files_b64(paths)[3] != digests[3]
+        assert md5_file_b64.call_count == 1
+
+
+def test_file_hasher_processes_opt_in(monkeypatch):
+    monkeypatch.delenv("WANDB_ARTIFACT_HASH_PROCESSES", raising=False)
+    assert wandb_sdk.interface.artifacts.FileHasher()._processes == 0
+    monkeypatch.setenv("WANDB_ARTIFACT_HASH_PROCESSES", "4")
+    expected = 4 if sys.platform.startswith("linux") else 0
+    assert wandb_sdk.interface.artifacts.FileHasher()._processes == expected
+
+
+def test_artifacts_cache_cleanup_keeps_digests(runner):
+    with runner.isolated_filesystem():
+        cache = wandb_sdk.wandb_artifacts.ArtifactsCache("cache")
+        _write_old("data.txt", "abc")
+        cache.md5_file_b64("data.txt")
+
+        cache.cleanup(0)
+
+        assert os.path.isfile(os.path.join("cache", "index.db"))
+
+
+def _write_obj(cache, etag, size=10):
+    _, _, opener = cache.check_etag_obj_path(etag, size)
+    with opener() as f:
+        f.write("x" * size)
+
+
+def _cache_size_writer(args):
+    cache_path, i = args
+    cache = wandb_sdk.wandb_artifacts.ArtifactsCache(cache_path, max_size=100)
+    for j in range(10):
+        _write_obj(cache, "%04d%04d" % (i, j))
+
+
+def test_check_obj_path_indexed(runner, mocker):
+    with runner.isolated_filesystem():
+        cache = wandb_sdk.wandb_artifacts.ArtifactsCache("cache")
+        _write_obj(cache, "abcdef")
+
+        getsize = mocker.spy(os.path, "getsize")
+        path, hit, _ = cache.check_etag_obj_path("abcdef", 10)
+        assert hit is True
+        assert path == os.path.join("cache", "obj", "etag", "ab", "cdef")
+        _, hit, _ = cache.check_etag_obj_path("abcdef", 11)
+        assert hit is False
+        assert getsize.call_count == 0
+
+
+def test_check_obj_path_removed(runner):
+    with runner.isolated_filesystem():
+        cache = wandb_sdk.wandb_artifacts.ArtifactsCache("cache")
+        _write_obj(cache, "abcdef")
+        _write_obj(cache, "abcd01")
+
+        shutil.rmtree(os.path.join("cache", "obj"))
+
+        _, hit, opener = cache.check_etag_obj_path("abcdef", 10)
+        assert hit is False
+        with opener() as f:
+            f.write("x" * 10)
+        assert cache.check_etag_obj_path("abcdef", 10)[1] is True
+        assert cache.check_etag_obj_path("abcd01", 10)[1] is False
+        assert cache.cleanup(0) == 10
+
+
+def test_check_obj_path_adopts_unindexed(runner):
+    with runner.isolated_filesystem():
+        os.makedirs(os.path.join("cache", "obj", "etag", "ab"))
+        with open(os.path.join("cache", "obj", "etag", "ab", "cdef"), "w") as f:
+            f.write("x" * 10)
+        cache = wandb_sdk.wandb_artifacts.ArtifactsCache("cache")
+
+        _, hit, _ = cache.check_etag_obj_path("abcdef", 10)
+        assert hit is True
+        assert cache.cleanup(5) == 10
+
+
+def test_artifacts_cache_max_size_evicts_lru(runner, monkeypatch):
+    monkeypatch.setattr(
+        wandb_sdk.wandb_artifacts.ArtifactsCache, "_ACCESS_RESOLUTION_SECONDS", 0
+    )
+    with runner.isolated_filesystem():
+        cache = wandb_sdk.wandb_artifacts.ArtifactsCache("cache", max_size=25)
+        _write_obj(cache, "aa01")
+        _write_obj(cache, "bb01")
+        time.sleep(0.01)
+        assert cache.check_etag_obj_path("aa01", 10)[1] is True
+        _write_obj(cache, "cc01")
+
+        assert cache.check_etag_obj_path("aa01", 10)[1] is True
+        assert cache.check_etag_obj_path("cc01", 10)[1] is True
+        assert not os.path.exists(os.path.join("cache", "obj", "etag", "bb", "01"))
+        assert cache.cleanup(25) == 0
+        assert cache.cleanup(15) == 10
+
+
+def test_artifacts_cache_max_size_env(runner, monkeypatch):
+    from wandb.sdk.interface import artifacts
+
+    with runner.isolated_filesystem():
+        monkeypatch.setenv("WANDB_CACHE_DIR", os.getcwd())
+        for human_size, max_size in (("10MB", 10 * 1000 * 1000), ("lots", None)):
+            monkeypatch.setattr(artifacts, "_artifacts_cache", None)
+            monkeypatch.setenv("WANDB_ARTIFACT_CACHE_MAX_SIZE", human_size)
+            assert artifacts.get_artifacts_cache().max_size == max_size
+
+
+def test_artifacts_cache_max_size_keeps_pinned(runner):
+    with runner.isolated_filesystem():
+        cache = wandb_sdk.wandb_artifacts.ArtifactsCache("cache", max_size=15)
+        digests = []
+        for i in range(3):
+            digest = base64.b64encode(("digest%d" % i).encode("ascii")).decode()
+            digests.append(digest)
+            cache.pin_md5_objs([digest])
+            _, _, opener = cache.check_md5_obj_path(digest, 10)
+            with opener() as f:
+                f.write("x" * 10)
+        _write_obj(cache, "abcdef")
+
+        assert all(cache.check_md5_obj_path(d, 10)[1] for d in digests)
+        assert cache.check_etag_obj_path("abcdef", 10)[1] is True
+        assert cache.cleanup(0) == 10
+
+        cache.unpin_md5_objs(digests[:2])
+        assert cache.cleanup(15) == 20
+        cache.unpin_md5_objs(digests[2:])
+        assert cache.cleanup(0) == 10
+
+
+def test_artifacts_cache_index_busy(runner, monkeypatch):
+    monkeypatch.setattr(wandb_sdk.wandb_artifacts.ArtifactsCache, "_INDEX_TIMEOUT", 0.1)
+    with runner.isolated_filesystem():
+        cache = wandb_sdk.wandb_artifacts.ArtifactsCache("cache")
+        _write_obj(cache, "abcdef")
+        conn = sqlite3.connect(os.path.join("cache", "index.db"))
+        conn.execute("BEGIN IMMEDIATE")
+
+        _write_obj(cache, "abcd01")
+        assert cache.cleanup(0) == 0
+
+        conn.rollback()
+        conn.close()
+        assert not cache._index_disabled
+        assert cache.cleanup(0) == 20
+
+
+def test_artifacts_cache_max_size_parallel(runner):
+    with runner.isolated_filesystem() as t:
+        cache_path = os.path.join(t, "cache")
+        p = Pool(4)
+        p.map(_cache_size_writer, [(cache_path, i) for i in range(4)])
+        p.close()
+        p.join()
+
+        files = []
+        for root, _, names in os.walk(os.path.join(cache_path, "obj")):
+            files.extend(os.path.join(root, name) for name in names)
+        assert len(files) == 10
+        cache = wandb_sdk.wandb_artifacts.ArtifactsCache(cache_path)
+        assert cache.cleanup(0) == 100
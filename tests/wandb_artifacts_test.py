@@ -1,5 +1,6 @@
 import base64
 import hashlib
+import json
 import os
 import sys
 import pytest
@@ -190,6 +191,47 @@ def test_add_named_dir(runner):
         }
 
 
+def test_add_nested_dir_many_files(runner, monkeypatch):
+    monkeypatch.setattr(
+        wandb.wandb_sdk.interface.artifacts.FileHasher, "BATCH_FILES", 4
+    )
+    monkeypatch.setattr(
+        wandb.wandb_sdk.interface.artifacts.FileHasher, "MIN_PROCESS_FILES", 8
+    )
+    monkeypatch.setenv("WANDB_ARTIFACT_HASH_PROCESSES", "2")
+    with runner.isolated_filesystem():
+        os.makedirs("data/nest")
+        for i in range(10):
+            open("data/file%d.txt" % i, "w").write("hello %d" % i)
+            open("data/nest/file%d.txt" % i, "w").write("nested %d" % i)
+        with open("data/big.bin", "wb") as f:
+            f.write(b"x" * (2 * 1024 * 1024))
+        artifact = wandb.Artifact(type="dataset", name="my-arty")
+        artifact.add_dir("data")
+
+        manifest = artifact.manifest.to_manifest_json()
+        assert len(manifest["contents"]) == 21
+        for path, entry in manifest["contents"].items():
+            assert entry["digest"] == wandb.wandb_sdk.interface.artifacts.md5_file_b64(
+                os.path.join("data", path)
+            )
+
+
+def test_walk_files(runner):
+    with runner.isolated_filesystem():
+        os.makedirs("a/b/c")
+        for path in ["x.txt", "a/y.txt", "a/b/c/z.txt"]:
+            open(path, "w").write("hi")
+        os.symlink("a", "link")
+
+        walked = wandb.wandb_sdk.interface.artifacts.walk_files(".")
+        assert sorted(walked) == ["./a/b/c/z.txt", "./a/y.txt", "./x.txt"]
+        walked = wandb.wandb_sdk.interface.artifacts.walk_files(
+            ".", follow_symlinks=True
+        )
+        assert len(list(walked)) == 5
+
+
 def test_add_reference_local_file(runner):
     with runner.isolated_filesystem():
         open("file1.txt", "w").write("hello")
@@ -926,6 +968,105 @@ def test_interface_commit_hash(runner):
         artifact.commit_hash()
 
 
+def _manifest_json(contents):
+    return {
+        "version": 1,
+        "storagePolicy": "wandb-storage-policy-v1",
+        "storagePolicyConfig": {"storageLayout": "V2"},
+        "contents": contents,
+    }
+
+
+def test_manifest_from_stream():
+    manifest_json = _manifest_json(
+        {
+            "a.txt": {"digest": "kAFQmDzST7DWlj99KOF/cg==", "size": 3},
+            "dir/é.bin": {
+                "digest": "vzHtPzmBTSKbbSg8p4F5cg==",
+                "birthArtifactID": "QXJ0aWZhY3Q6MQ==",
+                "size": 12345678901,
+            },
+            "ref.wav": {
+                "digest": "a90eb05f7aef652b3bdd957c67b7213a",
+                "ref": "s3://bucket/ref.wav",
+                "extra": {"versionID": "1"},
+            },
+        }
+    )
+    text = json.dumps(manifest_json, ensure_ascii=False).encode("utf-8")
+    chunks = [text[i : i + 7] for i in range(0, len(text), 7)]
+    manifest = wandb.wandb_sdk.interface.artifacts.ArtifactManifest.from_manifest_stream(
+        None, chunks
+    )
+    assert manifest.to_manifest_json() == manifest_json
+    loaded = wandb.wandb_sdk.interface.artifacts.ArtifactManifest.from_manifest_json(
+        None, manifest_json
+    )
+    assert manifest.digest() == loaded.digest()
+
+    entry = manifest.entries["dir/é.bin"]
+    assert entry.size == 12345678901
+    entry.birth_artifact_id = "QXJ0aWZhY3Q6Mg=="
+    assert manifest.entries["dir/é.bin"].birth_artifact_id == "QXJ0aWZhY3Q6Mg=="
+    assert manifest.entries["ref.wav"].ref_target() == "s3://bucket/ref.wav"
+
+
+def test_iter_json_object_split_everywhere():
+    iter_json_object = wandb.wandb_sdk.interface.artifacts.iter_json_object
+    text = (
+        '{"a": 1.5, "b": -2.25e+10, "c": 3E-2, "d": 12, "e": -0.0, "f": [1e5, 7],'
+        ' "g": true, "h": null, "i": "x\\u00e9y"}'
+    )
+    expected = list(json.loads(text).items())
+    for i in range(1, len(text)):
+        for j in range(i, len(text)):
+            chunks = [text[:i], text[i:j], text[j:]]
+            assert list(iter_json_object(chunks)) == expected, chunks
+
+
+def test_manifest_from_stream_invalid():
+    from_stream = (
+        wandb.wandb_sdk.interface.artifacts.ArtifactManifest.from_manifest_stream
+    )
+    for text in ['{"version": 1', '{"version": 1} []', "[]", '{"version": 1,}']:
+        with pytest.raises(ValueError):
+            from_stream(None, [text])
+
+
+def test_manifest_entries():
+    contents = {
+        "b.txt": {"digest": "vzHtPzmBTSKbbSg8p4F5cg==", "size": 1},
+        "a.txt": {"digest": "kAFQmDzST7DWlj99KOF/cg==", "size": 2},
+        "c.txt": {"digest": "not-an-md5", "size": 3},
+    }
+    manifest = wandb.wandb_sdk.interface.artifacts.ArtifactManifest.from_manifest_json(
+        None, _manifest_json(contents)
+    )
+    entries = manifest.entries
+    assert list(entries) == ["b.txt", "a.txt", "c.txt"]
+    assert [e.path for e in manifest.sorted_entries()] == ["a.txt", "b.txt", "c.txt"]
+    assert {k: v.digest for k, v in entries.items()} == {
+        k: v["digest"] for k, v in contents.items()
+    }
+    assert "b.txt" in entries and "d.txt" not in entries
+
+    manifest.add_entry(
+        wandb.wandb_sdk.wandb_artifacts.ArtifactManifestEntry(
+            "bb.txt", None, digest="digest", size=4
+        )
+    )
+    del entries["b.txt"]
+    assert len(entries) == 3
+    assert "b.txt" not in entries
+    assert [e.path for e in manifest.sorted_entries()] == ["a.txt", "bb.txt", "c.txt"]
+    with pytest.raises(ValueError):
+        manifest.add_entry(
+            wandb.wandb_sdk.wandb_artifacts.ArtifactManifestEntry(
+                "a.txt", None, digest="other", size=2
+            )
+        )
+
+
 # this test hangs, which seems to be the result of incomplete mocks.
 # would be worth returning to it in the future
 # def test_artifact_incremental(runner, live_mock_server, parse_ctx, test_settings):
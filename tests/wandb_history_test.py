@@ -30,3 +30,15 @@ def test_row_update(mocked_run):
     h._set_callback(m.callback)
     h._row_update(dict(this=2))
     assert m.row is None
+
+
+def test_rows_add(mocked_run):
+    batches = []
+    h = wandb_sdk.History(mocked_run)
+    h._set_batch_callback(lambda rows: batches.append(rows))
+    h._row_update(dict(this=1))
+    h._rows_add([dict(that=2), dict(that=3)], steps=[0, 4])
+    assert len(batches) == 1
+    assert [(row["_step"], step) for row, step in batches[0]] == [(0, 0), (4, 4)]
+    assert batches[0][0][0]["this"] == 1
+    assert h._step == 5
@@ -2,6 +2,7 @@
 config tests.
 """
 
+import json
 import os
 import sys
 import numpy as np
@@ -62,6 +63,45 @@ def test_run_pub_history(fake_run, record_q, records_util):
     # TODO(jhr): check history vals
 
 
+def test_run_pub_history_scalars(fake_run, record_q, records_util):
+    run = fake_run()
+    row = dict(
+        f=0.5, i=2, b=True, s="str", n=None, f64=np.float64(1.5), f32=np.float32(0.25)
+    )
+    run.log(dict(row, i64=np.int64(3), nan32=np.float32("nan")))
+    run.log(dict(row, nested=dict(i64=np.int64(3), nan32=np.float32("nan"))))
+
+    history = records_util(record_q).history
+    fast, generic = [json.loads(h.row_json) for h in history]
+    expected = dict(row, i64=3, nan32=None)
+    assert {k: fast[k] for k in expected} == expected
+    assert {k: generic[k] for k in row} == row
+    assert generic["nested"] == dict(i64=3, nan32=None)
+
+
+def test_run_log_many(fake_run, record_q, records_util):
+    run = fake_run()
+    run.log_many([dict(this=1), dict(this=2), dict(that=3)], steps=[0, 5, 6])
+
+    r = records_util(record_q)
+    assert len(r.records) == 1
+    batch = r.records[0].history
+    assert [h.step.num for h in batch] == [0, 5, 6]
+    assert json.loads(batch[1].row_json)["this"] == 2
+    assert run.step == 7
+
+
+def test_run_log_many_bad_steps(fake_run, record_q, records_util):
+    run = fake_run()
+    with pytest.raises(ValueError):
+        run.log_many([dict(this=1), dict(this=2)], steps=[3, 3])
+    with pytest.raises(ValueError):
+        run.log_many([dict(this=1)], steps=[1, 2])
+    with pytest.raises(ValueError):
+        run.log_many([1])
+    assert len(records_util(record_q).records) == 0
+
+
 @pytest.mark.skipif(
     platform.system() == "Windows", reason="numpy.float128 does not exist on windows"
 )
@@ -75,12 +115,7 @@ def test_numpy_high_precision_float_downcasting(fake_run, record_q, records_util
     history = r.history
     assert len(history) == 1
 
-    found = False
-    for item in history[0].item:
-        if item.key == "this":
-            assert item.value_json == "0.0"
-            found = True
-    assert found
+    assert '"this": 0.0' in history[0].row_json
 
 
 def test_log_code_settings(live_mock_server, test_settings):
@@ -6,6 +6,7 @@ import os
 import platform
 import re
 import shutil
+import stat
 import sys
 import tempfile
 
@@ -2552,21 +2553,118 @@ class ArtifactCollection(object):
         return "<ArtifactCollection {} ({})>".format(self.name, self.type)
 
 
+# artifact manifests are downloaded and parsed this many bytes at a time
+_MANIFEST_CHUNK_BYTES = 1024 * 1024
+
+# how downloaded artifact files are created from the artifacts cache, set by
+# WANDB_ARTIFACT_MATERIALIZE.  Links fall back to copies where the cache and
+# the download root are on different filesystems or links aren't supported,
+# and while WANDB_ARTIFACT_CACHE_MAX_SIZE is set: evicting a cache file would
+# break the symlinks to it, and free none of the space taken by hardlinks.
+_MATERIALIZE_STRATEGIES = ("copy", "hardlink", "reflink", "symlink")
+_LINK_STRATEGIES = ("hardlink", "symlink")
+
+# linux ioctl that makes a copy-on-write clone of a file, on btrfs, xfs, ...
+_FICLONE = 0x40049409
+
+
+def _is_materialized(cache_path, target_path, strategy):
+    if os.path.islink(target_path):
+        return strategy == "symlink" and os.readlink(target_path) == os.path.abspath(
+            cache_path
+        )
+    if not os.path.isfile(target_path):
+        return False
+    cache_stat = os.stat(cache_path)
+    target_stat = os.stat(target_path)
+    if (cache_stat.st_dev, cache_stat.st_ino) == (
+        target_stat.st_dev,
+        target_stat.st_ino,
+    ):
+        return strategy == "hardlink"
+    return cache_stat.st_mtime == target_stat.st_mtime
+
+
+def _materialize(cache_path, path, strategy):
+    if strategy in _LINK_STRATEGIES:
+        try:
+            if strategy == "hardlink":
+                os.link(cache_path, path)
+            else:
+                os.symlink(os.path.abspath(cache_path), path)
+        except (AttributeError, NotImplementedError, OSError):
+            logger.info("can't %s %s, copying it", strategy, cache_path)
+        else:
+            # writes through the link would change the cache
+            mode = os.stat(cache_path).st_mode
+            try:
+                os.chmod(
+                    cache_path, mode & ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH)
+                )
+            except OSError:
+                pass
+            return
+    elif strategy == "reflink":
+        try:
+            import fcntl
+
+            with open(cache_path, "rb") as src, open(path, "wb") as dst:
+                fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        except (ImportError, IOError, OSError):  # noqa: B014
+            logger.info("can't reflink %s, copying it", cache_path)
+        else:
+            shutil.copystat(cache_path, path)
+            _make_writable(path)
+            return
+
+    # We use copy2, which preserves file metadata including modified
+    # time (which we use above to check whether we should do the copy).
+    shutil.copy2(cache_path, path)
+    _make_writable(path)
+
+
+def _make_writable(path):
+    # the cache file is read only if it was linked before
+    mode = os.stat(path).st_mode
+    if not mode & stat.S_IWUSR:
+        os.chmod(path, mode | stat.S_IWUSR)
+
+
 class _DownloadedArtifactEntry(artifacts.ArtifactEntry):
     def __init__(self, name, entry, parent_artifact):
         self.name = name
         self.entry = entry
         self._parent_artifact = parent_artifact
 
-        # Have to copy over a bunch of variables to get this ArtifactEntry interface
-        # to work properly
-        self.path = entry.path
-        self.ref = entry.ref
-        self.digest = entry.digest
-        self.birth_artifact_id = entry.birth_artifact_id
-        self.size = entry.size
-        self.extra = entry.extra
-        self.local_path = entry.local_path
+    # The ArtifactEntry interface reads through to the manifest entry, which
+    # may itself only be a view of the manifest
+    @property
+    def path(self):
+        return self.entry.path
+
+    @property
+    def ref(self):
+        return self.entry.ref
+
+    @property
+    def digest(self):
+        return self.entry.digest
+
+    @property
+    def birth_artifact_id(self):
+        return self.entry.birth_artifact_id
+
+    @property
+    def size(self):
+        return self.entry.size
+
+    @property
+    def extra(self):
+        return self.entry.extra
+
+    @property
+    def local_path(self):
+        return self.entry.local_path
 
     def parent_artifact(self):
         return self._parent_artifact
@@ -2577,15 +2675,44 @@ class _DownloadedArtifactEntry(artifacts.ArtifactEntry):
             head, tail = os.path.splitdrive(target_path)
             target_path = head + tail.replace(":", "-")
 
-        need_copy = (
-            not os.path.isfile(target_path)
-            or os.stat(cache_path).st_mtime != os.stat(target_path).st_mtime
-        )
-        if need_copy:
-            util.mkdir_exists_ok(os.path.dirname(target_path))
-            # We use copy2, which preserves file metadata including modified
-            # time (which we use above to check whether we should do the copy).
-            shutil.copy2(cache_path, target_path)
+        strategy = env.get_artifact_materialize()
+        if strategy not in _MATERIALIZE_STRATEGIES:
+            raise ValueError(
+                "%s must be one of %s, not %s"
+                % (
+                    env.ARTIFACT_MATERIALIZE,
+                    ", ".join(_MATERIALIZE_STRATEGIES),
+                    strategy,
+                )
+            )
+        if (
+            strategy in _LINK_STRATEGIES
+            and artifacts.get_artifacts_cache().max_size is not None
+        ):
+            wandb.termwarn(
+                "Copying artifact files instead of linking them, as %s is set"
+                % env.ARTIFACT_CACHE_MAX_SIZE,
+                repeat=False,
+            )
+            strategy = "copy"
+        if _is_materialized(cache_path, target_path, strategy):
+            return target_path
+
+        util.mkdir_exists_ok(os.path.dirname(target_path))
+        # materialize next to the target then replace it, so an earlier link
+        # to the cache is replaced instead of written through
+        tmp_path = "%s.%s.tmp" % (target_path, util.rand_alphanumeric())
+        try:
+            _materialize(cache_path, tmp_path, strategy)
+            try:
+                os.replace(tmp_path, target_path)
+            except AttributeError:
+                if os.path.lexists(target_path):
+                    os.remove(target_path)
+                os.rename(tmp_path, target_path)
+        finally:
+            if os.path.lexists(tmp_path):
+                os.remove(tmp_path)
         return target_path
 
     def download(self, root=None):
@@ -2743,10 +2870,10 @@ class Artifact(artifacts.Artifact):
             index_file_url = response["artifact"]["currentManifest"]["file"][
                 "directUrl"
             ]
-            with requests.get(index_file_url) as req:
+            with requests.get(index_file_url, stream=True) as req:
                 req.raise_for_status()
-                artifact._manifest = artifacts.ArtifactManifest.from_manifest_json(
-                    artifact, json.loads(six.ensure_text(req.content))
+                artifact._manifest = artifacts.ArtifactManifest.from_manifest_stream(
+                    artifact, req.iter_content(chunk_size=_MANIFEST_CHUNK_BYTES)
                 )
 
             artifact._load_dependent_manifests()
@@ -3290,10 +3417,10 @@ class Artifact(artifacts.Artifact):
             index_file_url = response["project"]["artifact"]["currentManifest"]["file"][
                 "directUrl"
             ]
-            with requests.get(index_file_url) as req:
+            with requests.get(index_file_url, stream=True) as req:
                 req.raise_for_status()
-                self._manifest = artifacts.ArtifactManifest.from_manifest_json(
-                    self, json.loads(six.ensure_text(req.content))
+                self._manifest = artifacts.ArtifactManifest.from_manifest_stream(
+                    self, req.iter_content(chunk_size=_MANIFEST_CHUNK_BYTES)
                 )
 
             self._load_dependent_manifests()
@@ -3303,8 +3430,7 @@ class Artifact(artifacts.Artifact):
     def _load_dependent_manifests(self):
         """Helper function to interrogate entries and ensure we have loaded their manifests"""
         # Make sure dependencies are avail
-        for entry_key in self._manifest.entries:
-            entry = self._manifest.entries[entry_key]
+        for entry in self._manifest.entries.values():
             if self._manifest_entry_is_artifact_reference(entry):
                 dep_artifact = self._get_ref_artifact_from_entry(entry)
                 if dep_artifact not in self._dependent_artifacts:
@@ -449,6 +449,14 @@ def init(ctx, project, entity, reset, mode):
 )
 @click.option("--ignore", hidden=True)
 @click.option("--show", default=5, help="Number of runs to show")
+@click.option(
+    "--jobs",
+    default=1,
+    help="Number of runs to sync in parallel, each in its own process. The "
+    "concurrent requests of a single sync are shared between them, but each "
+    "process makes at least one of each kind, so more jobs make more requests.",
+    type=int,
+)
 @display_error
 def sync(
     ctx,
@@ -471,6 +479,7 @@ def sync(
     clean=None,
     clean_old_hours=24,
     clean_force=None,
+    jobs=None,
 ):
     # TODO: rather unfortunate, needed to avoid creating a `wandb` directory
     os.environ["WANDB_DIR"] = TMPDIR.name
@@ -542,6 +551,7 @@ def sync(
             view=view,
             verbose=verbose,
             sync_tensorboard=sync_tensorboard,
+            jobs=jobs,
         )
         for p in path:
             sm.add(p)
@@ -549,6 +559,8 @@ def sync(
         while not sm.is_done():
             _ = sm.poll()
             # print(status)
+        if sm.failed:
+            sys.exit(1)
 
     def _sync_all():
         sync_items = get_runs(
@@ -63,6 +63,11 @@ ANONYMOUS = "WANDB_ANONYMOUS"
 JUPYTER = "WANDB_JUPYTER"
 CONFIG_DIR = "WANDB_CONFIG_DIR"
 CACHE_DIR = "WANDB_CACHE_DIR"
+ARTIFACT_STRICT_DIGESTS = "WANDB_ARTIFACT_STRICT_DIGESTS"
+ARTIFACT_HASH_THREADS = "WANDB_ARTIFACT_HASH_THREADS"
+ARTIFACT_HASH_PROCESSES = "WANDB_ARTIFACT_HASH_PROCESSES"
+ARTIFACT_CACHE_MAX_SIZE = "WANDB_ARTIFACT_CACHE_MAX_SIZE"
+ARTIFACT_MATERIALIZE = "WANDB_ARTIFACT_MATERIALIZE"
 DISABLE_SSL = "WANDB_INSECURE_DISABLE_SSL"
 
 # For testing, to be removed in future version
@@ -293,6 +298,44 @@ def get_cache_dir(env=None):
     return val
 
 
+def get_artifact_strict_digests(env=None):
+    return _env_as_bool(ARTIFACT_STRICT_DIGESTS, default=False, env=env)
+
+
+def get_artifact_hash_threads(default=None, env=None):
+    if env is None:
+        env = os.environ
+    val = env.get(ARTIFACT_HASH_THREADS, default)
+    try:
+        val = int(val)
+    except (TypeError, ValueError):
+        val = default
+    return val
+
+
+def get_artifact_hash_processes(default=None, env=None):
+    if env is None:
+        env = os.environ
+    val = env.get(ARTIFACT_HASH_PROCESSES, default)
+    try:
+        val = int(val)
+    except (TypeError, ValueError):
+        val = default
+    return val
+
+
+def get_artifact_cache_max_size(default=None, env=None):
+    if env is None:
+        env = os.environ
+    return env.get(ARTIFACT_CACHE_MAX_SIZE, default)
+
+
+def get_artifact_materialize(default="copy", env=None):
+    if env is None:
+        env = os.environ
+    return env.get(ARTIFACT_MATERIALIZE, default)
+
+
 def get_use_v1_artifacts(env=None):
     if env is None:
         env = os.environ
@@ -2,6 +2,8 @@ import logging
 import os
 import six
 from six.moves import queue
+import sys
+import threading
 import time
 
 from wandb import util
@@ -9,6 +11,13 @@ import glob
 
 wd_polling = util.vendor_import("watchdog.observers.polling")
 wd_events = util.vendor_import("watchdog.events")
+wd_inotify = None
+if sys.platform.startswith("linux"):
+    try:
+        wd_inotify = util.vendor_import("watchdog.observers.inotify")
+    except Exception:
+        # libc could not be loaded or has no inotify support
+        pass
 
 logger = logging.getLogger(__name__)
 
@@ -152,6 +161,10 @@ class PolicyLive(FileEventHandler):
 
 
 class DirWatcher(object):
+    # inotify only sees changes of symlinks themselves, the files they link to,
+    # like those of wandb.save, are polled for changes instead
+    SYMLINK_POLL_SECONDS = 1.0
+
     def __init__(self, settings, api, file_pusher, file_dir=None):
         self._api = api
         self._file_count = 0
@@ -160,12 +173,68 @@ class DirWatcher(object):
         self._user_file_policies = {"end": set(), "live": set(), "now": set()}
         self._file_pusher = file_pusher
         self._file_event_handlers = {}
-        self._file_observer = wd_polling.PollingObserver()
-        self._file_observer.schedule(
+        self._symlinks = {}
+        self._symlink_poller = None
+        self._stopped = threading.Event()
+        self._file_observer = None
+        if (settings._file_watcher or "auto") != "polling":
+            self._file_observer = self._start_inotify_observer()
+        if self._file_observer is None:
+            self._file_observer = self._start_observer(wd_polling.PollingObserver())
+        else:
+            self._symlink_poller = threading.Thread(target=self._poll_symlinks)
+            self._symlink_poller.daemon = True
+            self._symlink_poller.start()
+        logger.info(
+            "watching files in: %s with %s",
+            settings.files_dir,
+            type(self._file_observer).__name__,
+        )
+
+    def _start_observer(self, observer):
+        self._watch = observer.schedule(
             self._per_file_event_handler(), self._dir, recursive=True
         )
-        self._file_observer.start()
-        logger.info("watching files in: %s", settings.files_dir)
+        observer.start()
+        return observer
+
+    def _start_inotify_observer(self):
+        """Start an observer notified of changes by inotify, None if unavailable.
+
+        Unlike polling, this doesn't stat every file in the directory tree
+        periodically, but it needs a watch for every directory in it and fails
+        to start when the inotify limits of the user are reached.
+        """
+        if wd_inotify is None:
+            logger.info("inotify is not available, polling for file changes")
+            return None
+        try:
+            return self._start_observer(wd_inotify.InotifyObserver())
+        except OSError as e:
+            logger.warning("failed to watch with inotify, polling instead: %s", e)
+            return None
+
+    @property
+    def _polling(self):
+        return isinstance(self._file_observer, wd_polling.PollingObserver)
+
+    def _stat_symlink(self, path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime
+
+    def _poll_symlinks(self):
+        while not self._stopped.wait(self.SYMLINK_POLL_SECONDS):
+            for path, last_stat in list(self._symlinks.items()):
+                stat = self._stat_symlink(path)
+                if stat is None or stat == last_stat:
+                    continue
+                self._symlinks[path] = stat
+                # dispatched by the observer thread like the inotify events
+                event = wd_events.FileModifiedEvent(path)
+                self._file_observer.event_queue.put((event, self._watch))
 
     @property
     def emitter(self):
@@ -218,7 +287,7 @@ class DirWatcher(object):
             return None
         self._file_count += 1
         # We do the directory scan less often as it grows
-        if self._file_count % 100 == 0:
+        if self._polling and self._file_count % 100 == 0:
             emitter = self.emitter
             if emitter:
                 emitter._timeout = int(self._file_count / 100) + 1
@@ -254,6 +323,8 @@ class DirWatcher(object):
         save_name: its path relative to the run directory (aka the watch directory)
         """
         if save_name not in self._file_event_handlers:
+            if not self._polling and os.path.islink(file_path):
+                self._symlinks[file_path] = self._stat_symlink(file_path)
             # TODO: we can use PolicyIgnore if there are files we never want to sync
             if "tfevents" in save_name or "graph.pbtxt" in save_name:
                 self._file_event_handlers[save_name] = PolicyLive(
@@ -280,6 +351,9 @@ class DirWatcher(object):
 
     def finish(self):
         logger.info("shutting down directory watcher")
+        self._stopped.set()
+        if self._symlink_poller is not None:
+            self._symlink_poller.join()
         try:
             # avoid hanging if we crashed before the observer was started
             if self._file_observer.is_alive():
@@ -290,7 +364,10 @@ class DirWatcher(object):
                 self._file_observer._timeout = 0
                 self._file_observer._stopped_event.set()
                 self._file_observer.join()
-                self.emitter.queue_events(0)
+                # reading inotify events blocks until there is one, events it
+                # holds back are covered by the scan of the directory below
+                if self._polling:
+                    self.emitter.queue_events(0)
                 while True:
                     try:
                         self._file_observer.dispatch_events(
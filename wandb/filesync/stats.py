@@ -7,6 +7,10 @@ class Stats(object):
     def __init__(self):
         self._stats = {}
         self._lock = threading.Lock()
+        # sizes of the batches run file upload urls were fetched in
+        self._upload_url_batches = 0
+        self._upload_url_files = 0
+        self._upload_url_max_batch = 0
 
     def init_file(self, save_name, size, is_artifact_file=False):
         with self._lock:
@@ -15,6 +19,7 @@ class Stats(object):
                 "total": size,
                 "uploaded": 0,
                 "failed": False,
+                "completed": False,
                 "artifact_file": is_artifact_file,
             }
 
@@ -30,15 +35,36 @@ class Stats(object):
         self._stats[save_name]["uploaded"] = 0
         self._stats[save_name]["failed"] = True
 
+    def add_upload_url_batch(self, size):
+        with self._lock:
+            self._upload_url_batches += 1
+            self._upload_url_files += size
+            self._upload_url_max_batch = max(self._upload_url_max_batch, size)
+
+    def set_file_completed(self, save_name):
+        with self._lock:
+            if save_name in self._stats:
+                self._stats[save_name]["completed"] = True
+
+    def completed_files(self):
+        with self._lock:
+            return {name for name, f in self._stats.items() if f["completed"]}
+
     def summary(self):
         # Need to use list to ensure we get a copy, since other threads may
         # modify this while we iterate
         with self._lock:
             stats = list(self._stats.values())
+            upload_url_batches = self._upload_url_batches
+            upload_url_files = self._upload_url_files
+            upload_url_max_batch = self._upload_url_max_batch
         return {
             "uploaded_bytes": sum(f["uploaded"] for f in stats),
             "total_bytes": sum(f["total"] for f in stats),
             "deduped_bytes": sum(f["total"] for f in stats if f["deduped"]),
+            "upload_url_batches": upload_url_batches,
+            "upload_url_files": upload_url_files,
+            "upload_url_max_batch": upload_url_max_batch,
         }
 
     def file_counts_by_category(self):
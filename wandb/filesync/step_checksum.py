@@ -1,9 +1,11 @@
 """Batching file prepare requests to our API."""
 
 import collections
+import logging
 import os
 import shutil
 import threading
+from six.moves import queue
 import wandb.util
 
 from wandb.filesync import step_upload
@@ -29,56 +31,57 @@ RequestCommitArtifact = collections.namedtuple(
 )
 RequestFinish = collections.namedtuple("RequestFinish", ("callback"))
 
+logger = logging.getLogger(__name__)
+
+
+# posted back to the request queue by a worker when a file is ready to upload
+EventChecksumDone = collections.namedtuple("EventChecksumDone", ("request", "upload"))
+
 
 class StepChecksum(object):
-    def __init__(self, api, tempdir, request_queue, output_queue, stats):
+    """Copy and checksum files to upload with a pool of up to max_jobs threads.
+
+    Uploads of different files are handed to the upload step as soon as they
+    are ready, uploads of the same file in the order they were requested, and
+    an artifact is committed only after all its files were handed over.
+    """
+
+    def __init__(self, api, tempdir, request_queue, output_queue, stats, max_jobs=1):
         self._api = api
         self._tempdir = tempdir
         self._request_queue = request_queue
         self._output_queue = output_queue
         self._stats = stats
+        self._max_jobs = max_jobs
 
         self._thread = threading.Thread(target=self._thread_body)
         self._thread.daemon = True
 
+        self._workers = []
+        self._work_queue = queue.Queue()
+
+        # Indexed by save_name, the uploads of a file after the one running
+        self._running_jobs = {}
+        # Indexed by artifact_id, the number of its uploads not handed over yet
+        # and the commits waiting for them
+        self._artifact_uploads = collections.defaultdict(int)
+        self._blocked_commits = {}
+
     def _thread_body(self):
         finished = False
         while True:
             req = self._request_queue.get()
-            if isinstance(req, RequestUpload):
-                path = req.path
-                if req.copy:
-                    path = os.path.join(
-                        self._tempdir.name,
-                        "%s-%s" % (wandb.util.generate_id(), req.save_name),
-                    )
-                    wandb.util.mkdir_exists_ok(os.path.dirname(path))
-                    try:
-                        # certain linux distros throw an exception when copying
-                        # large files: https://bugs.python.org/issue43743
-                        shutil.copy2(req.path, path)
-                    except OSError:
-                        shutil._USE_CP_SENDFILE = False
-                        shutil.copy2(req.path, path)
-                checksum = None
-                if req.use_prepare_flow:
-                    # passing a checksum through indicates that we'd like to use the
-                    # "prepare" file upload flow, in which we prepare the files in
-                    # the database before uploading them. This is currently only
-                    # used for artifact manifests
-                    checksum = wandb.util.md5_file(path)
-                self._stats.init_file(req.save_name, os.path.getsize(path))
-                self._output_queue.put(
-                    step_upload.RequestUpload(
-                        path,
-                        req.save_name,
-                        req.artifact_id,
-                        checksum,
-                        req.copy,
-                        req.save_fn,
-                        req.digest,
-                    )
-                )
+            if isinstance(req, EventChecksumDone):
+                if req.upload:
+                    self._output_queue.put(req.upload)
+                self._job_done(req.request)
+            elif isinstance(req, RequestUpload):
+                if req.artifact_id:
+                    self._artifact_uploads[req.artifact_id] += 1
+                if req.save_name in self._running_jobs:
+                    self._running_jobs[req.save_name].append(req)
+                else:
+                    self._start_job(req)
             elif isinstance(req, RequestStoreManifestFiles):
                 for entry in req.manifest.entries.values():
                     if entry.local_path:
@@ -103,17 +106,101 @@ class StepChecksum(object):
                             )
                         )
             elif isinstance(req, RequestCommitArtifact):
-                self._output_queue.put(
-                    step_upload.RequestCommitArtifact(
-                        req.artifact_id, req.finalize, req.before_commit, req.on_commit
-                    )
-                )
+                if self._artifact_uploads.get(req.artifact_id):
+                    self._blocked_commits.setdefault(req.artifact_id, []).append(req)
+                else:
+                    self._commit_artifact(req)
             elif isinstance(req, RequestFinish):
-                break
+                finished = True
+                finish_callback = req.callback
             else:
                 raise Exception("internal error")
 
-        self._output_queue.put(step_upload.RequestFinish(req.callback))
+            if finished and not self._running_jobs:
+                break
+
+        for _ in self._workers:
+            self._work_queue.put(None)
+        for worker in self._workers:
+            worker.join()
+        self._output_queue.put(step_upload.RequestFinish(finish_callback))
+
+    def _worker_body(self):
+        while True:
+            req = self._work_queue.get()
+            if req is None:
+                break
+            try:
+                upload = self._checksum(req)
+            except (IOError, OSError):
+                logger.exception("failed to prepare %s for upload", req.save_name)
+                upload = None
+            self._request_queue.put(EventChecksumDone(req, upload))
+
+    def _start_job(self, req):
+        self._running_jobs[req.save_name] = collections.deque()
+        if len(self._workers) < min(self._max_jobs, len(self._running_jobs)):
+            worker = threading.Thread(target=self._worker_body)
+            worker.daemon = True
+            worker.start()
+            self._workers.append(worker)
+        self._work_queue.put(req)
+
+    def _job_done(self, req):
+        blocked = self._running_jobs.pop(req.save_name)
+        if blocked:
+            self._start_job(blocked.popleft())
+            self._running_jobs[req.save_name].extend(blocked)
+        if req.artifact_id:
+            self._artifact_uploads[req.artifact_id] -= 1
+            if not self._artifact_uploads[req.artifact_id]:
+                del self._artifact_uploads[req.artifact_id]
+                for commit in self._blocked_commits.pop(req.artifact_id, []):
+                    self._commit_artifact(commit)
+
+    def _checksum(self, req):
+        path = req.path
+        if req.copy:
+            path = os.path.join(
+                self._tempdir.name, "%s-%s" % (wandb.util.generate_id(), req.save_name),
+            )
+            wandb.util.mkdir_exists_ok(os.path.dirname(path))
+            try:
+                # certain linux distros throw an exception when copying
+                # large files: https://bugs.python.org/issue43743
+                shutil.copy2(req.path, path)
+            except OSError:
+                shutil._USE_CP_SENDFILE = False
+                shutil.copy2(req.path, path)
+        checksum = None
+        if req.use_prepare_flow:
+            # passing a checksum through indicates that we'd like to use the
+            # "prepare" file upload flow, in which we prepare the files in
+            # the database before uploading them. This is currently only
+            # used for artifact manifests
+            checksum = wandb.util.md5_file(path)
+        self._stats.init_file(req.save_name, os.path.getsize(path))
+        return step_upload.RequestUpload(
+            path,
+            req.save_name,
+            req.artifact_id,
+            checksum,
+            req.copy,
+            req.save_fn,
+            req.digest,
+        )
+
+    def _commit_artifact(self, req):
+        self._output_queue.put(
+            step_upload.RequestCommitArtifact(
+                req.artifact_id, req.finalize, req.before_commit, req.on_commit
+            )
+        )
+
+    def pending_count(self):
+        """Return the number of files waiting to be copied and checksummed."""
+        blocked = list(self._running_jobs.values())
+        return self._work_queue.qsize() + sum(len(jobs) for jobs in blocked)
 
     def start(self):
         self._thread.start()
@@ -1,12 +1,18 @@
 """Batching file prepare requests to our API."""
 
 import collections
+import logging
+import os
 import threading
 from six.moves import queue
 
+import wandb
+from wandb.filesync import step_upload_urls
 from wandb.filesync import upload_job
 from wandb.errors.term import termerror
 
+logger = logging.getLogger(__name__)
+
 
 RequestUpload = collections.namedtuple(
     "EventStartUploadJob",
@@ -17,21 +23,72 @@ RequestCommitArtifact = collections.namedtuple(
 )
 RequestFinish = collections.namedtuple("RequestFinish", ("callback"))
 
+# upload url requests of run files are batched for up to UPLOAD_URLS_BATCH_TIME
+# seconds, while they keep coming within UPLOAD_URLS_INTER_EVENT_TIME
+UPLOAD_URLS_BATCH_TIME = 0.1
+UPLOAD_URLS_INTER_EVENT_TIME = 0.01
+UPLOAD_URLS_MAX_BATCH_SIZE = 100
+
+# pending uploads are started by priority: run metadata files, then large
+# files while they have fewer than max_large_jobs running, then small files,
+# then the other large files
+PRIORITY_METADATA = 0
+PRIORITY_LARGE = 1
+PRIORITY_SMALL = 2
+
 
 class StepUpload(object):
-    def __init__(self, api, stats, event_queue, max_jobs, file_stream, silent=False):
+    """Upload files with a pool of up to max_jobs worker threads.
+
+    Uploads wait in a queue for each priority until a worker is free.  Files
+    of at least LARGE_FILE_BYTES get max_large_jobs dedicated workers, and
+    only use the other workers when no small file is waiting for them.
+    """
+
+    LARGE_FILE_BYTES = 32 * 1024 * 1024
+
+    def __init__(
+        self,
+        api,
+        stats,
+        event_queue,
+        max_jobs,
+        file_stream,
+        silent=False,
+        max_large_jobs=None,
+    ):
         self._api = api
         self._stats = stats
         self._event_queue = event_queue
         self._max_jobs = max_jobs
+        self._max_large_jobs = max_large_jobs or max(1, max_jobs // 4)
         self._file_stream = file_stream
+        self._step_upload_urls = step_upload_urls.StepUploadUrls(
+            api,
+            stats,
+            UPLOAD_URLS_BATCH_TIME,
+            UPLOAD_URLS_INTER_EVENT_TIME,
+            UPLOAD_URLS_MAX_BATCH_SIZE,
+        )
 
         self._thread = threading.Thread(target=self._thread_body)
         self._thread.daemon = True
 
+        # workers are started as needed, up to max_jobs, and run the jobs put
+        # in the work queue, never more than there are idle workers
+        self._workers = []
+        self._work_queue = queue.Queue()
+
         # Indexed by files' `save_name`'s, which are their ID's in the Run.
         self._running_jobs = {}
-        self._pending_jobs = []
+        self._running_large = 0
+        self._pending_jobs = {
+            PRIORITY_METADATA: collections.deque(),
+            PRIORITY_LARGE: collections.deque(),
+            PRIORITY_SMALL: collections.deque(),
+        }
+        # uploads waiting for an upload of the same file to finish
+        self._blocked_jobs = {}
 
         self._artifacts = {}
 
@@ -65,14 +122,29 @@ class StepUpload(object):
                 self._handle_event(event)
             elif not self._running_jobs:
                 # Queue was empty and no jobs left.
+                for _ in self._workers:
+                    self._work_queue.put(None)
+                for worker in self._workers:
+                    worker.join()
+                self._step_upload_urls.shutdown()
                 if finish_callback:
                     finish_callback()
                 break
 
+    def _worker_body(self):
+        while True:
+            job = self._work_queue.get()
+            if job is None:
+                break
+            try:
+                job.run()
+            except Exception:
+                # the job has already reported itself done, keep the worker
+                logger.exception("upload of %s failed", job.save_name)
+
     def _handle_event(self, event):
         if isinstance(event, upload_job.EventJobDone):
             job = event.job
-            job.join()
             if job.artifact_id:
                 if event.success:
                     self._artifacts[job.artifact_id]["pending_count"] -= 1
@@ -82,10 +154,14 @@ class StepUpload(object):
                         "Uploading artifact file failed. Artifact won't be committed."
                     )
             self._running_jobs.pop(job.save_name)
-            # If we have any pending jobs, start one now
-            if self._pending_jobs:
-                event = self._pending_jobs.pop(0)
-                self._start_upload_job(event)
+            if job.priority == PRIORITY_LARGE:
+                self._running_large -= 1
+            blocked = self._blocked_jobs.get(job.save_name)
+            if blocked:
+                self._add_pending(blocked.popleft(), first=True)
+                if not blocked:
+                    del self._blocked_jobs[job.save_name]
+            self._start_pending_jobs()
         elif isinstance(event, RequestCommitArtifact):
             if event.artifact_id not in self._artifacts:
                 self._init_artifact(event.artifact_id)
@@ -105,25 +181,66 @@ class StepUpload(object):
                 if event.artifact_id not in self._artifacts:
                     self._init_artifact(event.artifact_id)
                 self._artifacts[event.artifact_id]["pending_count"] += 1
-            if len(self._running_jobs) == self._max_jobs:
-                self._pending_jobs.append(event)
+            if event.save_name in self._blocked_jobs:
+                self._blocked_jobs[event.save_name].append(event)
             else:
-                self._start_upload_job(event)
+                self._add_pending(event)
+            self._start_pending_jobs()
         else:
             raise Exception("Programming error: unhandled event: %s" % str(event))
 
-    def _start_upload_job(self, event):
+    def _priority(self, event):
+        if event.artifact_id is None and wandb.wandb_lib.filenames.is_wandb_file(
+            event.save_name
+        ):
+            return PRIORITY_METADATA
+        try:
+            size = os.path.getsize(event.path)
+        except OSError:
+            size = 0
+        if size >= self.LARGE_FILE_BYTES:
+            return PRIORITY_LARGE
+        return PRIORITY_SMALL
+
+    def _add_pending(self, event, first=False):
+        pending = self._pending_jobs[self._priority(event)]
+        if first:
+            pending.appendleft(event)
+        else:
+            pending.append(event)
+
+    def _next_pending(self):
+        """Return the (priority, event) of the next upload to start, if any."""
+        # large files past their dedicated workers only take the workers no
+        # small file is waiting for
+        order = [PRIORITY_METADATA, PRIORITY_SMALL, PRIORITY_LARGE]
+        if self._running_large < self._max_large_jobs:
+            order = [PRIORITY_METADATA, PRIORITY_LARGE, PRIORITY_SMALL]
+        for priority in order:
+            pending = self._pending_jobs[priority]
+            if pending:
+                return priority, pending.popleft()
+        return None
+
+    def _start_pending_jobs(self):
+        while len(self._running_jobs) < self._max_jobs:
+            pending = self._next_pending()
+            if pending is None:
+                break
+            self._start_upload_job(*pending)
+
+    def _start_upload_job(self, priority, event):
         if not isinstance(event, RequestUpload):
             raise Exception("Programming error: invalid event")
 
         # Operations on a single backend file must be serialized. if
-        # we're already uploading this file, put the event on the
-        # end of the queue
+        # we're already uploading this file, wait for it to finish
         if event.save_name in self._running_jobs:
-            self._pending_jobs.append(event)
+            self._blocked_jobs.setdefault(event.save_name, collections.deque()).append(
+                event
+            )
             return
 
-        # Start it.
         job = upload_job.UploadJob(
             self._event_queue,
             self._stats,
@@ -137,9 +254,25 @@ class StepUpload(object):
             event.copied,
             event.save_fn,
             event.digest,
+            step_upload_urls=self._step_upload_urls,
         )
+        job.priority = priority
         self._running_jobs[event.save_name] = job
-        job.start()
+        if priority == PRIORITY_LARGE:
+            self._running_large += 1
+        self._workers = [worker for worker in self._workers if worker.is_alive()]
+        if len(self._workers) < len(self._running_jobs):
+            worker = threading.Thread(target=self._worker_body)
+            worker.daemon = True
+            worker.start()
+            self._workers.append(worker)
+        self._work_queue.put(job)
+
+    def pending_count(self):
+        """Return the number of uploads waiting for a free worker."""
+        pending = list(self._pending_jobs.values())
+        pending.extend(list(self._blocked_jobs.values()))
+        return sum(len(jobs) for jobs in pending)
 
     def _init_artifact(self, artifact_id):
         self._artifacts[artifact_id] = {
@@ -163,8 +296,12 @@ class StepUpload(object):
                 callback()
 
     def start(self):
+        self._step_upload_urls.start()
         self._thread.start()
 
+    def finish(self):
+        self._event_queue.put(RequestFinish(None))
+
     def is_alive(self):
         return self._thread.is_alive()
 
@@ -0,0 +1,82 @@
+"""Batching run file upload url requests to our API."""
+
+import collections
+import logging
+
+from six.moves import queue
+
+from wandb.filesync import step_prepare
+
+logger = logging.getLogger(__name__)
+
+# Request for the upload url of a run file.
+RequestUploadUrl = collections.namedtuple(
+    "RequestUploadUrl", ("save_name", "response_queue")
+)
+
+ResponseUploadUrl = collections.namedtuple(
+    "ResponseUploadUrl", ("upload_url", "upload_headers")
+)
+
+
+class StepUploadUrls(step_prepare.StepPrepare):
+    """A thread that batches requests for the upload urls of run files.
+
+    Upload jobs started together, like the media files of a step, call
+    upload_url() in parallel and the urls of all of them are fetched with a
+    single upload_urls call.
+    """
+
+    def __init__(self, api, stats, batch_time, inter_event_time, max_batch_size):
+        super(StepUploadUrls, self).__init__(
+            api, batch_time, inter_event_time, max_batch_size
+        )
+        self._stats = stats
+
+    def _thread_body(self):
+        while True:
+            request = self._request_queue.get()
+            if isinstance(request, step_prepare.RequestFinish):
+                break
+            finish, batch = self._gather_batch(request)
+            self._stats.add_upload_url_batch(len(batch))
+            self._upload_url_batch(batch)
+            if finish:
+                break
+        summary = self._stats.summary()
+        logger.info(
+            "upload urls of %d files fetched in %d batches, largest %d",
+            summary["upload_url_files"],
+            summary["upload_url_batches"],
+            summary["upload_url_max_batch"],
+        )
+
+    def _upload_url_batch(self, batch):
+        """Fetch the upload urls of a batch and respond to every request.
+
+        Requests get the exception instead if the upload_urls call failed.
+        """
+        save_names = sorted({request.save_name for request in batch})
+        try:
+            project = self._api.get_project()
+            _, upload_headers, result = self._api.upload_urls(project, save_names)
+        except Exception as e:
+            for request in batch:
+                request.response_queue.put(e)
+            return
+        for request in batch:
+            file_info = result.get(request.save_name)
+            if file_info is None:
+                response = KeyError(request.save_name)
+            else:
+                response = ResponseUploadUrl(file_info["url"], upload_headers)
+            request.response_queue.put(response)
+
+    def upload_url(self, save_name):
+        """Return the ResponseUploadUrl of a run file once its batch was fetched."""
+        response_queue = queue.Queue()
+        self._request_queue.put(RequestUploadUrl(save_name, response_queue))
+        response = response_queue.get()
+        if isinstance(response, Exception):
+            raise response
+        return response
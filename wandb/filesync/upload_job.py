@@ -1,7 +1,6 @@
 import collections
 import os
 import logging
-import threading
 
 import wandb
 
@@ -9,7 +8,7 @@ EventJobDone = collections.namedtuple("EventJobDone", ("job", "success"))
 logger = logging.getLogger(__name__)
 
 
-class UploadJob(threading.Thread):
+class UploadJob(object):
     def __init__(
         self,
         done_queue,
@@ -24,8 +23,9 @@ class UploadJob(threading.Thread):
         copied,
         save_fn,
         digest,
+        step_upload_urls=None,
     ):
-        """A file upload thread.
+        """A file upload, run by a worker of the upload step.
 
         Arguments:
             done_queue: queue.Queue in which to put an EventJobDone event when
@@ -35,6 +35,8 @@ class UploadJob(threading.Thread):
             save_name: string logical location of the file relative to the run
                 directory.
             path: actual string path of the file to upload on the filesystem.
+            step_upload_urls: StepUploadUrls batching the upload url requests
+                of run files, or None to request the url of this file alone.
         """
         self._done_queue = done_queue
         self._stats = stats
@@ -48,7 +50,7 @@ class UploadJob(threading.Thread):
         self.copied = copied
         self.save_fn = save_fn
         self.digest = digest
-        super(UploadJob, self).__init__()
+        self._step_upload_urls = step_upload_urls
 
     def run(self):
         success = False
@@ -57,6 +59,8 @@ class UploadJob(threading.Thread):
         finally:
             if self.copied and os.path.isfile(self.save_path):
                 os.remove(self.save_path)
+            if success:
+                self._stats.set_file_completed(self.save_name)
             self._done_queue.put(EventJobDone(self, success))
             if success:
                 self._file_stream.push_success(self.artifact_id, self.save_name)
@@ -108,10 +112,17 @@ class UploadJob(threading.Thread):
             # The classic file upload flow. We get a signed url and upload the file
             # then the backend handles the cloud storage metadata callback to create the
             # file entry. This flow has aged like a fine wine.
-            project = self._api.get_project()
-            _, upload_headers, result = self._api.upload_urls(project, [self.save_name])
-            file_info = result[self.save_name]
-            upload_url = file_info["url"]
+            if self._step_upload_urls is not None:
+                upload_url, upload_headers = self._step_upload_urls.upload_url(
+                    self.save_name
+                )
+            else:
+                project = self._api.get_project()
+                _, upload_headers, result = self._api.upload_urls(
+                    project, [self.save_name]
+                )
+                file_info = result[self.save_name]
+                upload_url = file_info["url"]
 
         if upload_url is None:
             logger.info("Skipped uploading %s", self.save_path)
@@ -86,6 +86,9 @@ class Record(google___protobuf___message___Message):
     @property
     def metric(self) -> type___MetricRecord: ...
 
+    @property
+    def history_batch(self) -> type___HistoryBatchRecord: ...
+
     @property
     def run(self) -> type___RunRecord: ...
 
@@ -124,6 +127,7 @@ class Record(google___protobuf___message___Message):
         alert : typing___Optional[type___AlertRecord] = None,
         telemetry : typing___Optional[wandb___proto___wandb_telemetry_pb2___TelemetryRecord] = None,
         metric : typing___Optional[type___MetricRecord] = None,
+        history_batch : typing___Optional[type___HistoryBatchRecord] = None,
         run : typing___Optional[type___RunRecord] = None,
         exit : typing___Optional[type___RunExitRecord] = None,
         final : typing___Optional[type___FinalRecord] = None,
@@ -134,9 +138,9 @@ class Record(google___protobuf___message___Message):
         control : typing___Optional[type___Control] = None,
         uuid : typing___Optional[typing___Text] = None,
         ) -> None: ...
-    def HasField(self, field_name: typing_extensions___Literal[u"alert",b"alert",u"artifact",b"artifact",u"config",b"config",u"control",b"control",u"exit",b"exit",u"files",b"files",u"final",b"final",u"footer",b"footer",u"header",b"header",u"history",b"history",u"metric",b"metric",u"output",b"output",u"preempting",b"preempting",u"record_type",b"record_type",u"request",b"request",u"run",b"run",u"stats",b"stats",u"summary",b"summary",u"tbrecord",b"tbrecord",u"telemetry",b"telemetry"]) -> builtin___bool: ...
-    def ClearField(self, field_name: typing_extensions___Literal[u"alert",b"alert",u"artifact",b"artifact",u"config",b"config",u"control",b"control",u"exit",b"exit",u"files",b"files",u"final",b"final",u"footer",b"footer",u"header",b"header",u"history",b"history",u"metric",b"metric",u"num",b"num",u"output",b"output",u"preempting",b"preempting",u"record_type",b"record_type",u"request",b"request",u"run",b"run",u"stats",b"stats",u"summary",b"summary",u"tbrecord",b"tbrecord",u"telemetry",b"telemetry",u"uuid",b"uuid"]) -> None: ...
-    def WhichOneof(self, oneof_group: typing_extensions___Literal[u"record_type",b"record_type"]) -> typing_extensions___Literal["history","summary","output","config","files","stats","artifact","tbrecord","alert","telemetry","metric","run","exit","final","header","footer","preempting","request"]: ...
+    def HasField(self, field_name: typing_extensions___Literal[u"alert",b"alert",u"artifact",b"artifact",u"config",b"config",u"control",b"control",u"exit",b"exit",u"files",b"files",u"final",b"final",u"footer",b"footer",u"header",b"header",u"history",b"history",u"history_batch",b"history_batch",u"metric",b"metric",u"output",b"output",u"preempting",b"preempting",u"record_type",b"record_type",u"request",b"request",u"run",b"run",u"stats",b"stats",u"summary",b"summary",u"tbrecord",b"tbrecord",u"telemetry",b"telemetry"]) -> builtin___bool: ...
+    def ClearField(self, field_name: typing_extensions___Literal[u"alert",b"alert",u"artifact",b"artifact",u"config",b"config",u"control",b"control",u"exit",b"exit",u"files",b"files",u"final",b"final",u"footer",b"footer",u"header",b"header",u"history",b"history",u"history_batch",b"history_batch",u"metric",b"metric",u"num",b"num",u"output",b"output",u"preempting",b"preempting",u"record_type",b"record_type",u"request",b"request",u"run",b"run",u"stats",b"stats",u"summary",b"summary",u"tbrecord",b"tbrecord",u"telemetry",b"telemetry",u"uuid",b"uuid"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions___Literal[u"record_type",b"record_type"]) -> typing_extensions___Literal["history","summary","output","config","files","stats","artifact","tbrecord","alert","telemetry","metric","history_batch","run","exit","final","header","footer","preempting","request"]: ...
 type___Record = Record
 
 class Control(google___protobuf___message___Message):
@@ -382,6 +386,7 @@ type___HistoryStep = HistoryStep
 
 class HistoryRecord(google___protobuf___message___Message):
     DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    row_json: typing___Text = ...
 
     @property
     def item(self) -> google___protobuf___internal___containers___RepeatedCompositeFieldContainer[type___HistoryItem]: ...
@@ -393,11 +398,25 @@ class HistoryRecord(google___protobuf___message___Message):
         *,
         item : typing___Optional[typing___Iterable[type___HistoryItem]] = None,
         step : typing___Optional[type___HistoryStep] = None,
+        row_json : typing___Optional[typing___Text] = None,
         ) -> None: ...
     def HasField(self, field_name: typing_extensions___Literal[u"step",b"step"]) -> builtin___bool: ...
-    def ClearField(self, field_name: typing_extensions___Literal[u"item",b"item",u"step",b"step"]) -> None: ...
+    def ClearField(self, field_name: typing_extensions___Literal[u"item",b"item",u"row_json",b"row_json",u"step",b"step"]) -> None: ...
 type___HistoryRecord = HistoryRecord
 
+class HistoryBatchRecord(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+
+    @property
+    def history(self) -> google___protobuf___internal___containers___RepeatedCompositeFieldContainer[type___HistoryRecord]: ...
+
+    def __init__(self,
+        *,
+        history : typing___Optional[typing___Iterable[type___HistoryRecord]] = None,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions___Literal[u"history",b"history"]) -> None: ...
+type___HistoryBatchRecord = HistoryBatchRecord
+
 class HistoryItem(google___protobuf___message___Message):
     DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
     key: typing___Text = ...
@@ -48,6 +48,9 @@ class TelemetryRecord(google___protobuf___message___Message):
     @property
     def label(self) -> type___Labels: ...
 
+    @property
+    def file_stream(self) -> type___FileStream: ...
+
     def __init__(self,
         *,
         imports_init : typing___Optional[type___Imports] = None,
@@ -58,9 +61,10 @@ class TelemetryRecord(google___protobuf___message___Message):
         huggingface_version : typing___Optional[typing___Text] = None,
         env : typing___Optional[type___Env] = None,
         label : typing___Optional[type___Labels] = None,
+        file_stream : typing___Optional[type___FileStream] = None,
         ) -> None: ...
-    def HasField(self, field_name: typing_extensions___Literal[u"env",b"env",u"feature",b"feature",u"imports_finish",b"imports_finish",u"imports_init",b"imports_init",u"label",b"label"]) -> builtin___bool: ...
-    def ClearField(self, field_name: typing_extensions___Literal[u"cli_version",b"cli_version",u"env",b"env",u"feature",b"feature",u"huggingface_version",b"huggingface_version",u"imports_finish",b"imports_finish",u"imports_init",b"imports_init",u"label",b"label",u"python_version",b"python_version"]) -> None: ...
+    def HasField(self, field_name: typing_extensions___Literal[u"env",b"env",u"feature",b"feature",u"file_stream",b"file_stream",u"imports_finish",b"imports_finish",u"imports_init",b"imports_init",u"label",b"label"]) -> builtin___bool: ...
+    def ClearField(self, field_name: typing_extensions___Literal[u"cli_version",b"cli_version",u"env",b"env",u"feature",b"feature",u"file_stream",b"file_stream",u"huggingface_version",b"huggingface_version",u"imports_finish",b"imports_finish",u"imports_init",b"imports_init",u"label",b"label",u"python_version",b"python_version"]) -> None: ...
 type___TelemetryRecord = TelemetryRecord
 
 class Imports(google___protobuf___message___Message):
@@ -162,3 +166,20 @@ class Labels(google___protobuf___message___Message):
         ) -> None: ...
     def ClearField(self, field_name: typing_extensions___Literal[u"code_string",b"code_string",u"code_version",b"code_version",u"repo_string",b"repo_string"]) -> None: ...
 type___Labels = Labels
+
+class FileStream(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    max_queue_depth: builtin___int = ...
+    max_lag_ms: builtin___int = ...
+    rate_limited: builtin___int = ...
+    max_inflight: builtin___int = ...
+
+    def __init__(self,
+        *,
+        max_queue_depth : typing___Optional[builtin___int] = None,
+        max_lag_ms : typing___Optional[builtin___int] = None,
+        rate_limited : typing___Optional[builtin___int] = None,
+        max_inflight : typing___Optional[builtin___int] = None,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions___Literal[u"max_inflight",b"max_inflight",u"max_lag_ms",b"max_lag_ms",u"max_queue_depth",b"max_queue_depth",u"rate_limited",b"rate_limited"]) -> None: ...
+type___FileStream = FileStream
@@ -14,7 +14,9 @@ import sys
 import threading
 
 import wandb
+from wandb.proto import wandb_internal_pb2 as pb
 
+from . import ring_queue
 from ..interface import interface
 from ..internal.internal import wandb_internal
 
@@ -75,6 +77,16 @@ class Backend(object):
         ctx = multiprocessing.get_context(start_method)
         self._multiprocessing = ctx
 
+    def _record_queue(self):
+        """Create the queue used to send records to the internal process."""
+        transport = self._settings._transport or "queue"
+        if transport == "shm" and self._settings.start_method != "thread":
+            if ring_queue.is_available():
+                logger.info("using shared memory transport")
+                return ring_queue.RingQueue(self._multiprocessing, pb.Record)
+            logger.warning("shared memory transport unavailable, using queue")
+        return self._multiprocessing.Queue()
+
     def ensure_launched(self):
         """Launch backend worker if not running."""
         settings = dict(self._settings or ())
@@ -86,7 +98,7 @@ class Backend(object):
         if "_early_logger" in settings:
             del settings["_early_logger"]
 
-        self.record_q = self._multiprocessing.Queue()
+        self.record_q = self._record_queue()
         self.result_q = self._multiprocessing.Queue()
         if settings.get("start_method") != "thread":
             process_class = self._multiprocessing.Process
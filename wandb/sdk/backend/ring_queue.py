@@ -0,0 +1,186 @@
+#
+# -*- coding: utf-8 -*-
+"""Ring queue - shared memory transport for protobuf records.
+
+RingQueue is a drop-in replacement for the multiprocessing.Queue used as the
+record queue between the user process and the internal process.  Instead of
+pickling records and pushing them through a pipe from a feeder thread, put()
+writes the serialized protobuf directly into a shared memory ring buffer and
+rings a semaphore doorbell; get() waits on the doorbell and parses the message
+back out of the ring.
+
+Ring layout (all integers little endian):
+    header: write_pos (u64), num_put (u64), read_pos (u64), num_get (u64)
+    data:   frames of [length (u32)][sequence number (u64)][serialized message]
+
+Positions increase monotonically and are taken modulo the ring size, so frames
+may wrap around the end of the data area.  Producers serialize on a lock and
+are the only writers of write_pos/num_put, the single consumer is the only
+writer of read_pos/num_get.  Messages too large for the ring, or put while the
+ring stays full for _FULL_TIMEOUT seconds, are passed through an overflow queue
+instead, so put() never blocks for long.  Each message is numbered by num_put
+when it is put, and get() returns them in that order whichever way they went.
+
+"""
+
+import struct
+import time
+
+from six.moves import queue
+import wandb
+
+try:
+    from multiprocessing import shared_memory  # type: ignore
+except ImportError:
+    shared_memory = None  # type: ignore
+
+if wandb.TYPE_CHECKING:
+    from typing import Any, Dict, Optional, Type
+
+    from google.protobuf.message import Message
+
+
+DEFAULT_RING_SIZE = 4 * 1024 * 1024
+
+_HEADER = struct.Struct("<QQQQ")
+# position and message count, written by producers at 0 and the consumer at 16
+_POSITION = struct.Struct("<QQ")
+_FRAME = struct.Struct("<IQ")
+# seconds between checks for free space when the ring is full
+_FULL_WAIT = 0.001
+# seconds to wait for free space before a message goes to the overflow queue
+_FULL_TIMEOUT = 0.1
+
+
+def is_available() -> bool:
+    return shared_memory is not None
+
+
+class RingQueue(object):
+    """Queue of protobuf messages backed by a shared memory ring buffer."""
+
+    def __init__(
+        self, ctx: "Any", message_class: "Type[Message]", size: int = DEFAULT_RING_SIZE,
+    ) -> None:
+        self._size = size
+        self._message_class = message_class
+        self._shm = shared_memory.SharedMemory(create=True, size=_HEADER.size + size)
+        _HEADER.pack_into(self._shm.buf, 0, 0, 0, 0, 0)
+        self._lock = ctx.Lock()
+        self._doorbell = ctx.Semaphore(0)
+        self._overflow_q = ctx.Queue()
+        # overflow messages received ahead of their turn, by sequence number
+        self._stash = {}  # type: Dict[int, bytes]
+        self._owner = True
+
+    def __getstate__(self) -> "Dict[str, Any]":
+        return dict(
+            name=self._shm.name,
+            size=self._size,
+            message_class=self._message_class,
+            lock=self._lock,
+            doorbell=self._doorbell,
+            overflow_q=self._overflow_q,
+        )
+
+    def __setstate__(self, state: "Dict[str, Any]") -> None:
+        self._size = state["size"]
+        self._message_class = state["message_class"]
+        self._shm = shared_memory.SharedMemory(name=state["name"])
+        self._lock = state["lock"]
+        self._doorbell = state["doorbell"]
+        self._overflow_q = state["overflow_q"]
+        self._stash = {}
+        self._owner = False
+
+    def _write(self, pos: int, data: "Any") -> None:
+        buf = self._shm.buf
+        offset = pos % self._size
+        first = min(len(data), self._size - offset)
+        start = _HEADER.size + offset
+        buf[start : start + first] = data[:first]
+        if first < len(data):
+            buf[_HEADER.size : _HEADER.size + len(data) - first] = data[first:]
+
+    def _read(self, pos: int, length: int) -> bytes:
+        buf = self._shm.buf
+        offset = pos % self._size
+        first = min(length, self._size - offset)
+        start = _HEADER.size + offset
+        data = bytes(buf[start : start + first])
+        if first < length:
+            data += bytes(buf[_HEADER.size : _HEADER.size + length - first])
+        return data
+
+    def put(
+        self, message: "Message", block: bool = True, timeout: "Optional[float]" = None
+    ) -> None:
+        data = memoryview(message.SerializeToString())
+        needed = _FRAME.size + len(data)
+        overflow = needed > self._size // 4
+        wait = _FULL_TIMEOUT if timeout is None else min(timeout, _FULL_TIMEOUT)
+        deadline = time.time() + wait if block else None
+
+        with self._lock:
+            while True:
+                write_pos, num_put, read_pos, _ = _HEADER.unpack_from(self._shm.buf, 0)
+                if overflow or self._size - (write_pos - read_pos) >= needed:
+                    break
+                if deadline is None or time.time() >= deadline:
+                    overflow = True
+                    break
+                time.sleep(_FULL_WAIT)
+
+            if overflow:
+                self._overflow_q.put((num_put, data.tobytes()))
+            else:
+                self._write(write_pos, _FRAME.pack(len(data), num_put))
+                self._write(write_pos + _FRAME.size, data)
+                write_pos += needed
+            # publish the message after its contents are in place
+            _POSITION.pack_into(self._shm.buf, 0, write_pos, num_put + 1)
+        self._doorbell.release()
+
+    def get(self, block: bool = True, timeout: "Optional[float]" = None) -> "Message":
+        if not self._doorbell.acquire(block, timeout):
+            raise queue.Empty
+
+        write_pos, _, read_pos, num_get = _HEADER.unpack_from(self._shm.buf, 0)
+        data = self._stash.pop(num_get, None)
+        if data is None and read_pos < write_pos:
+            length, seq = _FRAME.unpack(self._read(read_pos, _FRAME.size))
+            if seq == num_get:
+                data = self._read(read_pos + _FRAME.size, length)
+                read_pos += _FRAME.size + length
+        while data is None:
+            # the message went through the overflow queue, whose messages from
+            # different producers may arrive out of order
+            seq, overflow_data = self._overflow_q.get()
+            if seq == num_get:
+                data = overflow_data
+            else:
+                self._stash[seq] = overflow_data
+        _POSITION.pack_into(self._shm.buf, 16, read_pos, num_get + 1)
+
+        message = self._message_class()
+        message.ParseFromString(data)
+        return message
+
+    def put_nowait(self, message: "Message") -> None:
+        self.put(message, block=False)
+
+    def get_nowait(self) -> "Message":
+        return self.get(block=False)
+
+    def qsize(self) -> int:
+        _, num_put, _, num_get = _HEADER.unpack_from(self._shm.buf, 0)
+        return int(num_put - num_get)
+
+    def empty(self) -> bool:
+        return self.qsize() == 0
+
+    def close(self) -> None:
+        self._overflow_q.close()
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
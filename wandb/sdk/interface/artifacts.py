@@ -3,14 +3,29 @@ import binascii
 import codecs
 import contextlib
 import hashlib
+import json
+import logging
+import multiprocessing
+import multiprocessing.dummy
 import os
 import random
+import re
+import sys
+import threading
+import time
 
 import wandb
 from wandb import env
 from wandb import util
 from wandb.data_types import WBValue
 
+try:
+    import sqlite3
+except ImportError:  # some python builds do not ship sqlite3
+    sqlite3 = None  # type: ignore
+
+scandir = getattr(os, "scandir", None)
+
 if wandb.TYPE_CHECKING:  # type: ignore
 
     from typing import (
@@ -19,15 +34,23 @@ if wandb.TYPE_CHECKING:  # type: ignore
         Union,
         Dict,
         Callable,
+        Iterable,
+        Iterator,
         TYPE_CHECKING,
+        Any,
         Sequence,
         Tuple,
+        MutableMapping,
+        Pattern,
     )
 
     if TYPE_CHECKING:
         import wandb.filesync.step_prepare.StepPrepare as StepPrepare  # type: ignore
 
 
+logger = logging.getLogger(__name__)
+
+
 def md5_string(string: str) -> str:
     hash_md5 = hashlib.md5()
     hash_md5.update(string.encode())
@@ -38,10 +61,13 @@ def b64_string_to_hex(string):
     return binascii.hexlify(base64.standard_b64decode(string)).decode("ascii")
 
 
+_MD5_READ_BYTES = 1024 * 1024
+
+
 def md5_hash_file(path):
     hash_md5 = hashlib.md5()
     with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(64 * 1024), b""):
+        for chunk in iter(lambda: f.read(_MD5_READ_BYTES), b""):
             hash_md5.update(chunk)
     return hash_md5
 
@@ -54,13 +80,250 @@ def md5_file_hex(path: str) -> str:
     return md5_hash_file(path).hexdigest()
 
 
+def walk_files(root: str, follow_symlinks: bool = False) -> Iterator[str]:
+    """Yield the path of each file under root, walking with os.scandir."""
+    if scandir is None:
+        for dirpath, _, filenames in os.walk(root, followlinks=follow_symlinks):
+            for filename in filenames:
+                yield os.path.join(dirpath, filename)
+        return
+    dirs = [root]
+    while dirs:
+        for entry in scandir(dirs.pop()):
+            if entry.is_dir(follow_symlinks=follow_symlinks):
+                dirs.append(entry.path)
+            elif entry.is_file():
+                yield entry.path
+
+
+def _md5_files(paths: Sequence[str]) -> List[Tuple[str, os.stat_result]]:
+    # a work unit of FileHasher, also run in its worker processes
+    return [(md5_file_b64(path), os.stat(path)) for path in paths]
+
+
+class FileHasher(object):
+    """Compute the md5 of many files in parallel.
+
+    Files of at least SMALL_FILE_BYTES are hashed one per thread, hashlib
+    releases the GIL while it hashes their large reads.  Smaller files are
+    hashed in batches of BATCH_FILES, by a process pool when there are at
+    least MIN_PROCESS_FILES of them, as the work per file is then mostly
+    python.  Files unchanged since they were hashed come from the digest cache.
+
+    The process pool is only used when WANDB_ARTIFACT_HASH_PROCESSES is set,
+    on linux: its workers are forked, which can deadlock them when other
+    threads of the parent hold a lock, and starting them with spawn would
+    import the user's main module again.
+    """
+
+    SMALL_FILE_BYTES = 1024 * 1024
+    BATCH_FILES = 256
+    MIN_PROCESS_FILES = 4096
+    THREADS = 8
+
+    def __init__(
+        self,
+        cache: Optional["ArtifactsCache"] = None,
+        threads: Optional[int] = None,
+        processes: Optional[int] = None,
+    ) -> None:
+        self._cache = cache
+        self._threads = threads or env.get_artifact_hash_threads() or self.THREADS
+        if processes is None:
+            processes = env.get_artifact_hash_processes() or 0
+        self._processes = processes if sys.platform.startswith("linux") else 0
+
+    def md5_files_b64(self, paths: Sequence[str]) -> List[str]:
+        """Return the base64 md5 of each file in paths."""
+        digests: List[Optional[str]] = [None] * len(paths)
+        stats = [os.stat(path) for path in paths]
+        small = []
+        units = []
+        cached: List[Optional[str]] = (
+            self._cache.get_md5s(list(zip(paths, stats)))
+            if self._cache
+            else [None] * len(paths)
+        )
+        for i, digest in enumerate(cached):
+            if digest is not None:
+                digests[i] = digest
+            elif stats[i].st_size < self.SMALL_FILE_BYTES:
+                small.append(i)
+            else:
+                units.append([i])
+        small_units = [
+            small[i : i + self.BATCH_FILES]
+            for i in range(0, len(small), self.BATCH_FILES)
+        ]
+        process_units = []
+        if self._processes > 1 and len(small) >= self.MIN_PROCESS_FILES:
+            process_units = small_units
+        else:
+            units.extend(small_units)
+
+        thread_pool = multiprocessing.dummy.Pool(self._threads)
+        process_pool = None
+        try:
+            if process_units:
+                process_pool = multiprocessing.Pool(self._processes)
+                process_results = process_pool.map_async(
+                    _md5_files, [[paths[i] for i in unit] for unit in process_units]
+                )
+            results = thread_pool.map(
+                lambda unit: _md5_files([paths[i] for i in unit]), units
+            )
+            if process_pool is not None:
+                results += process_results.get()
+        finally:
+            thread_pool.close()
+            if process_pool is not None:
+                process_pool.close()
+                process_pool.join()
+            thread_pool.join()
+
+        hashed: List[Tuple[str, os.stat_result, os.stat_result, str]] = []
+        for unit, unit_results in zip(units + process_units, results):
+            for i, (hashed_digest, stat_after) in zip(unit, unit_results):
+                digests[i] = hashed_digest
+                hashed.append((paths[i], stats[i], stat_after, hashed_digest))
+        if self._cache and hashed:
+            self._cache.put_md5s(hashed)
+        found = [digest for digest in digests if digest is not None]
+        assert len(found) == len(paths), "every file is cached or hashed"
+        return found
+
+
 def bytes_to_hex(bytestr):
     # Works in python2 / python3
     return codecs.getencoder("hex")(bytestr)[0]
 
 
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_JSON_NUMBER_CHARS = re.compile(r"[0-9.eE+-]*")
+
+
+def _match_end(pattern: "Pattern[str]", string: str, pos: int) -> int:
+    """Return where the run of characters matched by pattern at pos ends."""
+    match = pattern.match(string, pos)
+    return match.end() if match else pos
+
+
+class _JSONStream(object):
+    """Reads JSON values one at a time from an iterable of str or utf-8 chunks.
+
+    Only the text that wasn't parsed yet is kept, so a large document can be
+    read without holding it, or all of its values, in memory at once.
+    """
+
+    def __init__(self, chunks: "Iterable[Union[str, bytes]]") -> None:
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            self._eof = True
+            chunk = self._utf8.decode(b"", final=True)
+        if isinstance(chunk, bytes):
+            chunk = self._utf8.decode(chunk)
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next character that isn't whitespace, "" at the end."""
+        if self._pos < len(self._buf) and self._buf[self._pos] not in " \t\n\r":
+            return self._buf[self._pos]
+        while True:
+            self._pos = _match_end(_JSON_WHITESPACE, self._buf, self._pos)
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(
+                "Expecting one of %r in JSON, got %r" % (chars, char or "end of data")
+            )
+        self._pos += 1
+        return char
+
+    def value(self) -> "Any":
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except ValueError:
+                if not self._fill():
+                    raise
+                continue
+            # a number that reaches the end of the buffer, or that is only
+            # followed by the start of a fraction or exponent, may go on in the
+            # next chunk
+            if (
+                not isinstance(value, (int, float))
+                or isinstance(value, bool)
+                or _match_end(_JSON_NUMBER_CHARS, self._buf, end) < len(self._buf)
+                or not self._fill()
+            ):
+                self._pos = end
+                return value
+
+    def keys(self) -> "Iterator[str]":
+        """Iterate over the keys of the object at the current position.
+
+        The value of each key has to be read before asking for the next one.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            if self.peek() != '"':
+                self.expect('"')
+            key = self.value()
+            self.expect(":")
+            yield key
+            if self.expect(",}") == "}":
+                return
+
+    def end(self) -> None:
+        if self.peek():
+            raise ValueError("Extra data after JSON value")
+
+
+def iter_json_object(
+    chunks: "Iterable[Union[str, bytes]]", stream_key: Optional[str] = None
+) -> "Iterator[Tuple[str, Any]]":
+    """Iterate over the (key, value) pairs of the JSON object in chunks.
+
+    The value of stream_key is itself an iterator over the (key, value) pairs
+    of that object, which has to be consumed before the next pair is read.
+    """
+    stream = _JSONStream(chunks)
+    for key in stream.keys():
+        if key == stream_key:
+            yield key, ((k, stream.value()) for k in stream.keys())
+        else:
+            yield key, stream.value()
+    stream.end()
+
+
+# fields of a manifest that from_manifest_stream needs before its contents
+_MANIFEST_HEADER_KEYS = ("version", "storagePolicy", "storagePolicyConfig")
+
+
 class ArtifactManifest(object):
-    entries: Dict[str, "ArtifactEntry"]
+    entries: MutableMapping[str, "ArtifactEntry"]
 
     @classmethod
     # TODO: we don't need artifact here.
@@ -72,6 +335,31 @@ class ArtifactManifest(object):
             if sub.version() == version:
                 return sub.from_manifest_json(artifact, manifest_json)
 
+    @classmethod
+    def from_manifest_stream(cls, artifact, chunks):
+        """Load a manifest from an iterable of chunks of its JSON.
+
+        Entries are handed to the manifest one by one as they are parsed, as
+        long as the fields describing the manifest come before its contents,
+        as they do in manifests written by wandb.
+        """
+        manifest_json = {}
+        pairs = iter_json_object(chunks, stream_key="contents")
+        for key, value in pairs:
+            if key != "contents":
+                manifest_json[key] = value
+            elif all(k in manifest_json for k in _MANIFEST_HEADER_KEYS):
+                manifest_json[key] = value
+                manifest = cls.from_manifest_json(artifact, manifest_json)
+                for _ in value:
+                    pass
+                for _ in pairs:
+                    pass
+                return manifest
+            else:
+                manifest_json[key] = list(value)
+        return cls.from_manifest_json(artifact, manifest_json)
+
     @classmethod
     def version(cls):
         pass
@@ -87,6 +375,10 @@ class ArtifactManifest(object):
     def digest(self):
         raise NotImplementedError()
 
+    def sorted_entries(self):
+        """Iterate over the entries sorted by path."""
+        return iter(sorted(self.entries.values(), key=lambda entry: entry.path))
+
     def add_entry(self, entry):
         if (
             entry.path in self.entries
@@ -593,6 +885,12 @@ class Artifact(object):
         root before calling `download` if you want the contents of `root` to exactly
         match the artifact.
 
+        NOTE: Files are copied from the artifacts cache, or linked to it, as set by
+        WANDB_ARTIFACT_MATERIALIZE (copy, hardlink, reflink or symlink). Linked
+        cache files are made read only. Files are copied instead of linked while
+        WANDB_ARTIFACT_CACHE_MAX_SIZE is set, as evicting a linked cache file
+        would break symlinks to it and free no space taken by hardlinks.
+
         Arguments:
             root: (str, optional) The directory in which to download this artifact's files.
             recursive: (bool, optional) If true, then all dependent artifacts are eagerly
@@ -822,35 +1120,212 @@ class StorageHandler(object):
 
 
 class ArtifactsCache(object):
+    """Cache of artifact files, by md5 or etag, shared by processes on a host.
 
-    _TMP_PREFIX = "tmp"
+    An sqlite index in the cache dir tracks the size and last access of each
+    object, and the least recently used objects are evicted when the cache
+    grows past max_size bytes.  Objects staged for an artifact upload are
+    pinned until they are uploaded, and are not evicted meanwhile.  The index
+    also holds the digest cache of local files.  Without sqlite, or if the
+    index can't be used, lookups stat the files and cleanup walks the cache.
+    """
 
-    def __init__(self, cache_dir):
+    _TMP_PREFIX = "tmp"
+    _INDEX_DB = "index.db"
+    # digests of files modified less than this many seconds before they were
+    # hashed are not cached, the file could change again within the same mtime
+    _DIGEST_RACY_SECONDS = 2
+    # stays below the 999 parameters an sqlite query could take before 3.32
+    _DIGEST_LOOKUP_BATCH = 500
+    # the last access of an object is only updated once in this many seconds
+    _ACCESS_RESOLUTION_SECONDS = 60
+    # temp files not written to for this long were left by a writer that died
+    _TMP_STALE_SECONDS = 24 * 60 * 60
+    # pins lapse after this long, in case the pinned objects are never uploaded
+    _PIN_SECONDS = 24 * 60 * 60
+    _INDEX_TIMEOUT = 30
+    _EVICT_BATCH = 100
+
+    def __init__(self, cache_dir: str, max_size: Optional[int] = None) -> None:
         self._cache_dir = cache_dir
         util.mkdir_exists_ok(self._cache_dir)
         self._md5_obj_dir = os.path.join(self._cache_dir, "obj", "md5")
         self._etag_obj_dir = os.path.join(self._cache_dir, "obj", "etag")
-        self._artifacts_by_id = {}
+        self._max_size = max_size
+        self._artifacts_by_id: Dict[str, Artifact] = {}
         self._random = random.Random()
         self._random.seed()
+        self._index_path = os.path.join(self._cache_dir, self._INDEX_DB)
+        self._index_lock = threading.Lock()
+        self._index_conn: Optional[sqlite3.Connection] = None
+        self._index_pid: Optional[int] = None
+        self._index_disabled = sqlite3 is None
+        self._index_built = False
+
+    @property
+    def max_size(self) -> Optional[int]:
+        return self._max_size
 
     def check_md5_obj_path(self, b64_md5: str, size: int) -> Tuple[str, bool, Callable]:
+        return self._check_obj_path(self._md5_obj_path(b64_md5), size)
+
+    def _md5_obj_path(self, b64_md5: str) -> str:
         hex_md5 = util.bytes_to_hex(base64.b64decode(b64_md5))
-        path = os.path.join(self._cache_dir, "obj", "md5", hex_md5[:2], hex_md5[2:])
-        opener = self._cache_opener(path)
-        if os.path.isfile(path) and os.path.getsize(path) == size:
-            return path, True, opener
-        util.mkdir_exists_ok(os.path.dirname(path))
-        return path, False, opener
+        return os.path.join(self._cache_dir, "obj", "md5", hex_md5[:2], hex_md5[2:])
 
     def check_etag_obj_path(self, etag: str, size: int) -> Tuple[str, bool, Callable]:
         path = os.path.join(self._cache_dir, "obj", "etag", etag[:2], etag[2:])
+        return self._check_obj_path(path, size)
+
+    def _check_obj_path(self, path: str, size: int) -> Tuple[str, bool, Callable]:
         opener = self._cache_opener(path)
-        if os.path.isfile(path) and os.path.getsize(path) == size:
+        rel_path = os.path.relpath(path, self._cache_dir)
+        row = self._index(
+            lambda conn: conn.execute(
+                "SELECT size, accessed FROM objects WHERE path = ?", (rel_path,)
+            ).fetchone()
+        )
+        if row is not None and row[0] == size:
+            if os.path.isfile(path):
+                if time.time() - row[1] > self._ACCESS_RESOLUTION_SECONDS:
+                    self._index(
+                        lambda conn: conn.execute(
+                            "UPDATE objects SET accessed = ? WHERE path = ?",
+                            (time.time(), rel_path),
+                        ),
+                        write=True,
+                    )
+                return path, True, opener
+            # removed without updating the index, e.g. by hand or by a cleanup
+            # without it
+            self._index(lambda conn: self._index_remove(conn, rel_path), write=True)
+        elif row is None and os.path.isfile(path) and os.path.getsize(path) == size:
+            # written before the index existed, or by a client without one
+            self._index(lambda conn: self._index_add(conn, rel_path, size), write=True)
             return path, True, opener
         util.mkdir_exists_ok(os.path.dirname(path))
         return path, False, opener
 
+    def md5_file_b64(self, path: str) -> str:
+        """Return the base64 md5 of a file, from the digest cache if unchanged.
+
+        Digests are cached by path, and reused while the device, inode, size
+        and mtime of the file are the same.  WANDB_ARTIFACT_STRICT_DIGESTS
+        bypasses the cache and always hashes the file.
+        """
+        stat = os.stat(path)
+        digest = self.get_md5(path, stat)
+        if digest is None:
+            digest = md5_file_b64(path)
+            self.put_md5s([(path, stat, os.stat(path), digest)])
+        return digest
+
+    def get_md5(self, path: str, stat: os.stat_result) -> Optional[str]:
+        """Return the cached md5 of a file, if it has not changed since."""
+        return self.get_md5s([(path, stat)])[0]
+
+    def get_md5s(
+        self, files: Sequence[Tuple[str, os.stat_result]]
+    ) -> List[Optional[str]]:
+        """Return the cached md5 of each (path, stat), if it has not changed since.
+
+        The digests are looked up _DIGEST_LOOKUP_BATCH paths per query.
+        """
+        if env.get_artifact_strict_digests() or not files:
+            return [None] * len(files)
+        abs_paths = [os.path.abspath(path) for path, _ in files]
+
+        def lookup(conn: "sqlite3.Connection") -> Dict[str, Tuple]:
+            rows = {}
+            for i in range(0, len(abs_paths), self._DIGEST_LOOKUP_BATCH):
+                batch = abs_paths[i : i + self._DIGEST_LOOKUP_BATCH]
+                for row in conn.execute(
+                    "SELECT path, dev, ino, size, mtime_ns, digest FROM digests"
+                    " WHERE path IN (%s)" % ", ".join("?" * len(batch)),
+                    batch,
+                ):
+                    rows[row[0]] = row[1:]
+            return rows
+
+        rows = self._index(lookup) or {}
+        digests = []
+        for abs_path, (_, stat) in zip(abs_paths, files):
+            row = rows.get(abs_path)
+            if row and tuple(row[:4]) == _digest_key(stat):
+                digests.append(row[4])
+            else:
+                digests.append(None)
+        return digests
+
+    def put_md5s(
+        self, digests: Sequence[Tuple[str, os.stat_result, os.stat_result, str]]
+    ) -> None:
+        """Cache the md5 of files, given as (path, stat, stat_after, digest).
+
+        Files that changed while they were hashed, or were modified less than
+        _DIGEST_RACY_SECONDS before, are not cached.
+        """
+        if env.get_artifact_strict_digests():
+            return
+        now = time.time()
+        rows = []
+        for path, stat, stat_after, digest in digests:
+            key = _digest_key(stat)
+            if (
+                _digest_key(stat_after) == key
+                and now - stat_after.st_mtime > self._DIGEST_RACY_SECONDS
+            ):
+                rows.append((os.path.abspath(path),) + key + (digest,))
+        if rows:
+            self._index(
+                lambda conn: conn.executemany(
+                    "INSERT OR REPLACE INTO digests VALUES (?, ?, ?, ?, ?, ?)", rows
+                ),
+                write=True,
+            )
+
+    def pin_md5_objs(self, b64_md5s: Sequence[str]) -> None:
+        """Keep the objects of these digests from being evicted until unpinned.
+
+        Objects are pinned when they are staged for an artifact upload, and
+        unpinned once uploaded.  Pins are counted, so an object staged twice
+        stays pinned until both uploads are done.
+        """
+        rel_paths = [
+            os.path.relpath(self._md5_obj_path(b64_md5), self._cache_dir)
+            for b64_md5 in b64_md5s
+        ]
+
+        def pin(conn: "sqlite3.Connection") -> None:
+            now = time.time()
+            for rel_path in rel_paths:
+                # a lapsed pin starts counting again
+                if not conn.execute(
+                    "UPDATE pins SET count = CASE WHEN pinned > ? THEN count + 1"
+                    " ELSE 1 END, pinned = ? WHERE path = ?",
+                    (now - self._PIN_SECONDS, now, rel_path),
+                ).rowcount:
+                    conn.execute("INSERT INTO pins VALUES (?, 1, ?)", (rel_path, now))
+
+        if rel_paths:
+            self._index(pin, write=True)
+
+    def unpin_md5_objs(self, b64_md5s: Sequence[str]) -> None:
+        """Release pins taken with pin_md5_objs."""
+        rel_paths = [
+            (os.path.relpath(self._md5_obj_path(b64_md5), self._cache_dir),)
+            for b64_md5 in b64_md5s
+        ]
+
+        def unpin(conn: "sqlite3.Connection") -> None:
+            conn.executemany(
+                "UPDATE pins SET count = count - 1 WHERE path = ?", rel_paths
+            )
+            conn.execute("DELETE FROM pins WHERE count <= 0")
+
+        if rel_paths:
+            self._index(unpin, write=True)
+
     def get_artifact(self, artifact_id):
         return self._artifacts_by_id.get(artifact_id)
 
@@ -858,20 +1333,53 @@ class ArtifactsCache(object):
         self._artifacts_by_id[artifact.id] = artifact
 
     def cleanup(self, target_size: int) -> int:
+        """Evict the least recently used objects until the cache is below target_size.
+
+        Pinned objects are kept, and so are temp files written to in the last
+        _TMP_STALE_SECONDS, as other processes may still be writing them.
+        Returns the number of bytes reclaimed.
+        """
+        reclaimed = self._remove_stale_tmp()
+        self._index_ensure_built()
+        evicted = self._index(
+            lambda conn: self._index_evict(conn, target_size), write=True
+        )
+        if evicted is None:
+            # only walk the cache without an index, a busy index still pins
+            # objects
+            evicted = self._cleanup_walk(target_size) if self._index_disabled else 0
+        return reclaimed + evicted
+
+    def _remove_stale_tmp(self) -> int:
+        reclaimed = 0
+        stale = time.time() - self._TMP_STALE_SECONDS
+        obj_dir = os.path.join(self._cache_dir, "obj")
+        for path in walk_files(obj_dir) if os.path.isdir(obj_dir) else []:
+            if not os.path.basename(path).startswith(ArtifactsCache._TMP_PREFIX):
+                continue
+            try:
+                stat = os.stat(path)
+                if stat.st_mtime < stale:
+                    os.remove(path)
+                    reclaimed += stat.st_size
+            except OSError:
+                # renamed or removed by another process
+                pass
+        return reclaimed
+
+    def _cleanup_walk(self, target_size: int) -> int:
         bytes_reclaimed: int = 0
-        paths: Dict[os.PathLike, os.stat_result] = {}
+        paths: Dict[str, os.stat_result] = {}
         total_size: int = 0
         for root, _, files in os.walk(self._cache_dir):
             for file in files:
                 path = os.path.join(root, file)
                 stat = os.stat(path)
 
+                if path.startswith(self._index_path):
+                    continue
+
                 if file.startswith(ArtifactsCache._TMP_PREFIX):
-                    try:
-                        os.remove(path)
-                        bytes_reclaimed += stat.st_size
-                    except OSError:
-                        pass
                     continue
 
                 paths[path] = stat
@@ -891,6 +1399,183 @@ class ArtifactsCache(object):
             bytes_reclaimed += stat.st_size
         return bytes_reclaimed
 
+    def _index(self, fn: Callable, write: bool = False) -> Any:
+        """Return fn(conn) run on the cache index, or None without an index.
+
+        Writes run in a transaction, so processes sharing the cache see the
+        index and its total size change together.
+        """
+        with self._index_lock:
+            if self._index_disabled:
+                return None
+            try:
+                conn = self._index_connect()
+                if not write:
+                    return fn(conn)
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    result = fn(conn)
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+                conn.execute("COMMIT")
+                return result
+            except sqlite3.Error as e:
+                if isinstance(e, sqlite3.OperationalError) and "locked" in str(e):
+                    # held by another process for longer than the timeout,
+                    # go without the index this time
+                    logger.warning("artifacts cache index is busy: %s", e)
+                    return None
+                logger.exception("disabling the artifacts cache index")
+                self._index_disabled = True
+                return None
+
+    def _index_connect(self) -> "sqlite3.Connection":
+        # connections can't be shared with forked processes
+        if self._index_conn is not None and self._index_pid == os.getpid():
+            return self._index_conn
+        conn = sqlite3.connect(
+            self._index_path,
+            timeout=self._INDEX_TIMEOUT,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS digests (path TEXT PRIMARY KEY,"
+            " dev INTEGER, ino INTEGER, size INTEGER, mtime_ns INTEGER, digest TEXT)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS objects (path TEXT PRIMARY KEY,"
+            " size INTEGER, accessed REAL)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS objects_accessed ON objects (accessed)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS pins (path TEXT PRIMARY KEY,"
+            " count INTEGER, pinned REAL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER)"
+        )
+        self._index_conn = conn
+        self._index_pid = os.getpid()
+        return conn
+
+    def _index_get(self, conn: "sqlite3.Connection", key: str) -> int:
+        row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else 0
+
+    def _index_set(self, conn: "sqlite3.Connection", key: str, value: int) -> None:
+        conn.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, value))
+
+    def _index_add(self, conn: "sqlite3.Connection", rel_path: str, size: int) -> None:
+        row = conn.execute(
+            "SELECT size FROM objects WHERE path = ?", (rel_path,)
+        ).fetchone()
+        conn.execute(
+            "INSERT OR REPLACE INTO objects VALUES (?, ?, ?)",
+            (rel_path, size, time.time()),
+        )
+        total = self._index_get(conn, "total_size")
+        self._index_set(conn, "total_size", total + size - (row[0] if row else 0))
+
+    def _index_remove(self, conn: "sqlite3.Connection", rel_path: str) -> None:
+        row = conn.execute(
+            "SELECT size FROM objects WHERE path = ?", (rel_path,)
+        ).fetchone()
+        if row is not None:
+            conn.execute("DELETE FROM objects WHERE path = ?", (rel_path,))
+            total = self._index_get(conn, "total_size")
+            self._index_set(conn, "total_size", total - row[0])
+
+    def _index_ensure_built(self) -> None:
+        """Index the objects in the cache dir, unless they already are.
+
+        The cache dir is walked outside of a transaction, so other processes
+        keep using the index meanwhile.  Objects they add are indexed by them,
+        and rows of objects they evict are dropped when looked up.
+        """
+        if self._index_built:
+            return
+        indexed = self._index(lambda conn: self._index_get(conn, "indexed"))
+        if indexed is None:
+            return
+        if not indexed:
+            rows = []
+            obj_dir = os.path.join(self._cache_dir, "obj")
+            for path in walk_files(obj_dir) if os.path.isdir(obj_dir) else []:
+                if os.path.basename(path).startswith(ArtifactsCache._TMP_PREFIX):
+                    continue
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    # evicted by another process
+                    continue
+                rel_path = os.path.relpath(path, self._cache_dir)
+                rows.append((rel_path, stat.st_size, stat.st_atime))
+            if self._index(lambda conn: self._index_build(conn, rows), write=True):
+                self._index_built = True
+        else:
+            self._index_built = True
+
+    def _index_build(
+        self, conn: "sqlite3.Connection", rows: Sequence[Tuple[str, int, float]]
+    ) -> bool:
+        conn.executemany("INSERT OR IGNORE INTO objects VALUES (?, ?, ?)", rows)
+        total = conn.execute("SELECT SUM(size) FROM objects").fetchone()[0]
+        self._index_set(conn, "total_size", total or 0)
+        self._index_set(conn, "indexed", 1)
+        return True
+
+    def _index_evict(
+        self, conn: "sqlite3.Connection", target_size: int, keep: Optional[str] = None
+    ) -> int:
+        """Remove the least recently used objects until below target_size bytes.
+
+        Pinned objects are kept.  Returns the number of bytes reclaimed.
+        """
+        lapsed = time.time() - self._PIN_SECONDS
+        conn.execute("DELETE FROM pins WHERE pinned <= ?", (lapsed,))
+        total = self._index_get(conn, "total_size")
+        reclaimed = 0
+        while total > target_size:
+            rows = conn.execute(
+                "SELECT path, size FROM objects WHERE path != ? AND path NOT IN"
+                " (SELECT path FROM pins) ORDER BY accessed LIMIT ?",
+                (keep or "", self._EVICT_BATCH),
+            ).fetchall()
+            if not rows:
+                break
+            evicted = []
+            for rel_path, size in rows:
+                if total <= target_size:
+                    break
+                try:
+                    os.remove(os.path.join(self._cache_dir, rel_path))
+                except OSError:
+                    pass
+                evicted.append((rel_path,))
+                total -= size
+                reclaimed += size
+            conn.executemany("DELETE FROM objects WHERE path = ?", evicted)
+        self._index_set(conn, "total_size", total)
+        return reclaimed
+
+    def _index_added(self, path: str) -> None:
+        rel_path = os.path.relpath(path, self._cache_dir)
+        size = os.path.getsize(path)
+        if self._max_size is not None:
+            self._index_ensure_built()
+
+        def add(conn: "sqlite3.Connection") -> None:
+            self._index_add(conn, rel_path, size)
+            if self._max_size is not None:
+                self._index_evict(conn, self._max_size, keep=rel_path)
+
+        self._index(add, write=True)
+
     def _cache_opener(self, path):
         @contextlib.contextmanager
         def helper(mode="w"):
@@ -903,8 +1588,15 @@ class ArtifactsCache(object):
                     util.rand_alphanumeric(length=8, rand=self._random),
                 ),
             )
-            with util.fsync_open(tmp_file, mode=mode) as f:
-                yield f
+            try:
+                with util.fsync_open(tmp_file, mode=mode) as f:
+                    yield f
+            except BaseException:
+                try:
+                    os.remove(tmp_file)
+                except OSError:
+                    pass
+                raise
 
             try:
                 # Use replace where we can, as it implements an atomic
@@ -926,10 +1618,18 @@ class ArtifactsCache(object):
                 os.replace(tmp_file, path)
             except AttributeError:
                 os.rename(tmp_file, path)
+            self._index_added(path)
 
         return helper
 
 
+def _digest_key(stat):
+    mtime_ns = getattr(stat, "st_mtime_ns", None)
+    if mtime_ns is None:
+        mtime_ns = int(stat.st_mtime * 1e9)
+    return stat.st_dev, stat.st_ino, stat.st_size, mtime_ns
+
+
 _artifacts_cache = None
 
 
@@ -937,5 +1637,17 @@ def get_artifacts_cache() -> ArtifactsCache:
     global _artifacts_cache
     if _artifacts_cache is None:
         cache_dir = os.path.join(env.get_cache_dir(), "artifacts")
-        _artifacts_cache = ArtifactsCache(cache_dir)
+        max_size = None
+        human_max_size = env.get_artifact_cache_max_size()
+        if human_max_size is not None:
+            try:
+                max_size = util.from_human_size(human_max_size)
+            except ValueError as e:
+                logger.warning(
+                    "ignoring %s=%r, the cache size is not limited: %s",
+                    env.ARTIFACT_CACHE_MAX_SIZE,
+                    human_max_size,
+                    e,
+                )
+        _artifacts_cache = ArtifactsCache(cache_dir, max_size=max_size)
     return _artifacts_cache
@@ -22,6 +22,7 @@ from wandb.util import (
     json_dumps_safer,
     json_dumps_safer_history,
     json_friendly,
+    json_friendly_scalars,
     json_friendly_val,
     maybe_compress_summary,
     WandBJSONEncoderOld,
@@ -33,7 +34,7 @@ from ..wandb_artifacts import Artifact
 if wandb.TYPE_CHECKING:
     import typing as t
     from . import summary_record as sr
-    from typing import Any, Dict, Iterable, Optional, Tuple, Union
+    from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
     from multiprocessing import Process
     from typing import cast
     from typing import TYPE_CHECKING
@@ -215,22 +216,51 @@ class BackendSender(object):
         rec = self._make_record(preempting=preempt_rec)
         self._publish(rec)
 
-    def publish_history(
-        self, data: dict, step: int = None, run: "Run" = None, publish_step: bool = True
+    def _make_history(
+        self,
+        history: pb.HistoryRecord,
+        data: dict,
+        step: Optional[int],
+        run: Optional["Run"],
+        publish_step: bool,
     ) -> None:
-        run = run or self._run
-        data = data_types.history_dict_to_json(run, data, step=step)
-        history = pb.HistoryRecord()
         if publish_step:
             assert step is not None
             history.step.num = step
+        # encode the row once, the internal process passes it through as is
+        row = json_friendly_scalars(data)
+        if row is not None:
+            # only numbers and strings, skip the media and encoder machinery
+            row.pop("_step", None)
+            history.row_json = json.dumps(row)
+            return
+        data = data_types.history_dict_to_json(run, data, step=step)
         data.pop("_step", None)
-        for k, v in six.iteritems(data):
-            item = history.item.add()
-            item.key = k
-            item.value_json = json_dumps_safer_history(v)  # type: ignore
+        history.row_json = json_dumps_safer_history(data)  # type: ignore
+
+    def publish_history(
+        self, data: dict, step: int = None, run: "Run" = None, publish_step: bool = True
+    ) -> None:
+        run = run or self._run
+        history = pb.HistoryRecord()
+        self._make_history(history, data, step, run, publish_step)
         self._publish_history(history)
 
+    def publish_history_batch(
+        self,
+        rows: "List[Tuple[dict, int]]",
+        run: "Run" = None,
+        publish_step: bool = True,
+    ) -> None:
+        run = run or self._run
+        # the rows are made in place, _make_record would copy them
+        rec = pb.Record()
+        rec.history_batch.SetInParent()
+        for data, step in rows:
+            history = rec.history_batch.history.add()
+            self._make_history(history, data, step, run, publish_step)
+        self._publish(rec)
+
     def publish_telemetry(self, telem: tpb.TelemetryRecord) -> None:
         rec = self._make_record(telemetry=telem)
         self._publish(rec)
@@ -274,7 +304,7 @@ class BackendSender(object):
             cfg.key = k
             cfg.value_json = json.dumps(v)
 
-        for entry in sorted(artifact_manifest.entries.values(), key=lambda k: k.path):  # type: ignore
+        for entry in artifact_manifest.sorted_entries():
             proto_entry = proto_manifest.contents.add()
             proto_entry.path = entry.path
             proto_entry.digest = entry.digest
@@ -15,16 +15,31 @@ header :=
   ident: char[4]
   magic: uint16
   version: uint8
+
+In version 1 (compressed) logs the data of every record, after the fragments
+of a record split over several blocks are joined, is:
+
+data :=
+  codec: uint8         // One of NONE, ZLIB, ZSTD
+  payload: uint8[]     // serialized Record, compressed with codec
 """
 from __future__ import print_function
 
 import logging
+import mmap
 import os
 import struct
 import sys
+import time
 import zlib
 
 import wandb
+from wandb.proto import wandb_internal_pb2
+
+try:
+    import zstandard  # type: ignore
+except ImportError:
+    zstandard = None
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +59,28 @@ LEVELDBLOG_HEADER_MAGIC = (
     0xBEE1  # zlib.crc32(bytes("Weights & Biases", 'iso8859-1')) & 0xffff
 )
 LEVELDBLOG_HEADER_VERSION = 0
+LEVELDBLOG_HEADER_VERSION_COMPRESSED = 1
+
+LEVELDBLOG_CODEC_NONE = 0
+LEVELDBLOG_CODEC_ZLIB = 1
+LEVELDBLOG_CODEC_ZSTD = 2
+
+COMPRESSION_NONE = "none"
+COMPRESSION_ZLIB = "zlib"
+COMPRESSION_ZSTD = "zstd"
+# records smaller than this rarely shrink and are stored as they are
+COMPRESSION_MIN_BYTES = 128
+ZLIB_LEVEL = 1
+ZSTD_LEVEL = 3
+
+# when written records are flushed and fsynced to disk, records written since
+# the last sync are committed together
+DURABILITY_NONE = "none"  # only when the log is closed, by the os
+DURABILITY_INTERVAL = "interval"  # every DURABILITY_SECONDS
+DURABILITY_BYTES = "bytes"  # every DURABILITY_BYTES written
+DURABILITY_RECORD = "record"  # after every record
+DURABILITY_SECONDS = 2.0
+DURABILITY_BYTES_DEFAULT = 4 * 1024 * 1024
 
 try:
     bytes("", "ascii")
@@ -60,12 +97,73 @@ except Exception:
     # bytestostr = str
 
 
+def _check_version(version):
+    if version not in (LEVELDBLOG_HEADER_VERSION, LEVELDBLOG_HEADER_VERSION_COMPRESSED):
+        raise Exception("Invalid header")
+
+
+def _decode(data):
+    """Return the serialized Record of the data of a compressed log record."""
+    assert len(data), "record codec is missing, data may be corrupt"
+    codec = data[0]
+    if not isinstance(codec, int):
+        codec = ord(codec)
+    if codec == LEVELDBLOG_CODEC_NONE:
+        return data[1:]
+    try:
+        if codec == LEVELDBLOG_CODEC_ZLIB:
+            return zlib.decompress(data[1:])
+        if codec == LEVELDBLOG_CODEC_ZSTD:
+            if zstandard is None:
+                raise Exception(
+                    "Record is compressed with zstd, install the zstandard package "
+                    "to read it"
+                )
+            return zstandard.ZstdDecompressor().decompress(data[1:])
+    except (zlib.error, getattr(zstandard, "ZstdError", zlib.error)) as e:
+        raise AssertionError("record can not be decompressed: {}".format(e))
+    raise AssertionError("unknown record codec {}".format(codec))
+
+
 class DataStore(object):
-    def __init__(self):
+    def __init__(
+        self,
+        durability=None,
+        durability_seconds=None,
+        durability_bytes=None,
+        compression=None,
+    ):
         self._opened_for_scan = False
         self._fp = None
         self._index = 0
         self._size_bytes = 0
+        self._version = LEVELDBLOG_HEADER_VERSION
+
+        self._compression = compression or COMPRESSION_NONE
+        assert self._compression in (
+            COMPRESSION_NONE,
+            COMPRESSION_ZLIB,
+            COMPRESSION_ZSTD,
+        ), "unknown compression {}".format(self._compression)
+        if self._compression == COMPRESSION_ZSTD and zstandard is None:
+            logger.warning("zstandard is not installed, compressing with zlib")
+            self._compression = COMPRESSION_ZLIB
+        self._compressor = None
+        if self._compression == COMPRESSION_ZSTD:
+            self._compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+
+        self._durability = durability or DURABILITY_INTERVAL
+        assert self._durability in (
+            DURABILITY_NONE,
+            DURABILITY_INTERVAL,
+            DURABILITY_BYTES,
+            DURABILITY_RECORD,
+        ), "unknown durability policy {}".format(self._durability)
+        self._durability_seconds = durability_seconds or DURABILITY_SECONDS
+        self._durability_bytes = durability_bytes or DURABILITY_BYTES_DEFAULT
+        # index of the last byte flushed and fsynced, and when it happened
+        self._sync_index = 0
+        self._sync_time = time.time()
 
         self._crc = [0] * (LEVELDBLOG_LAST + 1)
         for x in range(1, LEVELDBLOG_LAST + 1):
@@ -84,14 +182,70 @@ class DataStore(object):
             if os.path.exists(fname):
                 raise IOError("File exists: {}".format(fname))
         self._fp = open(fname, open_flags)
+        if self._compression != COMPRESSION_NONE:
+            self._version = LEVELDBLOG_HEADER_VERSION_COMPRESSED
         self._write_header()
 
     def open_for_append(self, fname):
-        # TODO: implement
+        """Open an existing log to continue writing after its last record.
+
+        The header is validated and the log is scanned up to the end of the last
+        complete record.  Anything after it in the last block, a record torn by a
+        crash while it was written or incomplete block padding, is truncated
+        away.  A log that is corrupt before its last block is left as it is and
+        an exception is raised.
+        """
         self._fname = fname
-        logger.info("open: %s", fname)
-        self._fp = open(fname, "wb")
-        # do something with _index
+        logger.info("open for append: %s", fname)
+        self._fp = open(fname, "r+b")
+        self._index = 0
+        self._size_bytes = os.fstat(self._fp.fileno()).st_size
+        if self._size_bytes < LEVELDBLOG_HEADER_LEN:
+            # the header itself was torn, nothing to keep
+            self._fp.truncate(0)
+            if self._compression != COMPRESSION_NONE:
+                self._version = LEVELDBLOG_HEADER_VERSION_COMPRESSED
+            self._write_header()
+            return
+
+        # the format of the existing log is kept, appended records are only
+        # compressed if it is a compressed log
+        self._read_header()
+        if (
+            self._version == LEVELDBLOG_HEADER_VERSION
+            and self._compression != COMPRESSION_NONE
+        ):
+            logger.info("appending uncompressed records to %s", fname)
+        self._opened_for_scan = True
+        valid_index = self._index
+        while self._index < self._size_bytes:
+            try:
+                # only the framing is checked, a record that was written
+                # completely is kept as it is
+                if self._scan_data() is None:
+                    break
+            except AssertionError as e:
+                if not self.in_last_block():
+                    self._opened_for_scan = False
+                    raise Exception(
+                        "{} is corrupt at {}: {}".format(fname, self._index, e)
+                    )
+                logger.info("torn record at %d: %s", valid_index, e)
+                break
+            valid_index = self._index
+        self._opened_for_scan = False
+
+        if valid_index < self._size_bytes:
+            logger.warning(
+                "truncating %d bytes after last record of %s",
+                self._size_bytes - valid_index,
+                fname,
+            )
+            self._fp.truncate(valid_index)
+        self._fp.seek(valid_index)
+        self._index = valid_index
+        self._size_bytes = valid_index
+        self._sync_index = valid_index
 
     def open_for_scan(self, fname):
         self._fname = fname
@@ -132,6 +286,12 @@ class DataStore(object):
         return dtype, data
 
     def scan_data(self):
+        data = self._scan_data()
+        if data is not None and self._version == LEVELDBLOG_HEADER_VERSION_COMPRESSED:
+            data = _decode(data)
+        return data
+
+    def _scan_data(self):
         # TODO(jhr): handle some assertions as file corruption issues
         # how much left in the block.  if less than header len, read as pad,
         offset = self._index % LEVELDBLOG_BLOCK_LEN
@@ -175,7 +335,7 @@ class DataStore(object):
             "<4sHB",
             strtobytes(LEVELDBLOG_HEADER_IDENT),
             LEVELDBLOG_HEADER_MAGIC,
-            LEVELDBLOG_HEADER_VERSION,
+            self._version,
         )
         assert (
             len(data) == LEVELDBLOG_HEADER_LEN
@@ -197,8 +357,8 @@ class DataStore(object):
             raise Exception("Invalid header")
         if magic != LEVELDBLOG_HEADER_MAGIC:
             raise Exception("Invalid header")
-        if version != LEVELDBLOG_HEADER_VERSION:
-            raise Exception("Invalid header")
+        _check_version(version)
+        self._version = version
         self._index += len(header)
 
     def _write_record(self, s, dtype=None):
@@ -259,10 +419,8 @@ class DataStore(object):
                 data_used += LEVELDBLOG_DATA_LEN
                 data_left -= LEVELDBLOG_DATA_LEN
 
-            # write last and flush the entire block to disk
+            # write last
             self._write_record(s[data_used:], LEVELDBLOG_LAST)
-            self._fp.flush()
-            os.fsync(self._fp.fileno())
 
         return file_offset, self._index - file_offset, flush_index, flush_offset
 
@@ -280,10 +438,266 @@ class DataStore(object):
         raw_size = obj.ByteSize()
         s = obj.SerializeToString()
         assert len(s) == raw_size, "invalid serialization"
+        if self._version == LEVELDBLOG_HEADER_VERSION_COMPRESSED:
+            s = self._encode(s)
         ret = self._write_data(s)
+        if self._sync_due():
+            self.sync()
         return ret
 
+    def _encode(self, s):
+        """Prefix a serialized Record with its codec, compressing it if it pays."""
+        if self._compression != COMPRESSION_NONE and len(s) >= COMPRESSION_MIN_BYTES:
+            if self._compressor is not None:
+                codec = LEVELDBLOG_CODEC_ZSTD
+                compressed = self._compressor.compress(s)
+            else:
+                codec = LEVELDBLOG_CODEC_ZLIB
+                compressed = zlib.compress(s, ZLIB_LEVEL)
+            if len(compressed) < len(s):
+                return struct.pack("B", codec) + compressed
+        return struct.pack("B", LEVELDBLOG_CODEC_NONE) + s
+
+    def _sync_due(self):
+        if self._index == self._sync_index:
+            return False
+        if self._durability == DURABILITY_RECORD:
+            return True
+        if self._durability == DURABILITY_BYTES:
+            return self._index - self._sync_index >= self._durability_bytes
+        if self._durability == DURABILITY_INTERVAL:
+            return time.time() - self._sync_time >= self._durability_seconds
+        return False
+
+    def sync(self):
+        """Flush and fsync all records written since the last sync."""
+        self._fp.flush()
+        os.fsync(self._fp.fileno())
+        self._sync_index = self._index
+        self._sync_time = time.time()
+
+    def debounce(self):
+        """Sync records which are due under the interval policy while idle."""
+        if self._fp is not None and not self._opened_for_scan and self._sync_due():
+            self.sync()
+
     def close(self):
         if self._fp is not None:
             logger.info("close: %s", self._fname)
+            if (
+                not self._opened_for_scan
+                and self._durability != DURABILITY_NONE
+                and self._index != self._sync_index
+            ):
+                self.sync()
             self._fp.close()
+            self._fp = None
+
+
+_RECORD_HEADER = struct.Struct("<IHB")
+
+
+def _read_varint(data, pos):
+    result = 0
+    shift = 0
+    while True:
+        b = data[pos]
+        pos += 1
+        result |= (b & 0x7F) << shift
+        if not b & 0x80:
+            return result, pos
+        shift += 7
+
+
+def _record_type_number(data, numbers):
+    """Return the field number of the record type of a serialized Record.
+
+    Walks the top level field tags until one of the record_type oneof field
+    numbers is found, skipping over other fields without decoding them.
+    """
+    pos = 0
+    length = len(data)
+    while pos < length:
+        # single byte tags and lengths are the common case
+        key = data[pos]
+        pos += 1
+        if key & 0x80:
+            key, pos = _read_varint(data, pos - 1)
+        number, wire_type = key >> 3, key & 0x7
+        if number in numbers:
+            return number
+        if wire_type == 0:
+            while data[pos] & 0x80:
+                pos += 1
+            pos += 1
+        elif wire_type == 1:
+            pos += 8
+        elif wire_type == 2:
+            size = data[pos]
+            pos += 1
+            if size & 0x80:
+                size, pos = _read_varint(data, pos - 1)
+            pos += size
+        elif wire_type == 5:
+            pos += 4
+        else:
+            return None
+    return None
+
+
+class DataScanner(object):
+    """Scan a log through a memory map without copying record data.
+
+    scan_data() and iterating return the data of each record as a memoryview of
+    the map, only records split over several blocks or compressed are returned
+    as bytes.  The views are valid until the scanner is closed.
+
+    Arguments:
+        fname: log to scan
+        verify: check the crc of every record returned
+        record_types: names of the Record.record_type fields to return, other
+            records are skipped by peeking at their field tags
+    """
+
+    def __init__(self, fname, verify=True, record_types=None):
+        self._fname = fname
+        self._verify = verify
+        self._index = 0
+        self._version = LEVELDBLOG_HEADER_VERSION
+
+        self._crc = [0] * (LEVELDBLOG_LAST + 1)
+        for x in range(1, LEVELDBLOG_LAST + 1):
+            self._crc[x] = zlib.crc32(strtobytes(chr(x))) & 0xFFFFFFFF
+
+        oneof = wandb_internal_pb2.Record.DESCRIPTOR.oneofs_by_name["record_type"]
+        numbers = {f.name: f.number for f in oneof.fields}
+        self._type_numbers = set(numbers.values())
+        self._type_names = {number: name for name, number in numbers.items()}
+        self._select = None
+        if record_types is not None:
+            self._select = {numbers[name] for name in record_types}
+
+        logger.info("open for scan: %s", fname)
+        with open(fname, "rb") as f:
+            self._size_bytes = os.fstat(f.fileno()).st_size
+            assert (
+                self._size_bytes >= LEVELDBLOG_HEADER_LEN
+            ), "header is {} bytes instead of the expected {}".format(
+                self._size_bytes, LEVELDBLOG_HEADER_LEN
+            )
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        self._read_header()
+
+    def _read_header(self):
+        ident, magic, version = struct.unpack_from("<4sHB", self._mmap, 0)
+        if ident != strtobytes(LEVELDBLOG_HEADER_IDENT):
+            raise Exception("Invalid header")
+        if magic != LEVELDBLOG_HEADER_MAGIC:
+            raise Exception("Invalid header")
+        _check_version(version)
+        self._version = version
+        self._index = LEVELDBLOG_HEADER_LEN
+
+    def in_last_block(self):
+        """When reading, we want to know if we're in the last block to
+           handle in progress writes"""
+        return self._index > self._size_bytes - LEVELDBLOG_DATA_LEN
+
+    def tell(self):
+        """Return the offset after the last record scanned."""
+        return self._index
+
+    def record_type(self, data):
+        """Return the record_type field name of record data without parsing it."""
+        return self._type_names.get(_record_type_number(data, self._type_numbers))
+
+    def _scan_fragments(self):
+        """Return (checksum, type, start, end) of the fragments of a record."""
+        fragments = []
+        index = self._index
+        size = self._size_bytes
+        while index < size:
+            space_left = LEVELDBLOG_BLOCK_LEN - index % LEVELDBLOG_BLOCK_LEN
+            if space_left < LEVELDBLOG_HEADER_LEN:
+                pad = self._mmap[index : index + space_left]
+                assert pad == b"\x00" * space_left, "invald padding"
+                index += space_left
+                self._index = index
+                continue
+            assert (
+                index + LEVELDBLOG_HEADER_LEN <= size
+            ), "record header is {} bytes instead of the expected {}".format(
+                size - index, LEVELDBLOG_HEADER_LEN
+            )
+            checksum, dlength, dtype = _RECORD_HEADER.unpack_from(self._mmap, index)
+            start = index + LEVELDBLOG_HEADER_LEN
+            index = start + dlength
+            assert index <= size, "record is truncated, data may be corrupt"
+            self._index = index
+
+            fragments.append((checksum, dtype, start, index))
+            if len(fragments) == 1:
+                if dtype == LEVELDBLOG_FULL:
+                    return fragments
+                assert (
+                    dtype == LEVELDBLOG_FIRST
+                ), "expected record to be type {} but found {}".format(
+                    LEVELDBLOG_FIRST, dtype
+                )
+            elif dtype == LEVELDBLOG_LAST:
+                return fragments
+            else:
+                assert (
+                    dtype == LEVELDBLOG_MIDDLE
+                ), "expected record to be type {} but found {}".format(
+                    LEVELDBLOG_MIDDLE, dtype
+                )
+        # eof, possibly in the middle of a record being written
+        return None
+
+    def scan_data(self):
+        view = self._view
+        while True:
+            fragments = self._scan_fragments()
+            if fragments is None:
+                return None
+            if len(fragments) == 1:
+                _, _, start, end = fragments[0]
+                data = view[start:end]
+            else:
+                data = b"".join([view[start:end] for _, _, start, end in fragments])
+            record = data
+            if self._version == LEVELDBLOG_HEADER_VERSION_COMPRESSED:
+                record = _decode(data)
+            if (
+                self._select is not None
+                and _record_type_number(record, self._type_numbers) not in self._select
+            ):
+                continue
+            if self._verify:
+                for checksum, dtype, start, end in fragments:
+                    fragment = data if len(fragments) == 1 else view[start:end]
+                    checksum_computed = (
+                        zlib.crc32(fragment, self._crc[dtype]) & 0xFFFFFFFF
+                    )
+                    assert (
+                        checksum == checksum_computed
+                    ), "record checksum is invalid, data may be corrupt"
+            return record
+
+    def __iter__(self):
+        while True:
+            data = self.scan_data()
+            if data is None:
+                return
+            yield data
+
+    def close(self):
+        logger.info("close: %s", self._fname)
+        try:
+            self._view.release()
+            self._mmap.close()
+        except BufferError:
+            # views handed out are still in use, the map is closed with them
+            pass
@@ -49,11 +49,24 @@ class FilePusher(object):
     """
 
     MAX_UPLOAD_JOBS = 64
+    MAX_CHECKSUM_JOBS = 4
 
-    def __init__(self, api, file_stream, silent=False):
+    def __init__(
+        self,
+        api,
+        file_stream,
+        silent=False,
+        max_jobs=None,
+        max_large_jobs=None,
+        max_checksum_jobs=None,
+    ):
         self._api = api
 
         self._tempdir = tempfile.TemporaryDirectory("wandb")
+        # size and mtime of files when they were queued for upload, files
+        # uploaded before (by an earlier sync) are skipped while unchanged
+        self._file_stats = {}
+        self._uploaded_files = {}
 
         self._stats = stats.Stats()
 
@@ -66,6 +79,7 @@ class FilePusher(object):
             self._incoming_queue,
             self._event_queue,
             self._stats,
+            max_jobs=max_checksum_jobs or self.MAX_CHECKSUM_JOBS,
         )
         self._step_checksum.start()
 
@@ -73,9 +87,10 @@ class FilePusher(object):
             self._api,
             self._stats,
             self._event_queue,
-            self.MAX_UPLOAD_JOBS,
+            max_jobs or self.MAX_UPLOAD_JOBS,
             file_stream=file_stream,
             silent=silent,
+            max_large_jobs=max_large_jobs,
         )
         self._step_upload.start()
 
@@ -87,6 +102,13 @@ class FilePusher(object):
     def get_status(self):
         running = self.is_alive()
         summary = self._stats.summary()
+        # files waiting to be copied and checksummed, then to be uploaded
+        summary["checksum_queue"] = (
+            self._incoming_queue.qsize() + self._step_checksum.pending_count()
+        )
+        summary["upload_queue"] = (
+            self._event_queue.qsize() + self._step_upload.pending_count()
+        )
         return running, summary
 
     def print_status(self, prefix=True):
@@ -148,11 +170,35 @@ class FilePusher(object):
             return
 
         save_name = wandb.util.to_forward_slash_path(save_name)
+        stat = os.stat(path)
+        file_stat = [stat.st_size, stat.st_mtime]
+        if self._uploaded_files.get(save_name) == file_stat:
+            logger.info("skipping unchanged file: %s", save_name)
+            return
+        self._file_stats[save_name] = file_stat
         event = step_checksum.RequestUpload(
             path, save_name, artifact_id, copy, use_prepare_flow, save_fn, digest
         )
         self._incoming_queue.put(event)
 
+    def set_uploaded_files(self, uploaded_files):
+        """Skip files which are unchanged since an earlier upload.
+
+        Arguments:
+            uploaded_files: dict of save_name to [size, mtime] when uploaded,
+                as returned by uploaded_files()
+        """
+        self._uploaded_files = dict(uploaded_files)
+
+    def uploaded_files(self):
+        """Return [size, mtime] of the files uploaded, by save_name."""
+        uploaded = dict(self._uploaded_files)
+        completed = self._stats.completed_files()
+        for save_name, file_stat in self._file_stats.items():
+            if save_name in completed:
+                uploaded[save_name] = file_stat
+        return uploaded
+
     def store_manifest_files(self, manifest, artifact_id, save_fn):
         event = step_checksum.RequestStoreManifestFiles(manifest, artifact_id, save_fn)
         self._incoming_queue.put(event)
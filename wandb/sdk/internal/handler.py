@@ -30,6 +30,7 @@ if wandb.TYPE_CHECKING:
         Sequence,
         Iterable,
         Optional,
+        Set,
         cast,
     )
     from .settings_static import SettingsStatic
@@ -180,26 +181,44 @@ class HandleManager(object):
     def handle_alert(self, record: Record) -> None:
         self._dispatch_record(record)
 
-    def _save_summary(self, summary_dict: SummaryDict, flush: bool = False) -> None:
-        summary = wandb_internal_pb2.SummaryRecord()
+    def _save_summary(
+        self,
+        summary_dict: SummaryDict,
+        flush: bool = False,
+        remove_keys: Iterable[str] = (),
+    ) -> None:
+        """Send summary items to the sender.
+
+        Regular updates only carry the top level keys that changed since the
+        last update; the sender merges them into its own consolidated summary.
+        A flush sends the full summary so it is also stored by the writer.
+        """
+        # fill in the record in place, avoids copying the summary message
+        record = wandb_internal_pb2.Record()
+        summary = record.summary
         for k, v in six.iteritems(summary_dict):
             update = summary.update.add()
             update.key = k
             update.value_json = json.dumps(v)
-        record = wandb_internal_pb2.Record(summary=summary)
+        for k in remove_keys:
+            remove = summary.remove.add()
+            remove.key = k
+        summary.SetInParent()
         if flush:
             self._dispatch_record(record)
         elif not self._settings._offline:
             self._sender_q.put(record)
 
-    def _save_history(self, record: Record) -> None:
-        for item in record.history.item:
+    def _save_history(self, history_dict: Dict[str, Any]) -> None:
+        for k, v in six.iteritems(history_dict):
             # TODO(jhr) save nested keys?
-            k = item.key
-            v = json.loads(item.value_json)
             if isinstance(v, numbers.Real):
-                self._sampled_history.setdefault(k, sample.UniformSampleAccumulator())
-                self._sampled_history[k].add(v)
+                sampled = self._sampled_history.get(k)
+                if sampled is None:
+                    # only build the accumulator for new keys, it is not cheap
+                    sampled = sample.UniformSampleAccumulator()
+                    self._sampled_history[k] = sampled
+                sampled.add(v)
 
     def _update_summary_metrics(
         self,
@@ -316,30 +335,59 @@ class HandleManager(object):
         updated = self._update_summary_leaf(kl=kl, v=v, d=d)
         return updated
 
-    def _update_summary(self, history_dict: Dict[str, Any]) -> bool:
+    def _update_summary(self, history_dict: Dict[str, Any]) -> Set[str]:
+        """Update the consolidated summary, return the top level keys changed."""
         # keep old behavior fast path if no define metrics have been used
         if not self._metric_defines:
             self._consolidated_summary.update(history_dict)
-            return True
-        updated = False
+            return set(history_dict)
+        updated: Set[str] = set()
         for k, v in six.iteritems(history_dict):
             if self._update_summary_list(kl=[k], v=v):
-                updated = True
+                updated.add(k)
         return updated
 
+    def _save_summary_keys(self, keys: Iterable[str]) -> None:
+        """Send a delta summary record for the given top level keys."""
+        update_dict = dict()
+        remove_keys = []
+        for k in keys:
+            if k in self._consolidated_summary:
+                update_dict[k] = self._consolidated_summary[k]
+            else:
+                remove_keys.append(k)
+        if update_dict or remove_keys:
+            self._save_summary(update_dict, remove_keys=remove_keys)
+
+    def _history_add_items(self, record: Record, items: Dict[str, Any]) -> None:
+        """Add keys to the history record without re-encoding the whole row."""
+        history = record.history
+        if not history.row_json:
+            for k, v in six.iteritems(items):
+                item = history.item.add()
+                item.key = k
+                item.value_json = json.dumps(v)
+            return
+        # splice the new keys into the encoded row, keys are never already present
+        row_json = history.row_json.rstrip()
+        assert row_json.endswith("}")
+        encoded = ", ".join(
+            "{}: {}".format(json.dumps(k), json.dumps(v))
+            for k, v in six.iteritems(items)
+        )
+        sep = ", " if row_json != "{}" else ""
+        history.row_json = row_json[:-1] + sep + encoded + "}"
+
     def _history_assign_step(self, record: Record, history_dict: Dict) -> None:
         has_step = record.history.HasField("step")
-        item = record.history.item.add()
-        item.key = "_step"
         if has_step:
             step = record.history.step.num
             history_dict["_step"] = step
-            item.value_json = json.dumps(step)
             self._step = step + 1
         else:
             history_dict["_step"] = self._step
-            item.value_json = json.dumps(self._step)
             self._step += 1
+        self._history_add_items(record, {"_step": history_dict["_step"]})
 
     def _history_define_metric(
         self, hkey: str
@@ -409,23 +457,39 @@ class HandleManager(object):
 
         if update_history:
             history_dict.update(update_history)
-            for k, v in six.iteritems(update_history):
-                item = record.history.item.add()
-                item.key = k
-                item.value_json = json.dumps(v)
+            self._history_add_items(record, update_history)
 
-    def handle_history(self, record: Record) -> None:
-        history_dict = proto_util.dict_from_proto_list(record.history.item)
+    def _handle_history_row(self, record: Record) -> Set[str]:
+        history = record.history
+        if history.row_json:
+            # decode the row once, it is passed on to the sender encoded
+            history_dict = json.loads(history.row_json)
+        else:
+            history_dict = proto_util.dict_from_proto_list(history.item)
         self._history_update(record, history_dict)
         self._dispatch_record(record)
-        self._save_history(record)
+        self._save_history(history_dict)
+        return self._update_summary(history_dict)
 
-        updated = self._update_summary(history_dict)
+    def handle_history(self, record: Record) -> None:
+        updated = self._handle_history_row(record)
+        if updated:
+            self._save_summary_keys(updated)
+
+    def handle_history_batch(self, record: Record) -> None:
+        # rows are handled and persisted one by one, the summary is sent once
+        updated: Set[str] = set()
+        for history in record.history_batch.history:
+            row_record = Record()
+            row_record.history.CopyFrom(history)
+            row_record.control.CopyFrom(record.control)
+            updated |= self._handle_history_row(row_record)
         if updated:
-            self._save_summary(self._consolidated_summary)
+            self._save_summary_keys(updated)
 
     def handle_summary(self, record: Record) -> None:
         summary = record.summary
+        updated: Set[str] = set()
 
         for item in summary.update:
             if len(item.nested_key) > 0:
@@ -445,6 +509,7 @@ class HandleManager(object):
 
             # use the last element of the key to write the leaf:
             target[key[-1]] = json.loads(item.value_json)
+            updated.add(key[0])
 
         for item in summary.remove:
             if len(item.nested_key) > 0:
@@ -464,8 +529,9 @@ class HandleManager(object):
 
             # use the last element of the key to erase the leaf:
             del target[key[-1]]
+            updated.add(key[0])
 
-        self._save_summary(self._consolidated_summary)
+        self._save_summary_keys(updated)
 
     def handle_exit(self, record: Record) -> None:
         self._dispatch_record(record, always_send=True)
@@ -2,8 +2,10 @@
 from gql import Client, gql  # type: ignore
 from gql.client import RetryError  # type: ignore
 from gql.transport.requests import RequestsHTTPTransport  # type: ignore
+import base64
 import datetime
 import ast
+from multiprocessing.pool import ThreadPool
 import os
 import json
 import yaml
@@ -12,6 +14,7 @@ import click
 import logging
 import requests
 import sys
+import threading
 
 if os.name == "posix" and sys.version_info[0] < 3:
     import subprocess32 as subprocess  # type: ignore
@@ -21,6 +24,7 @@ else:
 from copy import deepcopy
 import six
 from six import BytesIO
+from six.moves.urllib.parse import quote
 import wandb
 from wandb import __version__
 from wandb import env
@@ -54,6 +58,10 @@ class Api(object):
     """
 
     HTTP_TIMEOUT = env.get_http_timeout(10)
+    # files larger than a chunk are uploaded in chunks when their url was
+    # signed for it, blocks of block blobs are uploaded in parallel
+    UPLOAD_CHUNK_BYTES = 16 * 1024 * 1024
+    UPLOAD_MAX_PARALLEL_BLOCKS = 4
 
     def __init__(
         self,
@@ -108,6 +116,8 @@ class Api(object):
         )
         self._current_run_id = None
         self._file_stream_api = None
+        # state of chunked uploads by url, kept across retries to resume them
+        self._upload_sessions = {}
         # This Retry class is initialized once for each Api instance, so this
         # defaults to retrying 1 million times per process or 7 days
         self.upload_file_retry = normalize_exceptions(
@@ -1136,6 +1146,14 @@ class Api(object):
     def upload_file(self, url, file, callback=None, extra_headers={}):
         """Uploads a file to W&B with failure resumption
 
+        Files larger than UPLOAD_CHUNK_BYTES are uploaded in chunks if the url
+        was signed for it, a retry after a failure only uploads the chunks the
+        storage is missing:
+        - resumable uploads (x-goog-resumable: start header) put chunks one
+          after the other with a Content-Range
+        - block blobs (x-ms-blob-type: BlockBlob header) put chunks as blocks in
+          parallel and commit them with a block list
+
         Arguments:
             url (str): The url to download
             file (str): The path to the file you want to upload
@@ -1146,24 +1164,156 @@ class Api(object):
             The requests library response object
         """
         extra_headers = extra_headers.copy()
+        if callback is None:
+
+            def callback(bites, total):
+                return (bites, total)
+
+        size = os.fstat(file.fileno()).st_size
+        protocol = _chunked_upload_protocol(extra_headers)
+        if protocol is not None and size > self.UPLOAD_CHUNK_BYTES:
+            try:
+                if protocol == "resumable":
+                    return self._upload_file_resumable(
+                        url, file, size, callback, extra_headers
+                    )
+                return self._upload_file_blocks(
+                    url, file, size, callback, extra_headers
+                )
+            except requests.exceptions.RequestException as e:
+                if not _is_transient_upload_error(e):
+                    # a retry can't continue the upload, it starts over
+                    self._upload_sessions.pop(url, None)
+                self._raise_upload_error(url, e)
+
         response = None
         progress = Progress(file, callback=callback)
         try:
             response = requests.put(url, data=progress, headers=extra_headers)
             response.raise_for_status()
         except requests.exceptions.RequestException as e:
-            logger.error("upload_file exception {} {}".format(url, e))
-            status_code = e.response.status_code if e.response != None else 0
             # We need to rewind the file for the next retry (the file passed in is seeked to 0)
             progress.rewind()
-            # Retry errors from cloud storage or local network issues
-            if status_code in (308, 408, 409, 429, 500, 502, 503, 504) or isinstance(
-                e, (requests.exceptions.Timeout, requests.exceptions.ConnectionError)
-            ):
-                util.sentry_reraise(retry.TransientException(exc=e))
+            self._raise_upload_error(url, e)
+
+        return response
+
+    def _raise_upload_error(self, url, e):
+        logger.error("upload_file exception {} {}".format(url, e))
+        if _is_transient_upload_error(e):
+            util.sentry_reraise(retry.TransientException(exc=e))
+        else:
+            util.sentry_reraise(e)
+
+    def _upload_file_resumable(self, url, file, size, callback, extra_headers):
+        """Upload a file in chunks to a resumable upload session.
+
+        The session is started with a POST to the signed url, retries continue
+        the session after the last byte the storage confirmed.
+        """
+        session_url = self._upload_sessions.get(url)
+        offset = 0
+        if session_url is not None:
+            response = self._status_request(session_url, size)
+            if response.status_code in (404, 410):
+                # the session expired, start over
+                session_url = None
             else:
-                util.sentry_reraise(e)
+                response.raise_for_status()
+                if response.status_code != 308:
+                    self._upload_sessions.pop(url, None)
+                    callback(0, size)
+                    return response
+                offset = _resumable_range_end(response)
+                logger.info("resuming upload of %s at %d", url, offset)
+        if session_url is None:
+            response = requests.post(url, headers=extra_headers)
+            response.raise_for_status()
+            session_url = response.headers["Location"]
+            self._upload_sessions[url] = session_url
+
+        while True:
+            file.seek(offset)
+            chunk = file.read(self.UPLOAD_CHUNK_BYTES)
+            end = offset + len(chunk)
+            response = requests.put(
+                session_url,
+                data=chunk,
+                headers={
+                    "Content-Range": "bytes {}-{}/{}".format(offset, end - 1, size)
+                },
+                allow_redirects=False,
+            )
+            response.raise_for_status()
+            if response.status_code != 308:
+                break
+            # the storage may have kept less than the whole chunk
+            end = _resumable_range_end(response)
+            if end <= offset:
+                raise retry.TransientException(
+                    msg="no progress uploading {} at {}".format(url, offset)
+                )
+            callback(end - offset, end)
+            offset = end
+        self._upload_sessions.pop(url, None)
+        callback(size - offset, size)
+        return response
+
+    def _upload_file_blocks(self, url, file, size, callback, extra_headers):
+        """Upload a file as blocks of a block blob in parallel.
+
+        The blocks stored are remembered, retries only upload the others before
+        the block list is committed.
+        """
+        stored = self._upload_sessions.setdefault(url, {})
+        chunk_bytes = self.UPLOAD_CHUNK_BYTES
+        num_blocks = (size + chunk_bytes - 1) // chunk_bytes
+        block_ids = [
+            base64.b64encode("{:08d}".format(i).encode("ascii")).decode("ascii")
+            for i in range(num_blocks)
+        ]
+        block_headers, commit_headers = _block_blob_headers(extra_headers)
+        separator = "&" if "?" in url else "?"
+        lock = threading.Lock()
+
+        def put_block(i):
+            if i in stored:
+                return
+            with lock:
+                file.seek(i * chunk_bytes)
+                data = file.read(chunk_bytes)
+            response = requests.put(
+                "{}{}comp=block&blockid={}".format(
+                    url, separator, quote(block_ids[i], safe="")
+                ),
+                data=data,
+                headers=block_headers,
+            )
+            response.raise_for_status()
+            with lock:
+                stored[i] = len(data)
+                callback(len(data), sum(stored.values()))
+
+        missing = [i for i in range(num_blocks) if i not in stored]
+        if missing:
+            pool = ThreadPool(min(self.UPLOAD_MAX_PARALLEL_BLOCKS, len(missing)))
+            try:
+                pool.map(put_block, missing)
+            finally:
+                pool.terminate()
 
+        block_list = "".join(
+            "<Latest>{}</Latest>".format(block_id) for block_id in block_ids
+        )
+        response = requests.put(
+            "{}{}comp=blocklist".format(url, separator),
+            data='<?xml version="1.0" encoding="utf-8"?><BlockList>{}</BlockList>'.format(
+                block_list
+            ),
+            headers=commit_headers,
+        )
+        response.raise_for_status()
+        self._upload_sessions.pop(url, None)
         return response
 
     @normalize_exceptions
@@ -2110,3 +2260,65 @@ class Api(object):
     def _flatten_edges(self, response):
         """Return an array from the nested graphql relay structure"""
         return [node["node"] for node in response["edges"]]
+
+
+def _chunked_upload_protocol(headers):
+    """Return the chunked upload protocol the signed url headers are for."""
+    for key, value in headers.items():
+        key, value = key.strip().lower(), value.strip().lower()
+        if key == "x-goog-resumable" and value == "start":
+            return "resumable"
+        if key == "x-ms-blob-type" and value == "blockblob":
+            return "blocks"
+    return None
+
+
+def _is_transient_upload_error(e):
+    """Return whether an upload request failed with an error worth retrying."""
+    status_code = e.response.status_code if e.response != None else 0
+    # Retry errors from cloud storage or local network issues
+    return status_code in (308, 408, 409, 429, 500, 502, 503, 504) or isinstance(
+        e, (requests.exceptions.Timeout, requests.exceptions.ConnectionError)
+    )
+
+
+# headers of a whole blob upload that set properties of the blob, and the
+# headers that set them when the block list is committed
+_BLOB_PROPERTY_HEADERS = {
+    "cache-control": "x-ms-blob-cache-control",
+    "content-disposition": "x-ms-blob-content-disposition",
+    "content-encoding": "x-ms-blob-content-encoding",
+    "content-language": "x-ms-blob-content-language",
+    "content-md5": "x-ms-blob-content-md5",
+    "content-type": "x-ms-blob-content-type",
+}
+
+
+def _block_blob_headers(headers):
+    """Split the headers of a whole blob upload for a block blob upload.
+
+    Returns the headers of each Put Block, the x-ms headers that aren't blob
+    properties or metadata, and the headers of the Put Block List that
+    commits the blob, with the blob properties and metadata.
+    """
+    block_headers = {}
+    commit_headers = {}
+    for key, value in headers.items():
+        name = key.strip().lower()
+        if name == "x-ms-blob-type":
+            continue
+        if name in _BLOB_PROPERTY_HEADERS:
+            commit_headers[_BLOB_PROPERTY_HEADERS[name]] = value
+        elif name.startswith("x-ms-"):
+            commit_headers[key] = value
+            if not name.startswith(("x-ms-blob-", "x-ms-meta-")):
+                block_headers[key] = value
+    return block_headers, commit_headers
+
+
+def _resumable_range_end(response):
+    """Return the number of bytes a resumable upload response says are stored."""
+    stored = response.headers.get("Range")
+    if not stored:
+        return 0
+    return int(stored.rsplit("-", 1)[1]) + 1
@@ -33,6 +33,11 @@ from ..lib.git import GitRepo
 
 logger = logging.getLogger(__name__)
 
+# The consolidated summary is written out at most every SUMMARY_DEBOUNCE_SECONDS
+# or once SUMMARY_DEBOUNCE_COUNT updates are pending, whichever comes first
+SUMMARY_DEBOUNCE_SECONDS = 2
+SUMMARY_DEBOUNCE_COUNT = 1000
+
 if wandb.TYPE_CHECKING:  # TYPE_CHECKING
     from typing import Any, Dict, Generator, List, NewType, Optional, Tuple
     from six.moves.queue import Queue
@@ -84,6 +89,8 @@ class SendManager(object):
 
         # keep track of config from key/val updates
         self._consolidated_config: DictNoValues = dict()
+        # keep track of summary from delta updates sent by the handler
+        self._consolidated_summary: Dict[str, Any] = dict()
         self._telemetry_obj = telemetry.TelemetryRecord()
         self._config_metric_pbdict_list: List[Dict[int, Any]] = []
         self._config_metric_index_dict: Dict[str, int] = {}
@@ -101,6 +108,10 @@ class SendManager(object):
             "resumed": False,
         }
 
+        # State restored and saved by sync checkpoints
+        self._uploaded_files: Dict[str, List[float]] = dict()
+        self._chunk_offsets: Dict[str, int] = dict()
+
         # State added when run_exit needs results
         self._exit_sync_uuid = None
 
@@ -117,6 +128,11 @@ class SendManager(object):
 
         # do we need to debounce?
         self._config_needs_debounce: bool = False
+        self._summary_needs_debounce: bool = False
+        self._summary_pending: int = 0
+        self._summary_last_write: float = time.time()
+        # counters to see how many summary updates were coalesced into a write
+        self._summary_stats: Dict[str, int] = dict(updates=0, writes=0)
 
         # TODO(jhr): do something better, why do we need to send full lines?
         self._partial_output = dict()
@@ -124,9 +140,14 @@ class SendManager(object):
         self._exit_code = 0
 
     @classmethod
-    def setup(cls, root_dir):
+    def setup(cls, root_dir, settings=None):
         """This is a helper class method to setup a standalone SendManager.
         Currently we're using this primarily for `sync.py`.
+
+        Arguments:
+            root_dir: directory of the run being sent
+            settings: optional private settings overriding the defaults, like
+                _file_stream_max_inflight
         """
         files_dir = os.path.join(root_dir, "files")
         sd = dict(
@@ -148,7 +169,14 @@ class SendManager(object):
             save_code=None,
             email=None,
             silent=None,
+            _file_stream_gzip=None,
+            _file_stream_max_inflight=None,
+            _upload_max_jobs=None,
+            _upload_max_large_jobs=None,
+            _checksum_max_jobs=None,
+            _file_watcher=None,
         )
+        sd.update(settings or {})
         settings = settings_static.SettingsStatic(sd)
         record_q = queue.Queue()
         result_q = queue.Queue()
@@ -237,9 +265,40 @@ class SendManager(object):
                 logger.warning("Failed to check stop requested status: %s", e)
         self._result_q.put(result)
 
+    def _update_file_stream_telemetry(self) -> None:
+        """Copy file stream queue depth and lag into the run telemetry.
+
+        The config is only updated when a value reaches the next power of two,
+        so a run updates it a handful of times at most.
+        """
+        if not self._fs:
+            return
+        stats = self._fs.stats()
+        telem = telemetry.TelemetryRecord()
+        fs_telem = telem.file_stream
+        fs_telem.max_queue_depth = stats["max_queue_depth"]
+        fs_telem.max_lag_ms = int(stats["max_lag_seconds"] * 1000)
+        fs_telem.rate_limited = stats["rate_limited"]
+        fs_telem.max_inflight = stats["max_inflight"]
+        current = self._telemetry_obj.file_stream
+        if any(
+            getattr(fs_telem, name).bit_length() > getattr(current, name).bit_length()
+            for name in (
+                "max_queue_depth",
+                "max_lag_ms",
+                "rate_limited",
+                "max_inflight",
+            )
+        ):
+            self._telemetry_obj.MergeFrom(telem)
+            self._update_config()
+
     def debounce(self) -> None:
+        self._update_file_stream_telemetry()
         if self._config_needs_debounce:
             self._debounce_config()
+        if self._summary_needs_debounce:
+            self._debounce_summary()
 
     def _debounce_config(self):
         config_value_dict = self._config_format(self._consolidated_config)
@@ -286,6 +345,9 @@ class SendManager(object):
         self._exit_code = exit.exit_code
         logger.info("handling exit code: %s", exit.exit_code)
 
+        if self._summary_needs_debounce:
+            self._debounce_summary()
+
         # Pass the responsibility to respond to handle_request_defer()
         if data.control.req_resp:
             self._exit_sync_uuid = data.uuid
@@ -687,6 +749,8 @@ class SendManager(object):
             self._run.run_id,
             self._run.start_time.ToSeconds(),
             settings=self._api_settings,
+            gzip=bool(self._settings._file_stream_gzip),
+            max_inflight=self._settings._file_stream_max_inflight,
         )
         # Ensure the streaming polices have the proper offsets
         self._fs.set_file_policy("wandb-summary.json", file_stream.SummaryFilePolicy())
@@ -709,7 +773,15 @@ class SendManager(object):
             email=self._settings.email,
         )
         self._fs.start()
-        self._pusher = FilePusher(self._api, self._fs, silent=self._settings.silent)
+        self._pusher = FilePusher(
+            self._api,
+            self._fs,
+            silent=self._settings.silent,
+            max_jobs=self._settings._upload_max_jobs,
+            max_large_jobs=self._settings._upload_max_large_jobs,
+            max_checksum_jobs=self._settings._checksum_max_jobs,
+        )
+        self._pusher.set_uploaded_files(self._uploaded_files)
         self._dir_watcher = DirWatcher(
             self._settings, self._api, self._pusher, file_dir
         )
@@ -725,19 +797,65 @@ class SendManager(object):
 
     def send_history(self, data):
         history = data.history
+        if history.row_json:
+            # the row was encoded by the user process, no need to re-encode
+            if self._fs:
+                self._fs.push(filenames.HISTORY_FNAME, history.row_json)
+            return
         history_dict = proto_util.dict_from_proto_list(history.item)
         self._save_history(history_dict)
 
     def send_summary(self, data):
-        summary_dict = proto_util.dict_from_proto_list(data.summary.update)
-        json_summary = json.dumps(summary_dict)
+        """Merge a summary update into the consolidated summary.
+
+        The handler only sends the keys which changed, so the full summary is
+        serialized when the sender debounces instead of for every record.
+        """
+        summary = data.summary
+        for item in summary.update:
+            key = tuple(item.nested_key) or (item.key,)
+            target = self._consolidated_summary
+            for prop in key[:-1]:
+                target = target.setdefault(prop, dict())
+            target[key[-1]] = json.loads(item.value_json)
+        for item in summary.remove:
+            key = tuple(item.nested_key) or (item.key,)
+            target = self._consolidated_summary
+            for prop in key[:-1]:
+                target = target.get(prop, dict())
+            target.pop(key[-1], None)
+        self._summary_needs_debounce = True
+        self._summary_pending += 1
+        self._summary_stats["updates"] += 1
+
+        if (
+            self._summary_pending >= SUMMARY_DEBOUNCE_COUNT
+            or time.time() - self._summary_last_write >= SUMMARY_DEBOUNCE_SECONDS
+        ):
+            self._debounce_summary()
+
+    def _debounce_summary(self):
+        json_summary = json.dumps(self._consolidated_summary)
         if self._fs:
             self._fs.push(filenames.SUMMARY_FNAME, json_summary)
-        # TODO(jhr): we should only write this at the end of the script
+        self._summary_save(json_summary)
+        self._save_file(filenames.SUMMARY_FNAME)
+        self._summary_needs_debounce = False
+        self._summary_pending = 0
+        self._summary_last_write = time.time()
+        self._summary_stats["writes"] += 1
+
+    def _summary_save(self, json_summary):
+        """Write the summary file atomically so readers never see partial data."""
         summary_path = os.path.join(self._settings.files_dir, filenames.SUMMARY_FNAME)
-        with open(summary_path, "w") as f:
+        # the directory watcher ignores *.tmp files
+        tmp_path = summary_path + ".tmp"
+        with open(tmp_path, "w") as f:
             f.write(json_summary)
-        self._save_file(filenames.SUMMARY_FNAME)
+        try:
+            os.replace(tmp_path, summary_path)
+        except AttributeError:
+            os.rename(tmp_path, summary_path)
 
     def send_stats(self, data):
         stats = data.stats
@@ -945,17 +1063,50 @@ class SendManager(object):
         logger.info("shutting down sender")
         # if self._tb_watcher:
         #     self._tb_watcher.finish()
+        if self._summary_needs_debounce:
+            self._debounce_summary()
+        logger.info(
+            "summary updates: %d, writes: %d",
+            self._summary_stats["updates"],
+            self._summary_stats["writes"],
+        )
         if self._dir_watcher:
             self._dir_watcher.finish()
             self._dir_watcher = None
         if self._pusher:
             self._pusher.finish()
             self._pusher.join()
+            self._uploaded_files = self._pusher.uploaded_files()
             self._pusher = None
         if self._fs:
             self._fs.finish(self._exit_code)
+            self._chunk_offsets = self._fs.chunk_offsets()
             self._fs = None
 
+    def restore_sync_state(self, state: Dict[str, Any]) -> None:
+        """Continue sending a run from state returned by sync_state().
+
+        Must be called before the run record is sent.
+        """
+        self._resume_state["history"] = state.get("history", 0)
+        self._resume_state["events"] = state.get("events", 0)
+        self._resume_state["output"] = state.get("output", 0)
+        self._consolidated_config.clear()
+        self._consolidated_config.update(state.get("config") or {})
+        self._consolidated_summary = state.get("summary") or dict()
+        self._uploaded_files = state.get("uploaded") or dict()
+
+    def sync_state(self) -> Dict[str, Any]:
+        """Return the state needed to continue sending a run after finish()."""
+        return dict(
+            history=self._chunk_offsets.get(filenames.HISTORY_FNAME, 0),
+            events=self._chunk_offsets.get(filenames.EVENTS_FNAME, 0),
+            output=self._chunk_offsets.get(filenames.OUTPUT_FNAME, 0),
+            config=self._consolidated_config,
+            summary=self._consolidated_summary,
+            uploaded=self._uploaded_files,
+        )
+
     def _max_cli_version(self):
         _, server_info = self._api.viewer_server_info()
         max_cli_version = server_info.get("cliVersionInfo", {}).get(
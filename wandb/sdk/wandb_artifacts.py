@@ -1,13 +1,17 @@
 #
+import array
 import base64
+import binascii
 import contextlib
 import hashlib
 import os
+import platform
 import re
 import shutil
 import time
 
 import requests
+from six.moves.collections_abc import ItemsView, MutableMapping, ValuesView
 from six.moves.urllib.parse import quote, urlparse
 import wandb
 from wandb import env
@@ -26,12 +30,14 @@ from .interface.artifacts import (  # noqa: F401 pylint: disable=unused-import
     ArtifactManifest,
     ArtifactsCache,
     b64_string_to_hex,
+    FileHasher,
     get_artifacts_cache,
     md5_file_b64,
     md5_string,
     StorageHandler,
     StorageLayout,
     StoragePolicy,
+    walk_files,
 )
 
 if wandb.TYPE_CHECKING:
@@ -48,6 +54,9 @@ if wandb.TYPE_CHECKING:
         IO,
         Generator,
         Any,
+        Iterable,
+        Iterator,
+        Set,
     )
 
     if TYPE_CHECKING:
@@ -368,7 +377,7 @@ class Artifact(ArtifactInterface):
             raise ValueError("Path is not a file: %s" % local_path)
 
         name = name or os.path.basename(local_path)
-        digest = md5_file_b64(local_path)
+        digest = self._cache.md5_file_b64(local_path)
 
         if is_tmp:
             file_path, file_name = os.path.split(name)
@@ -391,23 +400,27 @@ class Artifact(ArtifactInterface):
         start_time = time.time()
 
         paths = []
-        for dirpath, _, filenames in os.walk(local_path, followlinks=True):
-            for fname in filenames:
-                physical_path = os.path.join(dirpath, fname)
-                logical_path = os.path.relpath(physical_path, start=local_path)
-                if name is not None:
-                    logical_path = os.path.join(name, logical_path)
-                paths.append((logical_path, physical_path))
+        for physical_path in walk_files(local_path, follow_symlinks=True):
+            logical_path = os.path.relpath(physical_path, start=local_path)
+            if name is not None:
+                logical_path = os.path.join(name, logical_path)
+            paths.append((logical_path, physical_path))
+
+        digests = FileHasher(self._cache).md5_files_b64([p for _, p in paths])
+        self._cache.pin_md5_objs(digests)
 
-        def add_manifest_file(log_phy_path: Tuple[str, str]) -> None:
-            logical_path, physical_path = log_phy_path
-            self._add_local_file(logical_path, physical_path)
+        def add_manifest_file(entry: Tuple[str, str, str]) -> None:
+            logical_path, physical_path, digest = entry
+            self._add_local_file(logical_path, physical_path, digest=digest, pin=False)
 
         import multiprocessing.dummy  # this uses threads
 
         num_threads = 8
         pool = multiprocessing.dummy.Pool(num_threads)
-        pool.map(add_manifest_file, paths)
+        pool.map(
+            add_manifest_file,
+            [(log, phy, digest) for (log, phy), digest in zip(paths, digests)],
+        )
         pool.close()
         pool.join()
 
@@ -680,11 +693,16 @@ class Artifact(ArtifactInterface):
             raise ValueError("Can't add to finalized artifact.")
 
     def _add_local_file(
-        self, name: str, path: str, digest: Optional[str] = None
+        self, name: str, path: str, digest: Optional[str] = None, pin: bool = True
     ) -> ArtifactEntry:
-        digest = digest or md5_file_b64(path)
+        digest = digest or self._cache.md5_file_b64(path)
         size = os.path.getsize(path)
 
+        # the staged copy is read when the artifact is uploaded, keep it from
+        # being evicted until then
+        if pin:
+            self._cache.pin_md5_objs([digest])
+
         cache_path, hit, cache_open = self._cache.check_md5_obj_path(digest, size)
         if not hit:
             with cache_open() as f:
@@ -725,19 +743,11 @@ class ArtifactManifestV1(ArtifactManifest):
         if storage_policy_cls is None:
             raise ValueError('Failed to find storage policy "%s"' % storage_policy_name)
 
-        entries: Mapping[str, ArtifactManifestEntry]
-        entries = {
-            name: ArtifactManifestEntry(
-                path=name,
-                digest=val["digest"],
-                birth_artifact_id=val.get("birthArtifactID"),
-                ref=val.get("ref"),
-                size=val.get("size"),
-                extra=val.get("extra"),
-                local_path=val.get("local_path"),
-            )
-            for name, val in manifest_json["contents"].items()
-        }
+        # contents is a dict, or (path, entry) pairs when streamed
+        contents = manifest_json["contents"]
+        if hasattr(contents, "items"):
+            contents = contents.items()
+        entries = ArtifactManifestEntries.from_contents(contents)
 
         return cls(
             artifact, storage_policy_cls.from_config(storage_policy_config), entries
@@ -752,6 +762,11 @@ class ArtifactManifestV1(ArtifactManifest):
         super(ArtifactManifestV1, self).__init__(
             artifact, storage_policy, entries=entries
         )
+        if not isinstance(self.entries, ArtifactManifestEntries):
+            self.entries = ArtifactManifestEntries(self.entries)
+
+    def sorted_entries(self) -> "Iterator[ArtifactEntry]":
+        return self.entries.sorted_values()  # type: ignore
 
     def to_manifest_json(self) -> Dict:
         """This is the JSON that's stored in wandb_manifest.json
@@ -762,7 +777,7 @@ class ArtifactManifestV1(ArtifactManifest):
         contents.
         """
         contents = {}
-        for entry in sorted(self.entries.values(), key=lambda k: k.path):
+        for entry in self.sorted_entries():
             json_entry: Dict[str, Any] = {
                 "digest": entry.digest,
             }
@@ -785,8 +800,8 @@ class ArtifactManifestV1(ArtifactManifest):
     def digest(self) -> str:
         hasher = hashlib.md5()
         hasher.update("wandb-artifact-manifest-v1\n".encode())
-        for (name, entry) in sorted(self.entries.items(), key=lambda kv: kv[0]):
-            hasher.update("{}:{}\n".format(name, entry.digest).encode())
+        for entry in self.sorted_entries():
+            hasher.update("{}:{}\n".format(entry.path, entry.digest).encode())
         return hasher.hexdigest()
 
 
@@ -829,6 +844,342 @@ class ArtifactManifestEntry(ArtifactEntry):
         return "<ManifestEntry %s>" % summary
 
 
+_NO_MD5 = b"\0" * 16
+
+
+def _pack_md5(digest: str) -> Optional[bytes]:
+    """Return the 16 bytes of a base64 encoded md5 digest, None for other digests."""
+    if len(digest) != 24 or digest[22:] != "==":
+        return None
+    try:
+        packed = binascii.a2b_base64(digest)
+    except ValueError:
+        return None
+    # only digests that encode back to themselves can be stored packed
+    if binascii.b2a_base64(packed)[:-1].decode("ascii") != digest:
+        return None
+    return packed
+
+
+class _ManifestEntryView(ArtifactManifestEntry):
+    """An entry of ArtifactManifestEntries that reads and writes its columns."""
+
+    def __init__(self, entries: "ArtifactManifestEntries", index: int) -> None:
+        self._entries = entries
+        self._index = index
+
+    @property
+    def path(self) -> str:  # type: ignore
+        return self._entries._path(self._index)
+
+    # mypy flags both lines of a property with a setter that overrides an
+    # attribute
+    @property  # type: ignore
+    def ref(self) -> Optional[str]:  # type: ignore
+        return self._entries._refs.get(self._index)
+
+    @ref.setter
+    def ref(self, ref: Optional[str]) -> None:
+        self._entries._set_sparse(self._entries._refs, self._index, ref)
+
+    @property  # type: ignore
+    def digest(self) -> str:  # type: ignore
+        return self._entries._digest(self._index)
+
+    @digest.setter
+    def digest(self, digest: str) -> None:
+        self._entries._set_digest(self._index, digest)
+
+    @property  # type: ignore
+    def birth_artifact_id(self) -> Optional[str]:  # type: ignore
+        return self._entries._values[self._entries._birth_ids[self._index]]
+
+    @birth_artifact_id.setter
+    def birth_artifact_id(self, birth_artifact_id: Optional[str]) -> None:
+        self._entries._birth_ids[self._index] = self._entries._value_id(
+            birth_artifact_id
+        )
+
+    @property  # type: ignore
+    def size(self) -> Optional[int]:  # type: ignore
+        size = self._entries._sizes[self._index]
+        return size if size >= 0 else None
+
+    @size.setter
+    def size(self, size: Optional[int]) -> None:
+        self._entries._sizes[self._index] = size if size is not None else -1
+
+    @property  # type: ignore
+    def extra(self) -> Dict:  # type: ignore
+        # replace extra rather than changing it in place, an empty dict is not
+        # stored
+        return self._entries._extras.get(self._index) or {}
+
+    @extra.setter
+    def extra(self, extra: Optional[Dict]) -> None:
+        self._entries._set_sparse(self._entries._extras, self._index, extra)
+
+    @property  # type: ignore
+    def local_path(self) -> Optional[str]:  # type: ignore
+        return self._entries._local_paths.get(self._index)
+
+    @local_path.setter
+    def local_path(self, local_path: Optional[str]) -> None:
+        self._entries._set_sparse(self._entries._local_paths, self._index, local_path)
+
+
+class _EntriesValues(ValuesView):
+    def __iter__(self) -> "Iterator[ArtifactManifestEntry]":
+        return self._mapping._iter_values()  # type: ignore
+
+
+class _EntriesItems(ItemsView):
+    def __iter__(self) -> "Iterator[Tuple[str, ArtifactManifestEntry]]":
+        for entry in self._mapping._iter_values():  # type: ignore
+            yield entry.path, entry
+
+
+class ArtifactManifestEntries(MutableMapping):
+    """The entries of a manifest by path, stored column by column.
+
+    Loaded entries are kept in one string of paths, with md5 digests packed
+    into 16 bytes, sizes into an array and a hash table of their positions,
+    so that each takes tens of bytes instead of a few Python objects. Entry
+    objects for them are created when accessed and read and write through to
+    the columns. Entries set after loading are stored as they are.
+    """
+
+    _PATH_BATCH = 65536
+
+    def __init__(self, entries: Optional[Mapping[str, ArtifactEntry]] = None) -> None:
+        self._paths = ""
+        # path i is self._paths[self._offsets[i] : self._offsets[i + 1]]
+        self._offsets = array.array("q", [0])
+        self._digests = bytearray()
+        # digests that aren't base64 encoded md5s, by index
+        self._other_digests: Dict[int, str] = {}
+        # -1 for no size
+        self._sizes = array.array("q")
+        # indexes into self._values, 0 for no birth artifact
+        self._birth_ids = array.array("I")
+        self._values: List[Optional[str]] = [None]
+        self._value_ids: Dict[str, int] = {}
+        self._refs: Dict[int, str] = {}
+        self._extras: Dict[int, Dict] = {}
+        self._local_paths: Dict[int, str] = {}
+        # open addressing table of indexes by the hash of their path, -1 if empty
+        self._table = array.array("q", [-1])
+        self._in_order = True
+        self._deleted: Set[int] = set()
+        self._added: Dict[str, ArtifactEntry] = {}
+        if entries:
+            self.update(entries)
+
+    @classmethod
+    def from_contents(
+        cls, contents: "Iterable[Tuple[str, Dict]]"
+    ) -> "ArtifactManifestEntries":
+        """Load the (path, entry json) pairs of a manifest's contents."""
+        entries = cls()
+        offsets, digests, sizes = entries._offsets, entries._digests, entries._sizes
+        birth_ids, value_ids = entries._birth_ids, entries._value_ids
+        hashes = array.array("q")
+        paths = []
+        batch = []
+        length = 0
+        last = ""
+        windows = platform.system() == "Windows"
+        for path, val in contents:
+            if windows:
+                path = util.to_forward_slash_path(path)
+            if path < last:
+                entries._in_order = False
+            last = path
+            batch.append(path)
+            if len(batch) == cls._PATH_BATCH:
+                paths.append("".join(batch))
+                batch = []
+            length += len(path)
+            offsets.append(length)
+            hashes.append(hash(path))
+
+            index = len(sizes)
+            digest = val["digest"]
+            packed = _pack_md5(digest)
+            if packed is None:
+                packed = _NO_MD5
+                entries._other_digests[index] = digest
+            digests += packed
+
+            size = val.get("size")
+            sizes.append(size if size is not None else -1)
+            local_path = val.get("local_path")
+            if local_path is not None and size is None:
+                raise AssertionError(
+                    "programming error, size required when local_path specified"
+                )
+            if local_path:
+                entries._local_paths[index] = local_path
+
+            birth_artifact_id = val.get("birthArtifactID")
+            value_id = 0
+            if birth_artifact_id is not None:
+                value_id = value_ids.get(birth_artifact_id) or entries._value_id(
+                    birth_artifact_id
+                )
+            birth_ids.append(value_id)
+
+            ref = val.get("ref")
+            if ref:
+                entries._refs[index] = ref
+            extra = val.get("extra")
+            if extra:
+                entries._extras[index] = extra
+        paths.append("".join(batch))
+        entries._paths = "".join(paths)
+        entries._build_table(hashes)
+        return entries
+
+    def _build_table(self, hashes: "array.array") -> None:
+        """Build the table from the hashes of the loaded paths.
+
+        Of equal paths only the last one is kept, like in a dict.
+        """
+        size = 8
+        while size < 2 * len(hashes):
+            size *= 2
+        mask = size - 1
+        table = array.array("i" if size < 2 ** 31 else "q", [-1]) * size
+        for index, path_hash in enumerate(hashes):
+            slot = path_hash & mask
+            while table[slot] >= 0:
+                other = table[slot]
+                if hashes[other] == path_hash and self._path(other) == self._path(
+                    index
+                ):
+                    self._deleted.add(other)
+                    break
+                slot = (slot + 1) & mask
+            table[slot] = index
+        self._table = table
+
+    def _path(self, index: int) -> str:
+        return self._paths[self._offsets[index] : self._offsets[index + 1]]
+
+    def _find(self, path: str) -> int:
+        """Return the index of the loaded entry at path, or -1."""
+        table = self._table
+        mask = len(table) - 1
+        slot = hash(path) & mask
+        while True:
+            index = table[slot]
+            if index < 0:
+                return -1
+            if self._path(index) == path:
+                return -1 if index in self._deleted else index
+            slot = (slot + 1) & mask
+
+    def _digest(self, index: int) -> str:
+        digest = self._other_digests.get(index)
+        if digest is not None:
+            return digest
+        packed = bytes(self._digests[index * 16 : index * 16 + 16])
+        return base64.b64encode(packed).decode("ascii")
+
+    def _set_digest(self, index: int, digest: str) -> None:
+        packed = _pack_md5(digest)
+        if packed is None:
+            self._other_digests[index] = digest
+        else:
+            self._digests[index * 16 : index * 16 + 16] = packed
+            self._other_digests.pop(index, None)
+
+    def _value_id(self, value: Optional[str]) -> int:
+        if value is None:
+            return 0
+        value_id = self._value_ids.get(value)
+        if value_id is None:
+            value_id = self._value_ids[value] = len(self._values)
+            self._values.append(value)
+        return value_id
+
+    @staticmethod
+    def _set_sparse(column: Dict, index: int, value: Any) -> None:
+        if value:
+            column[index] = value
+        else:
+            column.pop(index, None)
+
+    def _iter_values(self) -> "Iterator[ArtifactEntry]":
+        """Iterate over the entries, the loaded ones first."""
+        deleted = self._deleted
+        for index in range(len(self._sizes)):
+            if index not in deleted:
+                yield _ManifestEntryView(self, index)
+        for entry in list(self._added.values()):
+            yield entry
+
+    def sorted_values(self) -> "Iterator[ArtifactEntry]":
+        """Iterate over the entries sorted by path."""
+        indexes: Sequence[int] = range(len(self._sizes))
+        if not self._in_order:
+            indexes = sorted(indexes, key=self._path)
+        added = sorted(self._added.values(), key=lambda entry: entry.path)
+        i = 0
+        for index in indexes:
+            if index in self._deleted:
+                continue
+            path = self._path(index)
+            while i < len(added) and added[i].path < path:
+                yield added[i]
+                i += 1
+            yield _ManifestEntryView(self, index)
+        for entry in added[i:]:
+            yield entry
+
+    def __getitem__(self, path: str) -> ArtifactEntry:
+        entry = self._added.get(path)
+        if entry is not None:
+            return entry
+        index = self._find(path)
+        if index < 0:
+            raise KeyError(path)
+        return _ManifestEntryView(self, index)
+
+    def __setitem__(self, path: str, entry: ArtifactEntry) -> None:
+        index = self._find(path)
+        if index >= 0:
+            self._deleted.add(index)
+        self._added[path] = entry
+
+    def __delitem__(self, path: str) -> None:
+        if self._added.pop(path, None) is not None:
+            return
+        index = self._find(path)
+        if index < 0:
+            raise KeyError(path)
+        self._deleted.add(index)
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._added or self._find(path) >= 0  # type: ignore
+
+    def __iter__(self) -> "Iterator[str]":
+        for index in range(len(self._sizes)):
+            if index not in self._deleted:
+                yield self._path(index)
+        for path in list(self._added):
+            yield path
+
+    def __len__(self) -> int:
+        return len(self._sizes) - len(self._deleted) + len(self._added)
+
+    def values(self) -> "ValuesView[ArtifactEntry]":
+        return _EntriesValues(self)
+
+    def items(self) -> "ItemsView[str, ArtifactEntry]":
+        return _EntriesItems(self)
+
+
 class WandbStoragePolicy(StoragePolicy):
     @classmethod
     def name(cls) -> str:
@@ -942,6 +1293,22 @@ class WandbStoragePolicy(StoragePolicy):
         entry: ArtifactEntry,
         preparer: "StepPrepare",
         progress_callback: Optional[Callable] = None,
+    ) -> bool:
+        try:
+            return self._store_file(
+                artifact_id, artifact_manifest_id, entry, preparer, progress_callback
+            )
+        finally:
+            # staged by Artifact.add_file or add_dir
+            self._cache.unpin_md5_objs([entry.digest])
+
+    def _store_file(
+        self,
+        artifact_id: str,
+        artifact_manifest_id: str,
+        entry: ArtifactEntry,
+        preparer: "StepPrepare",
+        progress_callback: Optional[Callable] = None,
     ) -> bool:
         # write-through cache
         cache_path, hit, cache_open = self._cache.check_md5_obj_path(
@@ -1183,7 +1550,7 @@ class LocalFileHandler(StorageHandler):
         if hit:
             return path
 
-        md5 = md5_file_b64(local_path)
+        md5 = self._cache.md5_file_b64(local_path)
         if md5 != manifest_entry.digest:
             raise ValueError(
                 "Local file reference: Digest mismatch for path %s: expected %s but found %s"
@@ -1213,7 +1580,7 @@ class LocalFileHandler(StorageHandler):
 
         def md5(path: str) -> str:
             return (
-                md5_file_b64(path)
+                self._cache.md5_file_b64(path)
                 if checksum
                 else md5_string(str(os.stat(path).st_size))
             )
@@ -1227,26 +1594,31 @@ class LocalFileHandler(StorageHandler):
                     % (max_objects, local_path),
                     newline=False,
                 )
-            for root, _, files in os.walk(local_path):
-                for sub_path in files:
-                    i += 1
-                    if i >= max_objects:
-                        raise ValueError(
-                            "Exceeded %i objects tracked, pass max_objects to add_reference"
-                            % max_objects
-                        )
-                    physical_path = os.path.join(root, sub_path)
-                    logical_path = os.path.relpath(physical_path, start=local_path)
-                    if name is not None:
-                        logical_path = os.path.join(name, logical_path)
-
-                    entry = ArtifactManifestEntry(
-                        logical_path,
-                        os.path.join(path, logical_path),
-                        size=os.path.getsize(physical_path),
-                        digest=md5(physical_path),
+            paths = []
+            for physical_path in walk_files(local_path):
+                i += 1
+                if i >= max_objects:
+                    raise ValueError(
+                        "Exceeded %i objects tracked, pass max_objects to add_reference"
+                        % max_objects
                     )
-                    entries.append(entry)
+                logical_path = os.path.relpath(physical_path, start=local_path)
+                if name is not None:
+                    logical_path = os.path.join(name, logical_path)
+                paths.append((logical_path, physical_path))
+
+            if checksum:
+                digests = FileHasher(self._cache).md5_files_b64([p for _, p in paths])
+            else:
+                digests = [md5(p) for _, p in paths]
+            for (logical_path, physical_path), digest in zip(paths, digests):
+                entry = ArtifactManifestEntry(
+                    logical_path,
+                    os.path.join(path, logical_path),
+                    size=os.path.getsize(physical_path),
+                    digest=digest,
+                )
+                entries.append(entry)
             if checksum:
                 termlog("Done. %.1fs" % (time.time() - start_time), prefix=False)
         elif os.path.isfile(local_path):
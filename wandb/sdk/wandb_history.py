@@ -30,12 +30,16 @@ class History(object):
         self._step = 0
         self._data = dict()
         self._callback = None
+        self._batch_callback = None
         self._torch = None
         self.compute = True
 
     def _set_callback(self, cb):
         self._callback = cb
 
+    def _set_batch_callback(self, cb):
+        self._batch_callback = cb
+
     def _row_update(self, row):
         self._data.update(row)
 
@@ -44,17 +48,35 @@ class History(object):
         self._flush()
         self._step += 1
 
+    def _rows_add(self, rows, steps=None):
+        """Commit many rows at once, each row at its own step"""
+        batch = []
+        now = time.time()
+        for i, row in enumerate(rows):
+            if steps is not None and steps[i] > self._step:
+                self._flush()
+                self._step = steps[i]
+            self._data.update(row)
+            batch.append((self._finish_row(now), self._step))
+            self._data = dict()
+            self._step += 1
+        if self._batch_callback:
+            self._batch_callback(rows=batch)
+
     def _update_step(self):
         """Called after receiving the run from the internal process"""
         self._step = self._run.starting_step
 
+    def _finish_row(self, now=None):
+        now = now or time.time()
+        self._data["_step"] = self._step
+        self._data["_runtime"] = int(self._data.get("_runtime", now - self.start_time))
+        self._data["_timestamp"] = int(self._data.get("_timestamp", now))
+        return self._data
+
     def _flush(self):
         if len(self._data) > 0:
-            self._data["_step"] = self._step
-            self._data["_runtime"] = int(
-                self._data.get("_runtime", time.time() - self.start_time)
-            )
-            self._data["_timestamp"] = int(self._data.get("_timestamp", time.time()))
+            self._finish_row()
             if self._callback:
                 self._callback(row=self._data, step=self._step)
             self._data = dict()
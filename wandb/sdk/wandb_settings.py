@@ -382,6 +382,17 @@ class Settings(object):
         summary_warnings: int = None,
         _internal_queue_timeout: float = 2,
         _internal_check_process: float = 8,
+        _transport: str = None,
+        _file_stream_gzip: bool = None,
+        _file_stream_max_inflight: int = None,
+        _upload_max_jobs: int = None,
+        _upload_max_large_jobs: int = None,
+        _checksum_max_jobs: int = None,
+        _sync_durability: str = None,
+        _sync_durability_seconds: float = None,
+        _sync_durability_bytes: int = None,
+        _sync_compression: str = None,
+        _file_watcher: str = None,
         _disable_meta: bool = None,
         _disable_stats: bool = None,
         _jupyter_path: str = None,
@@ -583,6 +594,30 @@ class Settings(object):
             return None
         return _error_choices(value, set(available_methods))
 
+    def _validate__transport(self, value: str) -> Optional[str]:
+        choices = {"queue", "shm"}
+        if value in choices:
+            return None
+        return _error_choices(value, choices)
+
+    def _validate__sync_durability(self, value: str) -> Optional[str]:
+        choices = {"none", "interval", "bytes", "record"}
+        if value in choices:
+            return None
+        return _error_choices(value, choices)
+
+    def _validate__sync_compression(self, value: str) -> Optional[str]:
+        choices = {"none", "zlib", "zstd"}
+        if value in choices:
+            return None
+        return _error_choices(value, choices)
+
+    def _validate__file_watcher(self, value: str) -> Optional[str]:
+        choices = {"auto", "inotify", "polling"}
+        if value in choices:
+            return None
+        return _error_choices(value, choices)
+
     def _validate_mode(self, value: str) -> Optional[str]:
         choices = {"dryrun", "run", "offline", "online", "disabled"}
         if value in choices:
@@ -2,6 +2,7 @@ import base64
 import binascii
 import collections
 import itertools
+import json
 import logging
 import os
 import sys
@@ -9,6 +10,7 @@ import random
 import requests
 import threading
 import time
+import zlib
 
 import wandb
 from wandb import util
@@ -158,10 +160,53 @@ class FileStreamApi(object):
 
     HTTP_TIMEOUT = env.get_http_timeout(10)
     MAX_ITEMS_PER_PUSH = 10000
-
-    def __init__(self, api, run_id, start_time, settings=None):
+    MAX_REQUEST_MB = 10
+    GZIP_LEVEL = 6
+    # upper bound for the expected compression ratio when splitting requests
+    GZIP_MAX_RATIO = 4.0
+    # requests posting file data at the same time, each file is in at most one.
+    # More than one is opt in with the _file_stream_max_inflight setting.
+    MAX_INFLIGHT = 1
+    # adaptive rate limiting, a backlog of queued chunks grows the batches read
+    # from the queue and shortens the interval between posts, 429s and server
+    # limits back the interval off
+    MAX_BATCH_GROWTH = 8
+    MAX_RATE_SPEEDUP = 4
+    MIN_RATE_LIMIT_SECONDS = 0.25
+    MAX_BACKOFF = 16
+
+    def __init__(
+        self, api, run_id, start_time, settings=None, gzip=False, max_inflight=None
+    ):
         if settings is None:
             settings = dict()
+        self._gzip = gzip
+        self._max_inflight = max_inflight or self.MAX_INFLIGHT
+        # guards the stats and the in flight request bookkeeping below
+        self._lock = threading.Lock()
+        self._request_done = threading.Condition(self._lock)
+        self._inflight = 0
+        self._inflight_files = set()
+        self._request_q = queue.Queue()
+        self._request_exc_info = None
+        # arrival time of the oldest chunk of each file waiting to be posted
+        self._pending_since = {}
+        self._stats = dict(
+            requests=0,
+            raw_bytes=0,
+            sent_bytes=0,
+            compress_seconds=0.0,
+            max_inflight=0,
+            lag_seconds=0.0,
+            max_lag_seconds=0.0,
+            queue_depth=0,
+            max_queue_depth=0,
+            rate_limited=0,
+        )
+        # chunks read from the queue but not posted yet, and the multiplier of
+        # the interval between posts set by 429s and server limits
+        self._ready_count = 0
+        self._backoff = 1.0
         # NOTE: exc_info is set in thread_except_body context and readable by calling threads
         self._exc_info = None
         self._settings = settings
@@ -185,6 +230,12 @@ class FileStreamApi(object):
         # cleans this thread up.
         self._thread.name = "FileStreamThread"
         self._thread.daemon = True
+        self._request_threads = []
+        for i in range(self._max_inflight):
+            thread = threading.Thread(target=self._request_thread_body)
+            thread.name = "FileStreamRequestThread-%d" % i
+            thread.daemon = True
+            self._request_threads.append(thread)
         self._init_endpoint()
 
     def _init_endpoint(self):
@@ -200,6 +251,8 @@ class FileStreamApi(object):
     def start(self):
         self._init_endpoint()
         self._thread.start()
+        for thread in self._request_threads:
+            thread.start()
 
     def set_default_file_policy(self, filename, file_policy):
         """Set an upload policy for a file unless one has already been set.
@@ -215,14 +268,44 @@ class FileStreamApi(object):
         # Defaults to 30
         return self._api.dynamic_settings["heartbeat_seconds"]
 
+    def backlog(self):
+        """Number of chunks queued or read from the queue but not posted yet."""
+        return self._queue.qsize() + self._ready_count
+
+    def _pressure(self):
+        # 1 while a single batch drains the backlog, growing with the backlog
+        return 1.0 + float(self.backlog()) / self.MAX_ITEMS_PER_PUSH
+
     def rate_limit_seconds(self):
         run_time = time.time() - self._start_time
         if run_time < 60:
-            return max(1, self.heartbeat_seconds / 15)
+            seconds = max(1, self.heartbeat_seconds / 15)
         elif run_time < 300:
-            return max(2.5, self.heartbeat_seconds / 3)
+            seconds = max(2.5, self.heartbeat_seconds / 3)
         else:
-            return max(5, self.heartbeat_seconds)
+            seconds = max(5, self.heartbeat_seconds)
+        seconds /= min(self._pressure(), self.MAX_RATE_SPEEDUP)
+        return max(self.MIN_RATE_LIMIT_SECONDS, seconds) * self._backoff
+
+    def max_items_per_push(self):
+        growth = min(self._pressure(), self.MAX_BATCH_GROWTH)
+        return int(self.MAX_ITEMS_PER_PUSH * growth)
+
+    def _increase_backoff(self):
+        with self._lock:
+            self._backoff = min(self._backoff * 2, self.MAX_BACKOFF)
+
+    def _decrease_backoff(self):
+        with self._lock:
+            self._backoff = max(self._backoff / 2, 1.0)
+
+    def _retry_callback(self, status, response_text):
+        if status == 429:
+            with self._lock:
+                self._stats["rate_limited"] += 1
+            self._increase_backoff()
+        if self._api.retry_callback:
+            self._api.retry_callback(status, response_text)
 
     def _read_queue(self):
         # called from the push thread (_thread_body), this does an initial read
@@ -232,10 +315,15 @@ class FileStreamApi(object):
         # our rate limit. So next time we get a chance to read the queue we want
         # read all the stuff that queue'd up since last time.
         #
-        # If we have more than MAX_ITEMS_PER_PUSH in the queue then the push thread
-        # will get behind and data will buffer up in the queue.
+        # If we have more than max_items_per_push() in the queue then the push
+        # thread will get behind and data will buffer up in the queue.  Posts
+        # happen in the request threads, at most MAX_INFLIGHT at a time.
+        depth = self._queue.qsize()
+        with self._lock:
+            self._stats["queue_depth"] = depth
+            self._stats["max_queue_depth"] = max(self._stats["max_queue_depth"], depth)
         return util.read_many_from_queue(
-            self._queue, self.MAX_ITEMS_PER_PUSH, self.rate_limit_seconds()
+            self._queue, self.max_items_per_push(), self.rate_limit_seconds()
         )
 
     def _thread_body(self):
@@ -244,8 +332,13 @@ class FileStreamApi(object):
         ready_chunks = []
         uploaded = set()
         finished = None
-        while finished is None:
-            items = self._read_queue()
+        # keep going until all file data has been posted
+        while finished is None or ready_chunks or self._inflight:
+            if finished is None:
+                items = self._read_queue()
+            else:
+                items = []
+                self._wait_for_request()
             for item in items:
                 if isinstance(item, self.Finish):
                     finished = item
@@ -265,16 +358,21 @@ class FileStreamApi(object):
                 else:
                     # item is Chunk
                     ready_chunks.append(item)
+                    self._pending_since.setdefault(item.filename, time.time())
+            self._ready_count = len(ready_chunks)
 
+            self._check_request_error()
             cur_time = time.time()
 
             if ready_chunks and (
                 finished or cur_time - posted_data_time > self.rate_limit_seconds()
             ):
-                posted_data_time = cur_time
-                posted_anything_time = cur_time
-                self._send(ready_chunks)
-                ready_chunks = []
+                unsent_chunks = self._send_pipelined(ready_chunks)
+                if len(unsent_chunks) < len(ready_chunks):
+                    posted_data_time = cur_time
+                    posted_anything_time = cur_time
+                ready_chunks = unsent_chunks
+                self._ready_count = len(ready_chunks)
 
             if cur_time - posted_anything_time > self.heartbeat_seconds:
                 posted_anything_time = cur_time
@@ -290,6 +388,9 @@ class FileStreamApi(object):
                     )
                 )
                 uploaded = set()
+        self._check_request_error()
+        for _ in self._request_threads:
+            self._request_q.put(None)
         # post the final close message. (item is self.Finish instance now)
         request_with_retry(
             self._client.post,
@@ -327,9 +428,84 @@ class FileStreamApi(object):
             if isinstance(parsed, dict):
                 limits = parsed.get("limits")
                 if isinstance(limits, dict):
+                    # a server asking for a longer heartbeat is under load
+                    heartbeat = self.heartbeat_seconds
                     self._api.dynamic_settings.update(limits)
+                    if self.heartbeat_seconds > heartbeat:
+                        self._increase_backoff()
 
-    def _send(self, chunks):
+    def _send_pipelined(self, chunks):
+        """Hand chunks to the request threads, return the chunks not sent yet.
+
+        A file's chunks are only sent when no request for that file is in
+        flight, so the offsets of each file reach the server in order.  Chunks
+        which have to wait are sent together with later chunks of the file.
+        Each file gets its own request while there are enough request threads,
+        so a slow request for one file does not hold back the others.
+        """
+        with self._lock:
+            free = self._max_inflight - self._inflight
+            busy = set(self._inflight_files)
+        ready_names = []
+        for c in chunks:
+            if c.filename not in busy and c.filename not in ready_names:
+                ready_names.append(c.filename)
+        if free <= 0 or not ready_names:
+            return chunks
+
+        # the last request takes the remaining files when short of threads
+        groups = [[name] for name in ready_names[: free - 1]]
+        groups.append(ready_names[free - 1 :] if len(ready_names) >= free else [])
+        now = time.time()
+        for names in groups:
+            if not names:
+                continue
+            files = self._chunks_to_files([c for c in chunks if c.filename in names])
+            with self._lock:
+                self._inflight += 1
+                self._inflight_files.update(names)
+                self._stats["max_inflight"] = max(
+                    self._stats["max_inflight"], self._inflight
+                )
+                for name in names:
+                    lag = now - self._pending_since.pop(name, now)
+                    self._stats["lag_seconds"] = lag
+                    self._stats["max_lag_seconds"] = max(
+                        self._stats["max_lag_seconds"], lag
+                    )
+            self._request_q.put((names, files))
+        return [c for c in chunks if c.filename not in ready_names]
+
+    def _request_thread_body(self):
+        while True:
+            request = self._request_q.get()
+            if request is None:
+                return
+            names, files = request
+            try:
+                if files:
+                    self._post_files(files)
+            except Exception:
+                logger.exception("generic exception in filestream request thread")
+                self._request_exc_info = sys.exc_info()
+            finally:
+                with self._lock:
+                    self._inflight -= 1
+                    self._inflight_files.difference_update(names)
+                    self._request_done.notify_all()
+
+    def _check_request_error(self):
+        # reraise errors of the request threads in the file stream thread
+        if self._request_exc_info:
+            six.reraise(*self._request_exc_info)
+
+    def _wait_for_request(self):
+        """Wait for an in flight request to finish."""
+        with self._lock:
+            if self._inflight:
+                self._request_done.wait(timeout=1)
+
+    def _chunks_to_files(self, chunks):
         # create files dict. dict of <filename: chunks> pairs where chunks is a list of
         # [chunk_id, chunk_data] tuples (as lists since this will be json).
         files = {}
@@ -342,16 +518,70 @@ class FileStreamApi(object):
             files[filename] = self._file_policies[filename].process_chunks(file_chunks)
             if not files[filename]:
                 del files[filename]
+        return files
 
-        for fs in file_stream_utils.split_files(files, max_mb=10):
+    def _send(self, chunks):
+        self._post_files(self._chunks_to_files(chunks))
+
+    def _post_files(self, files):
+        for fs in file_stream_utils.split_files(
+            files,
+            max_mb=self.MAX_REQUEST_MB,
+            compression_ratio=self._compression_ratio(),
+        ):
+            backoff = self._backoff
             self._handle_response(
                 request_with_retry(
                     self._client.post,
                     self._endpoint,
-                    json={"files": fs},
-                    retry_callback=self._api.retry_callback,
+                    retry_callback=self._retry_callback,
+                    **self._encode_body({"files": fs})
                 )
             )
+            # recover from a backoff after posts which were not throttled
+            if self._backoff <= backoff:
+                self._decrease_backoff()
+
+    def _encode_body(self, body):
+        """Return the post arguments for a json body, gzipped if enabled."""
+        data = raw_data = json.dumps(body).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+        start = time.time()
+        if self._gzip:
+            # wbits=31 writes a gzip header and trailer, zlib works on py27 too
+            compressor = zlib.compressobj(self.GZIP_LEVEL, zlib.DEFLATED, 31)
+            data = compressor.compress(raw_data) + compressor.flush()
+            headers["Content-Encoding"] = "gzip"
+        with self._lock:
+            self._stats["requests"] += 1
+            self._stats["raw_bytes"] += len(raw_data)
+            self._stats["sent_bytes"] += len(data)
+            if self._gzip:
+                self._stats["compress_seconds"] += time.time() - start
+        return dict(data=data, headers=headers)
+
+    def _compression_ratio(self):
+        """Expected raw to sent size ratio of the next request."""
+        if not self._gzip or not self._stats["sent_bytes"]:
+            return 1.0
+        ratio = float(self._stats["raw_bytes"]) / self._stats["sent_bytes"]
+        return max(1.0, min(ratio, self.GZIP_MAX_RATIO))
+
+    def stats(self):
+        """Return request sizes, compression time, requests in flight, lag,
+        queue depth and rate limiting."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["inflight"] = self._inflight
+            stats["backoff"] = self._backoff
+        return stats
+
+    def chunk_offsets(self):
+        """Return the number of chunks sent of each file with a file policy."""
+        return {
+            filename: policy._chunk_id
+            for filename, policy in self._file_policies.items()
+        }
 
     def stream_file(self, path):
         name = path.split("/")[-1]
@@ -391,6 +621,7 @@ class FileStreamApi(object):
         self._queue.put(self.Finish(exitcode))
         # TODO(jhr): join on a thread which exited with an exception is a noop, clean up this path
         self._thread.join()
+        logger.info("file stream requests: %s", self.stats())
         if self._exc_info:
             logger.error("FileStream exception", exc_info=self._exc_info)
             # reraising the original exception, will get recaught in internal.py for the sender thread
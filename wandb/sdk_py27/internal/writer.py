@@ -5,6 +5,7 @@
 from __future__ import print_function
 
 import logging
+import os
 
 from . import datastore
 
@@ -22,8 +23,16 @@ class WriteManager(object):
         self._ds = None
 
     def open(self):
-        self._ds = datastore.DataStore()
-        self._ds.open_for_write(self._settings.sync_file)
+        self._ds = datastore.DataStore(
+            durability=self._settings._sync_durability,
+            durability_seconds=self._settings._sync_durability_seconds,
+            durability_bytes=self._settings._sync_durability_bytes,
+            compression=self._settings._sync_compression,
+        )
+        if os.path.exists(self._settings.sync_file):
+            self._ds.open_for_append(self._settings.sync_file)
+        else:
+            self._ds.open_for_write(self._settings.sync_file)
 
     def write(self, record):
         if not self._ds:
@@ -39,4 +48,5 @@ class WriteManager(object):
             self._ds.close()
 
     def debounce(self):
-        pass
+        if self._ds:
+            self._ds.debounce()
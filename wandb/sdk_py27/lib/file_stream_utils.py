@@ -5,7 +5,9 @@ if wandb.TYPE_CHECKING:
     from typing import Dict, Iterable
 
 
-def split_files(files, max_mb = 10):
+def split_files(
+    files, max_mb = 10, compression_ratio = 1.0
+):
     """
     Splits a files dict (see `files` arg) into smaller dicts of at most `MAX_MB` size.
     This method is used in `FileStreamAPI._send()` to limit the size of post requests sent
@@ -14,10 +16,12 @@ def split_files(files, max_mb = 10):
     Arguments:
     files (dict): `dict` of form {file_name: {'content': ".....", 'offset': 0}}
     `max_mb`: max size for chunk in MBs
+    `compression_ratio`: expected ratio of raw to compressed size, when the request
+        body is compressed `max_mb` applies to the compressed size
     """
     current_volume = {}
     current_size = 0
-    max_size = max_mb * 1024 * 1024
+    max_size = int(max_mb * compression_ratio * 1024 * 1024)
 
     def _str_size(x):
         return len(x) if isinstance(x, bytes) else len(x.encode("utf-8"))
@@ -42,10 +42,10 @@ def proto_encode_to_dict(
                 if items:
                     data[desc.number] = items
             else:
-                # TODO: for now this code only handles sub-messages with strings
+                # TODO: for now this code only handles sub-messages with strings and ints
                 md = {}
                 for d, v in nested:
-                    if not v or d.type != d.TYPE_STRING:
+                    if not v or d.type not in (d.TYPE_STRING, d.TYPE_INT32):
                         continue
                     md[d.number] = v
                 data[desc.number] = md
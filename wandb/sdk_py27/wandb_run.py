@@ -295,6 +295,7 @@ class Run(object):
         self.summary._set_update_callback(self._summary_update_callback)
         self.history = wandb_history.History(self)
         self.history._set_callback(self._history_callback)
+        self.history._set_batch_callback(self._history_batch_callback)
 
         _datatypes_set_callback(self._datatypes_callback)
 
@@ -899,7 +900,23 @@ class Run(object):
 
     # TODO(jhr): codemod add: PEP 3102 -- Keyword-Only Arguments
     def _history_callback(self, row, step):
+        self._history_prepare_row(row)
+        if self._backend:
+            not_using_tensorboard = len(wandb.patched["tensorboard"]) == 0
+            self._backend.interface.publish_history(
+                row, step, publish_step=not_using_tensorboard
+            )
+
+    def _history_batch_callback(self, rows):
+        for row, _ in rows:
+            self._history_prepare_row(row)
+        if self._backend:
+            not_using_tensorboard = len(wandb.patched["tensorboard"]) == 0
+            self._backend.interface.publish_history_batch(
+                rows, publish_step=not_using_tensorboard
+            )
 
+    def _history_prepare_row(self, row):
         # TODO(jhr): move visualize hack somewhere else
         custom_charts = {}
         for k in row:
@@ -926,12 +943,6 @@ class Run(object):
             panel_config = custom_chart_panel_config(custom_chart, k, table_key)
             self._add_panel(k, "Vega2", panel_config)
 
-        if self._backend:
-            not_using_tensorboard = len(wandb.patched["tensorboard"]) == 0
-            self._backend.interface.publish_history(
-                row, step, publish_step=not_using_tensorboard
-            )
-
     def _console_callback(self, name, data):
         # logger.info("console callback: %s, %s", name, data)
         if self._backend:
@@ -1133,17 +1144,7 @@ class Run(object):
             ValueError: if invalid data is passed
 
         """
-        current_pid = os.getpid()
-        if current_pid != self._pid:
-            message = "log() ignored (called from pid={}, init called from pid={}). See: https://docs.wandb.ai/library/init#multiprocess".format(
-                current_pid, self._pid
-            )
-            if self._settings._strict:
-                wandb.termerror(message, repeat=False)
-                raise errors.LogMultiprocessError(
-                    "log() does not support multiprocessing"
-                )
-            wandb.termwarn(message, repeat=False)
+        if not self._log_pid_check("log"):
             return
 
         if not isinstance(data, Mapping):
@@ -1182,6 +1183,78 @@ class Run(object):
         else:
             self.history._row_update(data)
 
+    def log_many(
+        self, rows, steps = None
+    ):
+        """Log many dicts to the global run's history at once.
+
+        Each row is committed as its own history step, as if it was passed to
+        `wandb.log` on its own, but the whole batch is validated, encoded and
+        sent to the internal process together.  This is much faster than
+        calling `wandb.log` in a loop when replaying or importing metrics.
+
+        Arguments:
+            rows: (list) A list of dicts, see `wandb.log` for supported values.
+            steps: (list, optional) The global step of each row, steps must be
+                increasing and not less than the current step.  By default
+                rows are logged at consecutive steps.
+
+        Examples:
+            ```python
+            run.log_many([{'loss': 0.5}, {'loss': 0.4}, {'loss': 0.3}])
+            run.log_many(rows, steps=range(0, 1000 * len(rows), 1000))
+            ```
+
+        Raises:
+            ValueError: if invalid data or steps are passed
+        """
+        if not self._log_pid_check("log_many"):
+            return
+
+        rows = list(rows)
+        for data in rows:
+            if not isinstance(data, Mapping):
+                raise ValueError("log_many must be passed a list of dictionaries")
+            if any(not isinstance(key, string_types) for key in data.keys()):
+                raise ValueError("Key values passed to `log_many` must be strings.")
+        if not rows:
+            return
+
+        if steps is not None:
+            steps = list(steps)
+            if len(steps) != len(rows):
+                raise ValueError("log_many must be passed one step per row")
+            if len(wandb.patched["tensorboard"]) > 0:
+                wandb.termwarn(
+                    "Step cannot be set when using syncing with tensorboard. Please log your step values as a metric such as 'global_step'",
+                    repeat=False,
+                )
+            last_step = self.history._step - 1
+            for step in steps:
+                if step <= last_step:
+                    raise ValueError(
+                        "Step must only increase in log_many calls.  "
+                        "Step {} <= {}.".format(step, last_step)
+                    )
+                last_step = step
+
+        self.history._rows_add(rows, steps)
+
+    def _log_pid_check(self, fn_name):
+        current_pid = os.getpid()
+        if current_pid != self._pid:
+            message = "{}() ignored (called from pid={}, init called from pid={}). See: https://docs.wandb.ai/library/init#multiprocess".format(
+                fn_name, current_pid, self._pid
+            )
+            if self._settings._strict:
+                wandb.termerror(message, repeat=False)
+                raise errors.LogMultiprocessError(
+                    "{}() does not support multiprocessing".format(fn_name)
+                )
+            wandb.termwarn(message, repeat=False)
+            return False
+        return True
+
     def save(
         self,
         glob_str = None,
@@ -382,6 +382,17 @@ class Settings(object):
         summary_warnings = None,
         _internal_queue_timeout = 2,
         _internal_check_process = 8,
+        _transport = None,
+        _file_stream_gzip = None,
+        _file_stream_max_inflight = None,
+        _upload_max_jobs = None,
+        _upload_max_large_jobs = None,
+        _checksum_max_jobs = None,
+        _sync_durability = None,
+        _sync_durability_seconds = None,
+        _sync_durability_bytes = None,
+        _sync_compression = None,
+        _file_watcher = None,
         _disable_meta = None,
         _disable_stats = None,
         _jupyter_path = None,
@@ -583,6 +594,30 @@ class Settings(object):
             return None
         return _error_choices(value, set(available_methods))
 
+    def _validate__transport(self, value):
+        choices = {"queue", "shm"}
+        if value in choices:
+            return None
+        return _error_choices(value, choices)
+
+    def _validate__sync_durability(self, value):
+        choices = {"none", "interval", "bytes", "record"}
+        if value in choices:
+            return None
+        return _error_choices(value, choices)
+
+    def _validate__sync_compression(self, value):
+        choices = {"none", "zlib", "zstd"}
+        if value in choices:
+            return None
+        return _error_choices(value, choices)
+
+    def _validate__file_watcher(self, value):
+        choices = {"auto", "inotify", "polling"}
+        if value in choices:
+            return None
+        return _error_choices(value, choices)
+
     def _validate_mode(self, value):
         choices = {"dryrun", "run", "offline", "online", "disabled"}
         if value in choices:
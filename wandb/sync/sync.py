@@ -6,11 +6,14 @@ from __future__ import print_function
 
 import datetime
 import fnmatch
+import json
+import multiprocessing
 import os
 import sys
 import threading
 import time
 
+import six
 from six.moves import queue
 from six.moves.urllib.parse import quote as url_quote
 import wandb
@@ -23,12 +26,16 @@ from wandb.util import check_and_warn_old, mkdir_exists_ok
 PY3 = sys.version_info.major == 3 and sys.version_info.minor >= 6
 if PY3:
     from wandb.sdk.internal import datastore
+    from wandb.sdk.internal import file_pusher
+    from wandb.sdk.internal import file_stream
     from wandb.sdk.internal import handler
     from wandb.sdk.internal import sender
     from wandb.sdk.internal import tb_watcher
     from wandb.sdk.interface import interface
 else:
     from wandb.sdk_py27.internal import datastore
+    from wandb.sdk_py27.internal import file_pusher
+    from wandb.sdk_py27.internal import file_stream
     from wandb.sdk_py27.internal import handler
     from wandb.sdk_py27.internal import sender
     from wandb.sdk_py27.internal import tb_watcher
@@ -36,6 +43,21 @@ else:
 
 WANDB_SUFFIX = ".wandb"
 SYNCED_SUFFIX = ".synced"
+CHECKPOINT_SUFFIX = ".checkpoint"
+CHECKPOINT_VERSION = 1
+# records before a checkpoint which are sent again, the state of the run they
+# set up is not in the checkpoint, exit is needed to send final
+CHECKPOINT_REPLAY_RECORDS = (
+    "header",
+    "run",
+    "config",
+    "files",
+    "telemetry",
+    "metric",
+    "exit",
+    "final",
+    "footer",
+)
 TFEVENT_SUBSTRING = ".tfevents."
 TMPDIR = tempfile.TemporaryDirectory()
 
@@ -65,6 +87,7 @@ class SyncThread(threading.Thread):
         mark_synced=None,
         app_url=None,
         sync_tensorboard=None,
+        settings=None,
     ):
         threading.Thread.__init__(self)
         # mark this process as internal
@@ -78,6 +101,7 @@ class SyncThread(threading.Thread):
         self._mark_synced = mark_synced
         self._app_url = app_url
         self._sync_tensorboard = sync_tensorboard
+        self._settings = settings
 
     def _parse_pb(self, data, exit_pb=None):
         pb = wandb_internal_pb2.Record()
@@ -217,6 +241,68 @@ class SyncThread(threading.Thread):
         handle_manager.finish()
         send_manager.finish()
 
+    def _checkpoint_key(self):
+        # a checkpoint only applies to syncs to the same run
+        return dict(project=self._project, entity=self._entity, run_id=self._run_id)
+
+    def _load_checkpoint(self, sync_item):
+        """Return the checkpoint of an earlier sync of sync_item, if usable."""
+        checkpoint_file = "{}{}".format(sync_item, CHECKPOINT_SUFFIX)
+        try:
+            with open(checkpoint_file) as f:
+                checkpoint = json.load(f)
+        except (IOError, OSError, ValueError):  # noqa: B014
+            return None
+        if (
+            not isinstance(checkpoint, dict)
+            or checkpoint.get("version") != CHECKPOINT_VERSION
+            or checkpoint.get("key") != self._checkpoint_key()
+            or checkpoint.get("offset", 0) > os.path.getsize(sync_item)
+        ):
+            wandb.termwarn("Ignoring sync checkpoint: {}".format(checkpoint_file))
+            return None
+        return checkpoint
+
+    def _restore_checkpoint(self, sync_item, sm):
+        """Restore the send state of an earlier sync of sync_item.
+
+        Returns the offset of the records it sent, None without a checkpoint.
+        """
+        if not PY3 or self._view:
+            return None
+        checkpoint = self._load_checkpoint(sync_item)
+        if not checkpoint:
+            return None
+        sm.restore_sync_state(checkpoint["state"])
+        return checkpoint["offset"]
+
+    def _save_checkpoint(self, sync_item, offset, sm):
+        if not PY3 or self._view:
+            return
+        checkpoint_file = "{}{}".format(sync_item, CHECKPOINT_SUFFIX)
+        checkpoint = dict(
+            version=CHECKPOINT_VERSION,
+            key=self._checkpoint_key(),
+            offset=offset,
+            state=sm.sync_state(),
+        )
+        tmp_file = checkpoint_file + ".tmp"
+        with open(tmp_file, "w") as f:
+            json.dump(checkpoint, f)
+        os.replace(tmp_file, checkpoint_file)
+
+    def _open_for_scan(self, sync_item):
+        try:
+            if PY3:
+                # records are parsed straight out of a memory map
+                return datastore.DataScanner(sync_item)
+            ds = datastore.DataStore()
+            ds.open_for_scan(sync_item)
+            return ds
+        except AssertionError as e:
+            print(".wandb file is empty ({}), skipping: {}".format(e, sync_item))
+            return None
+
     def _robust_scan(self, ds):
         """Attempt to scan data, handling incomplete files"""
         try:
@@ -250,18 +336,20 @@ class SyncThread(threading.Thread):
             )
             # If we're syncing tensorboard, let's use a tmp dir for images etc.
             root_dir = TMPDIR.name if sync_tb else os.path.dirname(sync_item)
-            sm = sender.SendManager.setup(root_dir)
+            sm = sender.SendManager.setup(root_dir, settings=self._settings)
             if sync_tb:
                 self._send_tensorboard(tb_root, tb_logdirs, sm)
                 continue
 
-            ds = datastore.DataStore()
-            try:
-                ds.open_for_scan(sync_item)
-            except AssertionError as e:
-                print(".wandb file is empty ({}), skipping: {}".format(e, sync_item))
+            ds = self._open_for_scan(sync_item)
+            if ds is None:
                 continue
 
+            # continue after the records sent by an earlier sync
+            skip_offset = self._restore_checkpoint(sync_item, sm)
+            # end of the last complete record scanned
+            offset = skip_offset or 0
+
             # save exit for final send
             exit_pb = None
             finished = False
@@ -270,6 +358,14 @@ class SyncThread(threading.Thread):
                 data = self._robust_scan(ds)
                 if data is None:
                     break
+                if PY3:
+                    offset = ds.tell()
+                if (
+                    skip_offset is not None
+                    and offset <= skip_offset
+                    and ds.record_type(data) not in CHECKPOINT_REPLAY_RECORDS
+                ):
+                    continue
                 pb, exit_pb, cont = self._parse_pb(data, exit_pb)
                 if exit_pb is not None:
                     finished = True
@@ -296,7 +392,9 @@ class SyncThread(threading.Thread):
                         print("Syncing: %s ..." % url, end="")
                         sys.stdout.flush()
                         shown = True
+            ds.close()
             sm.finish()
+            self._save_checkpoint(sync_item, offset, sm)
             # Only mark synced if the run actually finished
             if self._mark_synced and not self._view and finished:
                 synced_file = "{}{}".format(sync_item, SYNCED_SUFFIX)
@@ -305,6 +403,20 @@ class SyncThread(threading.Thread):
             print("done.")
 
 
+def _sync_process(sync_item, kwargs, result_q):
+    """Sync one run in a worker process, reporting its output and any error."""
+    output = six.StringIO()
+    sys.stdout = output
+    error = None
+    try:
+        SyncThread(sync_list=[sync_item], **kwargs).run()
+    except Exception as e:
+        error = "{}: {}".format(type(e).__name__, e)
+    finally:
+        sys.stdout = sys.__stdout__
+    result_q.put((sync_item, output.getvalue(), error))
+
+
 class SyncManager:
     def __init__(
         self,
@@ -316,6 +428,7 @@ class SyncManager:
         view=None,
         verbose=None,
         sync_tensorboard=None,
+        jobs=None,
     ):
         self._sync_list = []
         self._thread = None
@@ -327,6 +440,14 @@ class SyncManager:
         self._view = view
         self._verbose = verbose
         self._sync_tensorboard = sync_tensorboard
+        self._jobs = jobs or 1
+        # worker processes when syncing runs in parallel
+        self._pending = []
+        self._running = {}
+        self._results = {}
+        self._result_q = None
+        self._mp = None
+        self.failed = []
 
     def status(self):
         pass
@@ -334,10 +455,8 @@ class SyncManager:
     def add(self, p):
         self._sync_list.append(os.path.abspath(str(p)))
 
-    def start(self):
-        # create a thread for each file?
-        self._thread = SyncThread(
-            sync_list=self._sync_list,
+    def _sync_kwargs(self):
+        return dict(
             project=self._project,
             entity=self._entity,
             run_id=self._run_id,
@@ -347,12 +466,104 @@ class SyncManager:
             app_url=self._app_url,
             sync_tensorboard=self._sync_tensorboard,
         )
+
+    def start(self):
+        if self._jobs > 1 and len(self._sync_list) > 1:
+            self._start_processes()
+            return
+        # create a thread for each file?
+        self._thread = SyncThread(sync_list=self._sync_list, **self._sync_kwargs())
         self._thread.start()
 
+    def _start_processes(self):
+        self._mp = multiprocessing
+        if hasattr(multiprocessing, "get_context"):
+            self._mp = multiprocessing.get_context("spawn")
+        self._result_q = self._mp.Queue()
+        self._pending = list(self._sync_list)
+        self._launch()
+
+    def _launch(self):
+        kwargs = self._sync_kwargs()
+        # share the network concurrency of a single sync between the workers.
+        # Each worker keeps at least one of each, so the total of each is up
+        # to max(jobs, limit) rather than the limit.
+        kwargs["settings"] = dict(
+            _file_stream_max_inflight=max(
+                1, file_stream.FileStreamApi.MAX_INFLIGHT // self._jobs
+            ),
+            _upload_max_jobs=max(
+                1, file_pusher.FilePusher.MAX_UPLOAD_JOBS // self._jobs
+            ),
+            _checksum_max_jobs=max(
+                1, file_pusher.FilePusher.MAX_CHECKSUM_JOBS // self._jobs
+            ),
+        )
+        while self._pending and len(self._running) < self._jobs:
+            sync_item = self._pending.pop(0)
+            process = self._mp.Process(
+                target=_sync_process, args=(sync_item, kwargs, self._result_q)
+            )
+            process.daemon = True
+            process.start()
+            self._running[sync_item] = process
+
+    def _reap(self):
+        """Collect results of finished workers and start the next runs."""
+        try:
+            while True:
+                sync_item, output, error = self._result_q.get(timeout=1)
+                self._results[sync_item] = (output, error)
+        except queue.Empty:
+            pass
+        for sync_item, process in list(self._running.items()):
+            if process.is_alive():
+                continue
+            if sync_item not in self._results:
+                # results are sent before exiting, wait for them once
+                try:
+                    item, output, error = self._result_q.get(timeout=1)
+                    self._results[item] = (output, error)
+                except queue.Empty:
+                    pass
+            if sync_item not in self._results:
+                self._results[sync_item] = (
+                    "",
+                    "sync process exited with code {}".format(process.exitcode),
+                )
+            del self._running[sync_item]
+            process.join()
+            self._report(sync_item)
+        self._launch()
+
+    def _report(self, sync_item):
+        output, error = self._results[sync_item]
+        done = len(self._results)
+        total = len(self._sync_list)
+        if output.strip():
+            print("[{}/{}] {}".format(done, total, output.strip()))
+        if error:
+            self.failed.append(sync_item)
+            wandb.termerror(
+                "[{}/{}] Failed to sync {}: {}".format(done, total, sync_item, error)
+            )
+        if not self._pending and not self._running:
+            print(
+                "Synced {} runs, {} failed.".format(
+                    total - len(self.failed), len(self.failed)
+                )
+            )
+        sys.stdout.flush()
+
     def is_done(self):
+        if self._result_q is not None:
+            return not self._pending and not self._running
         return not self._thread.is_alive()
 
     def poll(self):
+        if self._result_q is not None:
+            self._reap()
+            return False
         time.sleep(1)
         return False
 
@@ -168,8 +168,10 @@ def apple_gpu_stats_binary():
 
 def vendor_import(name):
     reset_path = vendor_setup()
-    module = import_module(name)
-    reset_path()
+    try:
+        module = import_module(name)
+    finally:
+        reset_path()
     return module
 
 
@@ -667,6 +669,42 @@ def json_dumps_safer_history(obj, **kwargs):
     return json.dumps(obj, cls=WandBHistoryJSONEncoder, **kwargs)
 
 
+# types json encodes natively, np.float64 is a float subclass
+_JSON_NATIVE_TYPES = {int, float, bool, type(None)} | set(six.string_types)
+# numpy scalars which json_friendly() would convert to python scalars
+_NUMPY_SCALAR_TYPES = set()
+if np:
+    _JSON_NATIVE_TYPES.add(np.float64)
+    _NUMPY_SCALAR_TYPES.update(
+        [np.bool_, np.float16, np.float32]
+        + [getattr(np, t) for t in ("int8", "int16", "int32", "int64")]
+        + [getattr(np, t) for t in ("uint8", "uint16", "uint32", "uint64")]
+    )
+
+
+def json_friendly_scalars(obj):
+    """Return a dict of only scalar values ready for json.dumps, or None.
+
+    This is a fast path for the common history row of numbers, it checks the
+    exact type of each value instead of going through json_friendly().  None is
+    returned as soon as a value needs the generic conversion.
+    """
+    converted = None
+    for k, v in six.iteritems(obj):
+        t = type(v)
+        if t in _JSON_NATIVE_TYPES:
+            continue
+        if t not in _NUMPY_SCALAR_TYPES:
+            return None
+        if converted is None:
+            converted = dict(obj)
+        v = v.item()
+        if isinstance(v, float) and math.isnan(v):
+            v = None
+        converted[k] = v
+    return obj if converted is None else converted
+
+
 def make_json_if_not_number(v):
     """If v is not a basic type convert it to json."""
     if isinstance(v, (float, int)):
@@ -774,7 +812,7 @@ def has_num(dictionary, key):
 def md5_file(path):
     hash_md5 = hashlib.md5()
     with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
             hash_md5.update(chunk)
     return base64.b64encode(hash_md5.digest()).decode("ascii")
 